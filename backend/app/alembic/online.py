@@ -0,0 +1,195 @@
+"""쓰기를 막지 않고 스키마를 바꾸기 위한 마이그레이션 헬퍼.
+
+from app.alembic.online import backfill, create_index_concurrently
+
+def upgrade() -> None:
+    op.add_column("meet_post", sa.Column("search_vector", TSVECTOR()))
+    backfill(
+        "meet_post",
+        set_sql="search_vector = to_tsvector('simple', title || ' ' || content)",
+        where_sql="search_vector IS NULL",
+    )
+    create_index_concurrently(
+        "ix_meet_post_search_vector",
+        "meet_post",
+        ["search_vector"],
+        postgresql_using="gin",
+    )
+"""
+
+import logging
+import time
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from alembic import op
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+from sqlalchemy.exc import OperationalError
+
+logger = logging.getLogger("alembic.online")
+
+
+def _index_state(index_name: str) -> bool | None:
+    """인덱스가 없으면 None, 있으면 유효한지 여부."""
+    return op.get_bind().scalar(
+        text(
+            "SELECT i.indisvalid FROM pg_index i "
+            "JOIN pg_class c ON c.oid = i.indexrelid "
+            "WHERE c.relname = :name AND pg_catalog.pg_table_is_visible(c.oid)"
+        ),
+        {"name": index_name},
+    )
+
+
+def create_index_concurrently(
+    index_name: str,
+    table_name: str,
+    columns: Sequence[Any],
+    *,
+    unique: bool = False,
+    **kw: Any,
+) -> None:
+    """트랜잭션 밖에서 CREATE INDEX CONCURRENTLY 를 실행한다.
+
+    테이블 쓰기를 막지 않는다. 중간에 실패해 INVALID 로 남은 인덱스는 지우고
+    다시 만들기 때문에 마이그레이션을 재실행해도 된다.
+    """
+    with op.get_context().autocommit_block():
+        if not op.get_context().as_sql:
+            state = _index_state(index_name)
+            if state is True:
+                logger.info(f"Index {index_name} already exists, skipping")
+                return
+            if state is False:
+                logger.info(f"Dropping invalid index {index_name}")
+                op.drop_index(
+                    index_name, table_name=table_name, postgresql_concurrently=True
+                )
+        op.create_index(
+            index_name,
+            table_name,
+            columns,
+            unique=unique,
+            postgresql_concurrently=True,
+            **kw,
+        )
+
+
+def drop_index_concurrently(index_name: str, table_name: str) -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            index_name,
+            table_name=table_name,
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+@dataclass
+class BackfillProgress:
+    total: int
+    done: int = 0
+    batches: int = 0
+    retries: int = 0
+    started_at: float = 0.0
+
+    @property
+    def rate(self) -> float:
+        elapsed = time.monotonic() - self.started_at
+        return self.done / elapsed if elapsed > 0 else 0.0
+
+    def __str__(self) -> str:
+        percent = self.done / self.total * 100 if self.total else 100.0
+        eta = (self.total - self.done) / self.rate if self.rate else 0.0
+        return (
+            f"{self.done}/{self.total} rows ({percent:.1f}%), "
+            f"{self.rate:.0f} rows/s, eta {eta:.0f}s"
+        )
+
+
+def run_backfill(
+    connection: Connection,
+    table_name: str,
+    *,
+    set_sql: str,
+    where_sql: str,
+    key: str = "id",
+    batch_size: int = 1000,
+    sleep_seconds: float = 0.1,
+    lock_timeout_ms: int = 1000,
+    statement_timeout_ms: int = 5000,
+    max_retries: int = 5,
+) -> BackfillProgress:
+    """where_sql 에 걸리는 행을 key 순서로 batch_size 씩 나눠 채운다.
+
+    connection 은 autocommit 이어야 한다. 배치 하나가 UPDATE 문 하나라서
+    행 잠금은 그 문장 동안만 잡히고, lock_timeout/statement_timeout 으로
+    배치마다 잠금 시간을 제한한다. 이미 채운 행은 where_sql 에 걸리지 않으므로
+    중단된 뒤 다시 실행하면 남은 행부터 이어서 채운다.
+    """
+    total = connection.scalar(
+        text(f"SELECT count(*) FROM {table_name} WHERE {where_sql}")
+    )
+    progress = BackfillProgress(total=total or 0, started_at=time.monotonic())
+    logger.info(f"Backfilling {table_name}: {progress.total} rows")
+
+    select_batch = (
+        f"SELECT {key} FROM {table_name} WHERE ({where_sql}) "
+        f"{{after}} ORDER BY {key} LIMIT :batch_size"
+    )
+    update_batch = (
+        f"WITH batch AS ({select_batch}) "
+        f"UPDATE {table_name} AS t SET {set_sql} FROM batch "
+        f"WHERE t.{key} = batch.{key} RETURNING t.{key}"
+    )
+    first_batch = text(update_batch.format(after=""))
+    next_batch = text(update_batch.format(after=f"AND {key} > :last_key"))
+
+    connection.execute(text(f"SET lock_timeout = {int(lock_timeout_ms)}"))
+    connection.execute(text(f"SET statement_timeout = {int(statement_timeout_ms)}"))
+    try:
+        last_key = None
+        attempts = 0
+        while True:
+            try:
+                if last_key is None:
+                    result = connection.execute(first_batch, {"batch_size": batch_size})
+                else:
+                    result = connection.execute(
+                        next_batch, {"batch_size": batch_size, "last_key": last_key}
+                    )
+                keys = result.scalars().all()
+            except OperationalError as e:
+                # lock_timeout / statement_timeout 에 걸리면 잠시 쉬고 같은 배치를 다시 시도
+                attempts += 1
+                progress.retries += 1
+                if attempts > max_retries:
+                    raise
+                logger.warning(f"Batch failed, retrying ({attempts}): {e.orig}")
+                time.sleep(sleep_seconds * 2**attempts)
+                continue
+
+            attempts = 0
+            if not keys:
+                break
+            last_key = max(keys)
+            progress.done += len(keys)
+            progress.batches += 1
+            logger.info(f"Backfilling {table_name}: {progress}")
+            time.sleep(sleep_seconds)
+    finally:
+        connection.execute(text("RESET lock_timeout"))
+        connection.execute(text("RESET statement_timeout"))
+
+    logger.info(f"Backfilled {table_name}: {progress}")
+    return progress
+
+
+def backfill(table_name: str, **kw: Any) -> BackfillProgress:
+    """마이그레이션 안에서 트랜잭션 밖으로 나와 run_backfill 을 실행한다."""
+    if op.get_context().as_sql:
+        raise RuntimeError("backfill needs a live database connection")
+    with op.get_context().autocommit_block():
+        return run_backfill(op.get_bind(), table_name, **kw)
@@ -0,0 +1,31 @@
+"""Add location history default partition
+
+Revision ID: 04885e096aed
+Revises: ea19ef56171b
+Create Date: 2026-10-19 19:02:41.118203
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "04885e096aed"
+down_revision: Union[str, None] = "ea19ef56171b"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 파티션 작업이 그날 파티션을 미리 만들지 못해도 위치 기록이 실패하지 않게 받아 둔다.
+    # 쌓인 행은 app.jobs.location_partitions 가 다음 실행에서 제 파티션으로 옮긴다
+    op.execute(
+        "CREATE TABLE IF NOT EXISTS user_location_history_default "
+        "PARTITION OF user_location_history DEFAULT"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TABLE user_location_history_default")
@@ -0,0 +1,109 @@
+"""Add created_at to meet post events
+
+Revision ID: 421c176f9a99
+Revises: 56cffd9c7bf4
+Create Date: 2026-10-19 18:07:19.856336
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "421c176f9a99"
+down_revision: Union[str, None] = "56cffd9c7bf4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+MEET_POST_NOTIFY_FUNCTION = """
+CREATE OR REPLACE FUNCTION notify_meet_post_event() RETURNS trigger AS $$
+DECLARE
+    post meet_post;
+    event text;
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        post := OLD;
+        event := 'deleted';
+    ELSE
+        post := NEW;
+        IF TG_OP = 'INSERT' THEN
+            event := 'created';
+        ELSIF NEW.current_people > OLD.current_people THEN
+            event := 'joined';
+        ELSIF NEW.current_people < OLD.current_people THEN
+            event := 'left';
+        ELSE
+            event := 'updated';
+        END IF;
+    END IF;
+
+    PERFORM pg_notify(
+        'meet_post_events',
+        json_build_object(
+            'event', event,
+            'id', post.id,
+            'type', post.type,
+            'title', post.title,
+            'max_people', post.max_people,
+            'current_people', post.current_people,
+            'lat', post.lat,
+            'lng', post.lng,
+            'created_at', post.created_at
+        )::text
+    );
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+PREVIOUS_NOTIFY_FUNCTION = """
+CREATE OR REPLACE FUNCTION notify_meet_post_event() RETURNS trigger AS $$
+DECLARE
+    post meet_post;
+    event text;
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        post := OLD;
+        event := 'deleted';
+    ELSE
+        post := NEW;
+        IF TG_OP = 'INSERT' THEN
+            event := 'created';
+        ELSIF NEW.current_people > OLD.current_people THEN
+            event := 'joined';
+        ELSIF NEW.current_people < OLD.current_people THEN
+            event := 'left';
+        ELSE
+            event := 'updated';
+        END IF;
+    END IF;
+
+    PERFORM pg_notify(
+        'meet_post_events',
+        json_build_object(
+            'event', event,
+            'id', post.id,
+            'type', post.type,
+            'title', post.title,
+            'max_people', post.max_people,
+            'current_people', post.current_people,
+            'lat', post.lat,
+            'lng', post.lng
+        )::text
+    );
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+
+def upgrade() -> None:
+    # 피드 인덱스가 알림만으로 순위를 계산할 수 있게 작성 시각을 싣는다
+    op.execute(MEET_POST_NOTIFY_FUNCTION)
+
+
+def downgrade() -> None:
+    op.execute(PREVIOUS_NOTIFY_FUNCTION)
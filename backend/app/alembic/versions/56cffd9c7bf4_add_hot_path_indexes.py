@@ -0,0 +1,33 @@
+"""Add hot path indexes
+
+Revision ID: 56cffd9c7bf4
+Revises: 920a5a5f0fd8
+Create Date: 2026-10-19 17:54:03.647049
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from app.alembic.online import create_index_concurrently, drop_index_concurrently
+
+
+# revision identifiers, used by Alembic.
+revision: str = "56cffd9c7bf4"
+down_revision: Union[str, None] = "920a5a5f0fd8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 피드 페이지(created_at, id 키셋)와 로그인 시 lower(email) 조회
+    create_index_concurrently(
+        "ix_meet_post_created_at_id", "meet_post", ["created_at", "id"]
+    )
+    create_index_concurrently("ix_user_email_lower", "user", [sa.text("lower(email)")])
+
+
+def downgrade() -> None:
+    drop_index_concurrently("ix_user_email_lower", "user")
+    drop_index_concurrently("ix_meet_post_created_at_id", "meet_post")
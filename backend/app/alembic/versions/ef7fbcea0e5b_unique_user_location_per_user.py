@@ -0,0 +1,63 @@
+"""Unique user location per user
+
+Revision ID: ef7fbcea0e5b
+Revises: 04885e096aed
+Create Date: 2026-10-19 18:56:08.257472
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+from sqlalchemy import text
+
+from app.alembic.online import create_index_concurrently, drop_index_concurrently
+
+
+# revision identifiers, used by Alembic.
+revision: str = "ef7fbcea0e5b"
+down_revision: Union[str, None] = "04885e096aed"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEX = "ix_user_location_user_id"
+
+
+def is_unique_index(index_name: str) -> bool:
+    return bool(
+        op.get_bind().scalar(
+            text(
+                "SELECT i.indisunique AND i.indisvalid FROM pg_index i "
+                "JOIN pg_class c ON c.oid = i.indexrelid "
+                "WHERE c.relname = :name AND pg_catalog.pg_table_is_visible(c.oid)"
+            ),
+            {"name": index_name},
+        )
+    )
+
+
+def upgrade() -> None:
+    # 인덱스 교체는 트랜잭션 밖에서 돌기 때문에 920a5a5f0fd8 에서 떼어 따로 둔다.
+    # 유일 인덱스를 만들다 실패하면 이 리비전만 다시 실행하면 되고, 중복 정리와
+    # 인덱스 교체(남은 INVALID 인덱스 삭제 포함)는 몇 번을 돌려도 같다.
+    if not op.get_context().as_sql and is_unique_index(INDEX):
+        # 920a5a5f0fd8 의 이전 버전으로 이미 바꾼 DB
+        return
+
+    # user_location 은 사용자별 최신 위치 한 행만 남긴다. 920a5a5f0fd8 이전 행은
+    # updated_at 이 모두 같으므로 그중 어느 행이 남을지는 정해져 있지 않다 (id 가 큰 쪽)
+    op.execute(
+        "DELETE FROM user_location WHERE id IN ("
+        "SELECT id FROM ("
+        "SELECT id, row_number() OVER ("
+        "PARTITION BY user_id ORDER BY updated_at DESC, id DESC"
+        ") AS newest FROM user_location"
+        ") ranked WHERE newest > 1)"
+    )
+    drop_index_concurrently(INDEX, "user_location")
+    create_index_concurrently(INDEX, "user_location", ["user_id"], unique=True)
+
+
+def downgrade() -> None:
+    drop_index_concurrently(INDEX, "user_location")
+    create_index_concurrently(INDEX, "user_location", ["user_id"])
@@ -1,9 +1,15 @@
 from fastapi import APIRouter
 
 
-from app.api.routes import auth
+from app.api.routes import auth, export, location, meet_post, profile_image
 
 api_router = APIRouter()
 
 
 api_router.include_router(auth.router, prefix="/auth", tags=["auth"])
+api_router.include_router(meet_post.router, prefix="/meet-posts", tags=["meet-post"])
+api_router.include_router(location.router, prefix="/locations", tags=["location"])
+api_router.include_router(
+    profile_image.router, prefix="/profile-images", tags=["profile-image"]
+)
+api_router.include_router(export.router, prefix="/exports", tags=["export"])
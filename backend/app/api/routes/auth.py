@@ -1,5 +1,6 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 
+from app.core.rate_limit import RateLimit, rate_limiters
 from app.core.security import auth_backend
 from app.service.email import EmailVerificationService, get_email_verification_service
 from app.schemas.user import UserRead, UserCreate, UserUpdate
@@ -9,8 +10,17 @@ from app.models.user import User  # User 모델 import 추가
 
 router = APIRouter()
 
+# 로그인은 비밀번호 해시가, 가입과 인증 메일 요청은 SMTP 발송이 비싸다
+login_rate_limit = RateLimit(rate_limiters["login-ip"], rate_limiters["login-email"])
+register_rate_limit = RateLimit(
+    rate_limiters["register-ip"], rate_limiters["register-email"]
+)
+verify_rate_limit = RateLimit(
+    rate_limiters["verify-email-ip"], rate_limiters["verify-email-email"]
+)
+
 
-@router.get("/verify-email", tags=["auth"])
+@router.get("/verify-email", tags=["auth"], dependencies=[Depends(verify_rate_limit)])
 async def verify_email(
     token: str,
     user_manager: UserManager = Depends(get_user_manager),
@@ -32,13 +42,22 @@ async def verify_email(
 
 
 router.include_router(
-    fastapi_users.get_auth_router(auth_backend), prefix="/jwt", tags=["auth"]
+    fastapi_users.get_auth_router(auth_backend),
+    prefix="/jwt",
+    tags=["auth"],
+    dependencies=[Depends(login_rate_limit)],
 )
 router.include_router(
-    fastapi_users.get_register_router(UserRead, UserCreate), tags=["auth"]
+    fastapi_users.get_register_router(UserRead, UserCreate),
+    tags=["auth"],
+    dependencies=[Depends(register_rate_limit)],
 )
 router.include_router(fastapi_users.get_reset_password_router(), tags=["auth"])
-router.include_router(fastapi_users.get_verify_router(UserRead), tags=["auth"])
+router.include_router(
+    fastapi_users.get_verify_router(UserRead),
+    tags=["auth"],
+    dependencies=[Depends(verify_rate_limit)],
+)
 router.include_router(
     fastapi_users.get_users_router(UserRead, UserUpdate), tags=["auth"]
 )
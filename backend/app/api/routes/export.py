@@ -0,0 +1,29 @@
+from typing import Literal
+
+from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
+
+from app.core.security import current_superuser
+from app.models.user import User
+from app.service.export import MEDIA_TYPES, get_filename, iter_export
+
+router = APIRouter()
+
+
+@router.get("/{name}")
+async def export_table(
+    name: Literal["users", "meet-posts", "meet-posts-archive"],
+    format: Literal["ndjson", "csv"] = "ndjson",
+    gzip: bool = False,
+    user: User = Depends(current_superuser),
+):
+    """테이블 전체를 내려받는다. 응답을 보내면서 DB 에서 읽는다."""
+    return StreamingResponse(
+        iter_export(name, format, compress=gzip),
+        media_type="application/gzip" if gzip else MEDIA_TYPES[format],
+        headers={
+            "Content-Disposition": (
+                f'attachment; filename="{get_filename(name, format, gzip)}"'
+            )
+        },
+    )
@@ -0,0 +1,64 @@
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.deps import get_async_session
+from app.core.config import settings
+from app.core.feed import feed_index
+from app.core.security import current_active_user
+from app.crud.location import (
+    get_latest_location,
+    get_location_history,
+    record_location,
+)
+from app.models.user import User
+from app.schemas.location import LocationHistoryRead, LocationRead, LocationUpdate
+
+router = APIRouter()
+
+
+@router.put("/me", status_code=status.HTTP_204_NO_CONTENT)
+async def update_my_location(
+    location: LocationUpdate,
+    user: User = Depends(current_active_user),
+    session: AsyncSession = Depends(get_async_session),
+):
+    await record_location(session, user.id, location.lat, location.lng)
+    feed_index.update_user_location(user.id, location.lat, location.lng)
+
+
+@router.get("/me", response_model=LocationRead)
+async def read_my_location(
+    user: User = Depends(current_active_user),
+    session: AsyncSession = Depends(get_async_session),
+):
+    location = await get_latest_location(session, user.id)
+    if location is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Location not found."
+        )
+    return location
+
+
+@router.get("/me/history", response_model=list[LocationHistoryRead])
+async def read_my_location_history(
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    limit: int = Query(100, ge=1, le=1000),
+    user: User = Depends(current_active_user),
+    session: AsyncSession = Depends(get_async_session),
+):
+    # 기간을 주지 않으면 최근 하루만 읽어 파티션 하나 정도만 훑게 한다
+    until = until or datetime.now(timezone.utc)
+    since = since or until - timedelta(days=1)
+    if since >= until:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid period."
+        )
+    if until - since > timedelta(days=settings.LOCATION_HISTORY_RETENTION_DAYS):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Period is too long."
+        )
+    return await get_location_history(session, user.id, since, until, limit)
@@ -0,0 +1,255 @@
+import asyncio
+import uuid
+from datetime import date, datetime, timedelta, timezone
+from typing import Optional, cast
+
+from fastapi import (
+    APIRouter,
+    Depends,
+    HTTPException,
+    Query,
+    WebSocket,
+    WebSocketDisconnect,
+    status,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.deps import get_async_session
+from app.core.feed import feed_index, parse_cursor
+from app.core.pubsub import Subscription, broker
+from app.core.security import current_active_user, read_token_user_id
+from app.crud.location import get_latest_location
+from app.crud.meet_post import (
+    AlreadyJoinedError,
+    MeetPostFullError,
+    MeetPostNotFoundError,
+    NotJoinedError,
+    get_archived_meet_post,
+    get_archived_meet_post_page,
+    get_meet_post_page,
+    get_meet_post_stats,
+    get_meet_posts_by_ids,
+    join_meet_post,
+    leave_meet_post,
+)
+from app.models.user import User
+from app.schemas.meet_post import (
+    FeedItemRead,
+    FeedPage,
+    MeetPostArchiveRead,
+    MeetPostRead,
+    MeetPostStatsRead,
+    ParticipationRead,
+)
+from app.utils.geo import get_nearby_areas
+
+router = APIRouter()
+
+# 통계 한 번에 읽을 수 있는 최대 기간
+MAX_STATS_DAYS = 366
+
+
+@router.get("", response_model=list[MeetPostRead])
+async def read_meet_posts(
+    type: Optional[str] = None,
+    before: Optional[datetime] = None,
+    before_id: Optional[uuid.UUID] = None,
+    limit: int = Query(20, ge=1, le=100),
+    user: User = Depends(current_active_user),
+    session: AsyncSession = Depends(get_async_session),
+):
+    cursor = None
+    if before is not None and before_id is not None:
+        cursor = (before, before_id)
+    return await get_meet_post_page(session, type_=type, before=cursor, limit=limit)
+
+
+@router.get("/feed", response_model=FeedPage)
+async def read_feed(
+    lat: Optional[float] = Query(None, ge=-90, le=90),
+    lng: Optional[float] = Query(None, ge=-180, le=180),
+    type: Optional[str] = None,
+    cursor: Optional[str] = None,
+    limit: int = Query(20, ge=1, le=100),
+    user: User = Depends(current_active_user),
+    session: AsyncSession = Depends(get_async_session),
+):
+    """가까우면서 최근인 글 순. 순위는 메모리 인덱스에서 고르고 글 내용만 DB 에서 읽는다.
+
+    위치를 주지 않으면 마지막으로 보고한 위치를 쓴다.
+    """
+    after = None
+    if cursor is not None:
+        try:
+            after = parse_cursor(cursor)
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor."
+            )
+
+    if lat is None or lng is None:
+        location = feed_index.get_user_location(user.id)
+        if location is None:
+            latest = await get_latest_location(session, user.id)
+            if latest is None:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="Location not found.",
+                )
+            location = cast(tuple[float, float], (latest.lat, latest.lng))
+            feed_index.update_user_location(user.id, *location)
+        lat, lng = location
+
+    ranked = feed_index.page(lat, lng, type_=type, limit=limit, after=after)
+    posts = await get_meet_posts_by_ids(session, [item.id for item in ranked])
+    distances = {item.id: item.distance_km for item in ranked}
+    return FeedPage(
+        items=[
+            FeedItemRead(
+                **MeetPostRead.model_validate(post).model_dump(),
+                distance_km=distances[cast(uuid.UUID, post.id)],
+            )
+            for post in posts
+        ],
+        next_cursor=ranked[-1].cursor if len(ranked) == limit else None,
+    )
+
+
+@router.get("/stats", response_model=list[MeetPostStatsRead])
+async def read_meet_post_stats(
+    since: Optional[date] = None,
+    until: Optional[date] = None,
+    type: Optional[str] = None,
+    user: User = Depends(current_active_user),
+    session: AsyncSession = Depends(get_async_session),
+):
+    """날짜(UTC), 종류, 참여율 버킷별 글 수. 기간을 주지 않으면 최근 7일."""
+    until = until or datetime.now(timezone.utc).date()
+    since = since or until - timedelta(days=6)
+    if since > until:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid period."
+        )
+    if until - since > timedelta(days=MAX_STATS_DAYS):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Period is too long."
+        )
+    return await get_meet_post_stats(session, since, until, type)
+
+
+@router.get("/archive", response_model=list[MeetPostArchiveRead])
+async def read_my_archived_meet_posts(
+    before: Optional[datetime] = None,
+    before_id: Optional[uuid.UUID] = None,
+    limit: int = Query(20, ge=1, le=100),
+    user: User = Depends(current_active_user),
+    session: AsyncSession = Depends(get_async_session),
+):
+    """지난 글은 meet_post_archive 에서 따로 읽는다. 피드와 다른 제한 그룹에 든다."""
+    cursor = None
+    if before is not None and before_id is not None:
+        cursor = (before, before_id)
+    return await get_archived_meet_post_page(
+        session, user.id, before=cursor, limit=limit
+    )
+
+
+@router.get("/archive/{meet_post_id}", response_model=MeetPostArchiveRead)
+async def read_archived_meet_post(
+    meet_post_id: uuid.UUID,
+    user: User = Depends(current_active_user),
+    session: AsyncSession = Depends(get_async_session),
+):
+    meet_post = await get_archived_meet_post(session, meet_post_id)
+    if meet_post is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Meet post not found."
+        )
+    return meet_post
+
+
+@router.post("/{meet_post_id}/join", response_model=ParticipationRead)
+async def join(
+    meet_post_id: uuid.UUID,
+    user: User = Depends(current_active_user),
+    session: AsyncSession = Depends(get_async_session),
+):
+    try:
+        meet_post = await join_meet_post(session, meet_post_id, user.id)
+    except MeetPostNotFoundError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Meet post not found."
+        )
+    except AlreadyJoinedError:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT, detail="Already joined."
+        )
+    except MeetPostFullError:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT, detail="Meet post is full."
+        )
+    return meet_post
+
+
+@router.delete("/{meet_post_id}/join", response_model=ParticipationRead)
+async def leave(
+    meet_post_id: uuid.UUID,
+    user: User = Depends(current_active_user),
+    session: AsyncSession = Depends(get_async_session),
+):
+    try:
+        meet_post = await leave_meet_post(session, meet_post_id, user.id)
+    except NotJoinedError:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not joined.")
+    return meet_post
+
+
+async def _send_events(websocket: WebSocket, subscription: Subscription) -> None:
+    while True:
+        message = await subscription.queue.get()
+        if message is None:
+            # 큐가 넘쳐 브로커가 구독을 끊었다
+            await websocket.close(code=status.WS_1013_TRY_AGAIN_LATER)
+            return
+        await websocket.send_text(message)
+
+
+async def _wait_disconnect(websocket: WebSocket) -> None:
+    while True:
+        message = await websocket.receive()
+        if message["type"] == "websocket.disconnect":
+            return
+
+
+@router.websocket("/ws")
+async def meet_post_events(
+    websocket: WebSocket,
+    token: str,
+    types: list[str] = Query([], alias="type"),
+    lat: Optional[float] = None,
+    lng: Optional[float] = None,
+):
+    if read_token_user_id(token) is None:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+
+    areas = []
+    if lat is not None and lng is not None:
+        areas = get_nearby_areas(lat, lng)
+
+    await websocket.accept()
+    subscription = broker.subscribe(areas, types)
+    tasks = [
+        asyncio.create_task(_send_events(websocket, subscription)),
+        asyncio.create_task(_wait_disconnect(websocket)),
+    ]
+    try:
+        done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            task.result()
+    except WebSocketDisconnect:
+        pass
+    finally:
+        for task in tasks:
+            task.cancel()
+        broker.unsubscribe(subscription)
@@ -0,0 +1,107 @@
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.deps import get_async_session
+from app.core.security import current_active_user
+from app.core.storage import FileTooLargeError, is_valid_key
+from app.models.user import User
+from app.schemas.user import UserRead
+from app.service.profile_image import (
+    PROFILE,
+    THUMBNAIL,
+    ProfileImageService,
+    get_profile_image_service,
+)
+from app.utils.files import file_response
+from app.utils.image import InvalidImageError
+
+router = APIRouter()
+
+# 내용 키가 바뀌지 않는 한 파일도 바뀌지 않는다
+CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+def is_valid_length(value: str) -> bool:
+    # int() 는 "-1", " 1", "1_000" 도 받아 주므로 숫자만 허용한다
+    return value.isascii() and value.isdigit()
+
+
+@router.put("/me", response_model=UserRead)
+async def upload_profile_image(
+    request: Request,
+    user: User = Depends(current_active_user),
+    session: AsyncSession = Depends(get_async_session),
+    service: ProfileImageService = Depends(get_profile_image_service),
+):
+    """요청 본문을 이미지 파일 그대로 받는다 (multipart 아님)."""
+    if not request.headers.get("content-type", "").startswith("image/"):
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail="Image content type required.",
+        )
+    content_length = request.headers.get("content-length")
+    if content_length is not None and not is_valid_length(content_length):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid Content-Length.",
+        )
+    if content_length is not None and int(content_length) > service.max_bytes:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail="Image is too large.",
+        )
+
+    try:
+        key = await service.save(request.stream())
+    except FileTooLargeError:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail="Image is too large.",
+        )
+    except InvalidImageError:
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail="Invalid image.",
+        )
+
+    # current_active_user 와 같은 세션이라 요청이 끝날 때 함께 커밋된다
+    user.profile = key
+    session.add(user)
+    return user
+
+
+def _serve(request: Request, key: str, variant: str, service: ProfileImageService):
+    if not is_valid_key(key):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Image not found."
+        )
+    try:
+        return file_response(
+            request,
+            service.get_path(key, variant),
+            etag=f"{variant}-{key}",
+            media_type="image/jpeg",
+            cache_control=CACHE_CONTROL,
+        )
+    except FileNotFoundError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Image not found."
+        )
+
+
+@router.get("/{key}")
+async def read_profile_image(
+    key: str,
+    request: Request,
+    service: ProfileImageService = Depends(get_profile_image_service),
+):
+    return _serve(request, key, PROFILE, service)
+
+
+@router.get("/{key}/thumbnail")
+async def read_profile_thumbnail(
+    key: str,
+    request: Request,
+    service: ProfileImageService = Depends(get_profile_image_service),
+):
+    return _serve(request, key, THUMBNAIL, service)
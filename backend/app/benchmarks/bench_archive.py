@@ -0,0 +1,185 @@
+"""지난 글을 보관 테이블로 옮기기 전후의 meet_post 크기와 피드 지연을 잰다.
+
+python -m app.benchmarks.bench_archive --old 500000 --live 5000
+
+피드는 종류별 첫 페이지와 다음 키셋 페이지, 그리고 워커가 피드 인덱스를 다시
+채울 때 읽는 최근 글 목록을 잰다. 일반 VACUUM 은 빈 공간을 재사용하게만 하므로
+파일 크기는 VACUUM FULL(운영에서는 pg_repack) 뒤에 따로 잰다.
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+import uuid
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timedelta, timezone
+from typing import cast
+
+from sqlalchemy import delete, insert, text
+
+from app.core.config import settings
+from app.core.db import async_session, engine
+from app.core.feed import load_feed_entries
+from app.crud.meet_post import get_meet_post_page
+from app.jobs.archive_meet_posts import archive_meet_posts
+from app.jobs.reconcile_meet_post_stats import reconcile_stats
+from app.models.meet_post import MeetPost, MeetPostArchive
+from app.models.user import GenderEnum, User
+
+TYPES = ["meal", "taxi", "study", "delivery"]
+
+SEED_SQL = """
+INSERT INTO meet_post
+    (id, author_id, title, type, content, max_people, lat, lng, created_at)
+SELECT gen_random_uuid(), :author_id, 'bench ' || i, (CAST(:types AS text[]))[1 + i % 4],
+    repeat('bench ', 20), 10, 36.7 + random() / 10, 127.0 + random() / 10,
+    now() - :min_age - random() * :spread
+FROM generate_series(1, :count) AS i
+"""
+
+
+async def seed(old: int, live: int) -> uuid.UUID:
+    author_id = uuid.uuid4()
+    async with async_session() as session:
+        async with session.begin():
+            await session.execute(
+                insert(User).values(
+                    id=author_id,
+                    email=f"bench-{author_id}@bench.hoseo.edu",
+                    hashed_password="x",
+                    is_active=True,
+                    is_superuser=False,
+                    is_verified=True,
+                    name="bench",
+                    gender=GenderEnum.male,
+                )
+            )
+            # 지난 글을 먼저 넣어 실제처럼 힙 앞쪽에 오래된 행이 쌓이게 한다
+            for count, min_age, spread in (
+                (old, timedelta(days=15), timedelta(days=365)),
+                (live, timedelta(0), timedelta(days=1)),
+            ):
+                await session.execute(
+                    text(SEED_SQL),
+                    {
+                        "author_id": author_id,
+                        "types": TYPES,
+                        "count": count,
+                        "min_age": min_age,
+                        "spread": spread,
+                    },
+                )
+    return author_id
+
+
+async def cleanup(author_id: uuid.UUID) -> None:
+    async with async_session() as session:
+        async with session.begin():
+            await session.execute(
+                delete(MeetPost).where(MeetPost.author_id == author_id)
+            )
+            await session.execute(
+                delete(MeetPostArchive).where(MeetPostArchive.author_id == author_id)
+            )
+            await session.execute(delete(User).where(User.__table__.c.id == author_id))
+    # 보관 테이블에서 지운 글은 트리거를 거치지 않으므로 통계를 다시 맞춘다
+    async with engine.connect() as connection:
+        await reconcile_stats(connection)
+
+
+async def vacuum(full: bool = False) -> None:
+    async with engine.connect() as connection:
+        connection = await connection.execution_options(isolation_level="AUTOCOMMIT")
+        await connection.execute(
+            text(f"VACUUM {'FULL ' if full else ''}ANALYZE meet_post")
+        )
+
+
+async def feed_page() -> None:
+    async with async_session() as session:
+        type_ = random.choice(TYPES)
+        page = await get_meet_post_page(session, type_=type_, limit=20)
+        # 모델이 Column 으로 선언되어 있어 인스턴스 값의 타입을 알려 준다
+        before = cast(tuple[datetime, uuid.UUID], (page[-1].created_at, page[-1].id))
+        await get_meet_post_page(session, type_=type_, before=before, limit=20)
+
+
+async def feed_rebuild() -> None:
+    await load_feed_entries(
+        settings.FEED_POST_TTL_HOURS * 3600,
+        settings.FEED_CELL_CAPACITY * settings.FEED_MAX_CELLS,
+    )
+
+
+async def latency(path: Callable[[], Awaitable[None]], runs: int) -> str:
+    for _ in range(min(runs, 10)):
+        await path()
+    latencies = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        await path()
+        latencies.append(time.perf_counter() - started)
+    latencies.sort()
+    return (
+        f"p50={statistics.median(latencies) * 1000:7.2f}ms  "
+        f"p99={latencies[int(len(latencies) * 0.99) - 1] * 1000:7.2f}ms"
+    )
+
+
+async def report(label: str, requests: int) -> None:
+    async with engine.connect() as connection:
+        rows, heap, indexes = (
+            await connection.execute(
+                text(
+                    "SELECT (SELECT count(*) FROM meet_post), "
+                    "pg_relation_size('meet_post'), pg_indexes_size('meet_post')"
+                )
+            )
+        ).one()
+    print(
+        f"{label:22} rows={rows:>9,}  heap={heap / 2**20:7.1f} MiB  "
+        f"indexes={indexes / 2**20:6.1f} MiB"
+    )
+    print(f"{'':22} feed page    {await latency(feed_page, requests)}")
+    print(f"{'':22} feed rebuild {await latency(feed_rebuild, max(requests // 50, 5))}")
+
+
+async def run(old: int, live: int, requests: int, batch_size: int) -> None:
+    author_id = await seed(old, live)
+    try:
+        await vacuum()
+        print(f"old={old} live={live} requests={requests} batch={batch_size}")
+        await report("before", requests)
+
+        before = datetime.now(timezone.utc) - timedelta(
+            days=settings.MEET_POST_ARCHIVE_DAYS
+        )
+        started = time.perf_counter()
+        async with engine.connect() as connection:
+            moved = await archive_meet_posts(connection, before, batch_size)
+        elapsed = time.perf_counter() - started
+        print(f"archived {moved:,} posts in {elapsed:.1f}s ({moved / elapsed:,.0f}/s)")
+
+        await vacuum()
+        await report("after archive+VACUUM", requests)
+        await vacuum(full=True)
+        await report("after VACUUM FULL", requests)
+    finally:
+        await cleanup(author_id)
+        await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--old", type=int, default=500_000)
+    parser.add_argument("--live", type=int, default=5_000)
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args()
+    asyncio.run(run(args.old, args.live, args.requests, args.batch_size))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+"""psycopg 와 asyncpg 드라이버의 인증/피드 경로 처리량을 비교한다.
+
+python -m app.benchmarks.bench_drivers --users 1000 --posts 5000 --requests 5000
+
+인증은 요청마다 이메일로 사용자를 찾고(로그인) id 로 다시 찾는다(토큰 검증).
+피드는 첫 페이지와 그 다음 키셋 페이지를 읽는다. 드라이버마다 prepared
+statement 캐시를 켠 경우와 트랜잭션 풀러 모드(캐시 끔)를 각각 잰다.
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+import uuid
+from collections.abc import Awaitable, Callable
+from datetime import datetime
+from typing import cast
+
+from fastapi_users.db import SQLAlchemyUserDatabase
+from sqlalchemy import delete, insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.db import async_session, create_engine, engine
+from app.crud.meet_post import get_meet_post_page
+from app.models.meet_post import MeetPost
+from app.models.user import GenderEnum, User
+
+TYPES = ["meal", "taxi", "study", "delivery"]
+
+
+async def seed(users: int, posts: int) -> list[dict]:
+    rows = [
+        {
+            "id": uuid.uuid4(),
+            "email": f"bench-{i}@bench.hoseo.edu",
+            "hashed_password": "x",
+            "is_active": True,
+            "is_superuser": False,
+            "is_verified": True,
+            "name": "bench",
+            "gender": GenderEnum.male,
+        }
+        for i in range(users)
+    ]
+    async with async_session() as session:
+        async with session.begin():
+            await session.execute(insert(User), rows)
+            await session.execute(
+                insert(MeetPost),
+                [
+                    {
+                        "author_id": rows[i % users]["id"],
+                        "title": f"bench {i}",
+                        "type": TYPES[i % len(TYPES)],
+                        "content": "bench",
+                        "max_people": 10,
+                    }
+                    for i in range(posts)
+                ],
+            )
+    return rows
+
+
+async def cleanup(user_ids: list[uuid.UUID]) -> None:
+    async with async_session() as session:
+        async with session.begin():
+            await session.execute(
+                delete(MeetPost).where(MeetPost.author_id.in_(user_ids))
+            )
+            await session.execute(delete(User).where(User.__table__.c.id.in_(user_ids)))
+
+
+def auth_path(users: list[dict]) -> Callable[[AsyncSession], Awaitable[None]]:
+    async def run(session: AsyncSession) -> None:
+        user_db = SQLAlchemyUserDatabase[User, uuid.UUID](session, User)
+        row = random.choice(users)
+        user = await user_db.get_by_email(row["email"])
+        assert user is not None
+        await user_db.get(user.id)
+
+    return run
+
+
+async def feed_path(session: AsyncSession) -> None:
+    type_ = random.choice(TYPES)
+    page = await get_meet_post_page(session, type_=type_, limit=20)
+    # 모델이 Column 으로 선언되어 있어 인스턴스 값의 타입을 알려 준다
+    before = cast(tuple[datetime, uuid.UUID], (page[-1].created_at, page[-1].id))
+    await get_meet_post_page(session, type_=type_, before=before, limit=20)
+
+
+async def measure(
+    session_factory: async_sessionmaker,
+    path: Callable[[AsyncSession], Awaitable[None]],
+    requests: int,
+    concurrency: int,
+) -> tuple[float, list[float]]:
+    latencies: list[float] = []
+
+    async def client(count: int) -> None:
+        for _ in range(count):
+            started = time.perf_counter()
+            async with session_factory() as session:
+                async with session.begin():
+                    await path(session)
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(client(requests // concurrency) for _ in range(concurrency)))
+    return time.perf_counter() - started, latencies
+
+
+async def run(
+    users: int, posts: int, requests: int, concurrency: int, cache_size: int
+) -> None:
+    rows = await seed(users, posts)
+    paths = {"auth": auth_path(rows), "feed": feed_path}
+    try:
+        print(
+            f"users={users} posts={posts} requests={requests} concurrency={concurrency}"
+        )
+        for driver in ("psycopg", "asyncpg"):
+            for transaction_pooler in (False, True):
+                bench_engine = create_engine(
+                    driver,
+                    statement_cache_size=cache_size,
+                    transaction_pooler=transaction_pooler,
+                    pool_size=concurrency,
+                    max_overflow=0,
+                )
+                session_factory = async_sessionmaker(
+                    bench_engine, class_=AsyncSession, expire_on_commit=False
+                )
+                mode = "no-prepare" if transaction_pooler else "prepared"
+                for name, path in paths.items():
+                    # 커넥션을 채우고 캐시를 데운다
+                    await measure(session_factory, path, concurrency * 10, concurrency)
+                    elapsed, latencies = await measure(
+                        session_factory, path, requests, concurrency
+                    )
+                    latencies.sort()
+                    print(
+                        f"{driver:8} {mode:10} {name:5} "
+                        f"{len(latencies) / elapsed:8,.0f} req/s  "
+                        f"p50={statistics.median(latencies) * 1000:.2f}ms  "
+                        f"p99={latencies[int(len(latencies) * 0.99) - 1] * 1000:.2f}ms"
+                    )
+                await bench_engine.dispose()
+    finally:
+        await cleanup([row["id"] for row in rows])
+        await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--posts", type=int, default=5000)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--cache-size", type=int, default=100)
+    args = parser.parse_args()
+    asyncio.run(
+        run(args.users, args.posts, args.requests, args.concurrency, args.cache_size)
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""스트리밍 내보내기와 .all() 로 한꺼번에 읽는 방식의 처리량과 최대 RSS 를 비교한다.
+
+python -m app.benchmarks.bench_export --posts 200000
+
+최대 RSS 는 프로세스가 끝날 때까지 줄지 않으므로 스트리밍을 먼저 잰다.
+.all() 쪽 수치는 테이블 크기에 비례해 늘고 스트리밍 쪽은 그대로여야 한다.
+"""
+
+import argparse
+import asyncio
+import resource
+import time
+import uuid
+
+from sqlalchemy import delete, func, insert, select, text
+
+from app.core.db import async_session, engine
+from app.models.meet_post import MeetPost
+from app.models.user import GenderEnum, User
+from app.service.export import CSV, EXPORTS, NDJSON, iter_export, to_ndjson
+
+
+def peak_rss_mb() -> float:
+    # 리눅스에서 ru_maxrss 는 KB 단위다
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+async def seed(posts: int) -> uuid.UUID:
+    author_id = uuid.uuid4()
+    async with async_session() as session:
+        async with session.begin():
+            await session.execute(
+                insert(User).values(
+                    id=author_id,
+                    email=f"bench-{author_id}@bench.hoseo.edu",
+                    hashed_password="x",
+                    is_active=True,
+                    is_superuser=False,
+                    is_verified=True,
+                    name="bench",
+                    gender=GenderEnum.male,
+                )
+            )
+            await session.execute(
+                text(
+                    "INSERT INTO meet_post "
+                    "(id, author_id, title, type, content, max_people, lat, lng) "
+                    "SELECT gen_random_uuid(), :author_id, 'bench ' || i, 'meal', "
+                    "repeat('bench ', 20), 10, 36.7 + random() / 10, "
+                    "127.0 + random() / 10 "
+                    "FROM generate_series(1, :posts) AS i"
+                ),
+                {"author_id": author_id, "posts": posts},
+            )
+    return author_id
+
+
+async def cleanup(author_id: uuid.UUID) -> None:
+    async with async_session() as session:
+        async with session.begin():
+            await session.execute(
+                delete(MeetPost).where(MeetPost.author_id == author_id)
+            )
+            await session.execute(delete(User).where(User.__table__.c.id == author_id))
+
+
+async def stream(format_: str, compress: bool, batch_size: int) -> int:
+    size = 0
+    async for chunk in iter_export(
+        "meet-posts", format_, compress=compress, batch_size=batch_size
+    ):
+        size += len(chunk)
+    return size
+
+
+async def load_all() -> int:
+    async with async_session() as session:
+        rows = (await session.execute(select(*EXPORTS["meet-posts"]))).all()
+        return len(to_ndjson(rows))
+
+
+async def run(posts: int, format_: str, compress: bool, batch_size: int) -> None:
+    author_id = await seed(posts)
+    try:
+        async with async_session() as session:
+            rows = (
+                await session.execute(select(func.count()).select_from(MeetPost))
+            ).scalar_one()
+        print(f"rows={rows} format={format_} gzip={compress} batch={batch_size}")
+        for name, export in (
+            ("stream", lambda: stream(format_, compress, batch_size)),
+            ("load-all", load_all),
+        ):
+            before = peak_rss_mb()
+            started = time.perf_counter()
+            size = await export()
+            elapsed = time.perf_counter() - started
+            print(
+                f"{name:8} {rows / elapsed:10,.0f} rows/s  "
+                f"{size / elapsed / 2**20:6.1f} MiB/s  "
+                f"peak RSS {peak_rss_mb():7.1f} MiB (+{peak_rss_mb() - before:.1f})"
+            )
+    finally:
+        await cleanup(author_id)
+        await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--posts", type=int, default=200_000)
+    parser.add_argument("--format", choices=[NDJSON, CSV], default=NDJSON)
+    parser.add_argument("--gzip", action="store_true")
+    parser.add_argument("--batch-size", type=int, default=1000)
+    args = parser.parse_args()
+    asyncio.run(run(args.posts, args.format, args.gzip, args.batch_size))
+
+
+if __name__ == "__main__":
+    main()
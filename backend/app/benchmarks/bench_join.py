@@ -0,0 +1,100 @@
+"""같은 글에 동시에 참여할 때의 처리량과 지연을 잰다.
+
+python -m app.benchmarks.bench_join --joins 500 --max-people 100
+
+지연에는 커넥션 풀을 기다리는 시간도 들어간다. 좌석 UPDATE 의 행 잠금은 커밋까지만
+잡으므로 joins 를 늘려도 p99 가 풀 크기만큼씩만 늘어야 한다.
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+import uuid
+
+from sqlalchemy import delete, insert
+
+from app.core.db import async_session, engine
+from app.crud.meet_post import MeetPostFullError, join_meet_post
+from app.models.meet_post import MeetPost
+from app.models.user import GenderEnum, User
+
+
+async def seed(joins: int, max_people: int) -> tuple[uuid.UUID, list[uuid.UUID]]:
+    user_ids = [uuid.uuid4() for _ in range(joins)]
+    meet_post_id = uuid.uuid4()
+    async with async_session() as session:
+        async with session.begin():
+            await session.execute(
+                insert(User),
+                [
+                    {
+                        "id": user_id,
+                        "email": f"bench-{user_id}@bench.hoseo.edu",
+                        "hashed_password": "x",
+                        "is_active": True,
+                        "is_superuser": False,
+                        "is_verified": True,
+                        "name": "bench",
+                        "gender": GenderEnum.male,
+                    }
+                    for user_id in user_ids
+                ],
+            )
+            await session.execute(
+                insert(MeetPost).values(
+                    id=meet_post_id,
+                    author_id=user_ids[0],
+                    title="bench",
+                    type="meal",
+                    content="bench",
+                    max_people=max_people,
+                )
+            )
+    return meet_post_id, user_ids
+
+
+async def cleanup(meet_post_id: uuid.UUID, user_ids: list[uuid.UUID]) -> None:
+    async with async_session() as session:
+        async with session.begin():
+            await session.execute(delete(MeetPost).where(MeetPost.id == meet_post_id))
+            await session.execute(delete(User).where(User.__table__.c.id.in_(user_ids)))
+
+
+async def join(meet_post_id: uuid.UUID, user_id: uuid.UUID) -> tuple[bool, float]:
+    start = time.perf_counter()
+    try:
+        async with async_session() as session:
+            async with session.begin():
+                await join_meet_post(session, meet_post_id, user_id)
+        joined = True
+    except MeetPostFullError:
+        joined = False
+    return joined, (time.perf_counter() - start) * 1000
+
+
+async def main(joins: int, max_people: int) -> None:
+    meet_post_id, user_ids = await seed(joins, max_people)
+    try:
+        start = time.perf_counter()
+        results = await asyncio.gather(*(join(meet_post_id, u) for u in user_ids))
+        elapsed = time.perf_counter() - start
+    finally:
+        await cleanup(meet_post_id, user_ids)
+        await engine.dispose()
+
+    samples = sorted(ms for _, ms in results)
+    p99 = samples[int(len(samples) * 0.99) - 1]
+    print(
+        f"{joins} concurrent joins ({sum(ok for ok, _ in results)} seated): "
+        f"{joins / elapsed:.0f} joins/s, "
+        f"p50 {statistics.median(samples):.1f} ms, p99 {p99:.1f} ms"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--joins", type=int, default=500)
+    parser.add_argument("--max-people", type=int, default=100)
+    args = parser.parse_args()
+    asyncio.run(main(args.joins, args.max_people))
@@ -0,0 +1,79 @@
+"""브로커가 구독자 1만 명에게 이벤트를 뿌리는 시간을 잰다.
+
+python -m app.benchmarks.bench_pubsub --subscribers 10000 --events 100
+
+소켓 전송 비용은 빼고 브로커의 팬아웃 비용과 소비자까지의 전달 지연만 본다.
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+
+from app.core.pubsub import Broker
+from app.utils.geo import get_area
+
+
+async def consume(subscription, count: int, latencies: list[float]) -> None:
+    for _ in range(count):
+        message = await subscription.queue.get()
+        if message is None:
+            return
+        latencies.append(time.perf_counter() - json.loads(message)["sent_at"])
+
+
+async def run(subscribers: int, events: int, queue_size: int, areas: int) -> None:
+    broker = Broker(queue_size)
+    area_keys = [get_area(36.7 + i * 0.01, 127.0) for i in range(areas)]
+    subscriptions = [
+        broker.subscribe(areas=[area_keys[i % areas]] if areas else [])
+        for i in range(subscribers)
+    ]
+    per_subscriber = events // areas if areas else events
+
+    latencies: list[float] = []
+    consumers = [
+        asyncio.create_task(consume(subscription, per_subscriber, latencies))
+        for subscription in subscriptions
+    ]
+
+    publish_times = []
+    started = time.perf_counter()
+    for i in range(events):
+        area = area_keys[i % areas] if areas else None
+        message = json.dumps({"id": i, "sent_at": time.perf_counter()})
+        publish_started = time.perf_counter()
+        broker.publish(message, "meal", area)
+        publish_times.append(time.perf_counter() - publish_started)
+        # 소비자가 큐를 비울 기회를 준다
+        await asyncio.sleep(0)
+    await asyncio.gather(*consumers)
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    print(f"subscribers={subscribers} events={events} areas={areas or 'all'}")
+    print(f"delivered   {len(latencies)} messages in {elapsed:.2f}s")
+    print(f"throughput  {len(latencies) / elapsed:,.0f} deliveries/s")
+    print(f"publish     avg {statistics.mean(publish_times) * 1000:.2f}ms per event")
+    print(
+        f"latency     p50={statistics.median(latencies) * 1000:.1f}ms "
+        f"p99={latencies[int(len(latencies) * 0.99) - 1] * 1000:.1f}ms"
+    )
+    print(f"dropped     {broker.dropped_count} slow consumers")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--subscribers", type=int, default=10_000)
+    parser.add_argument("--events", type=int, default=100)
+    parser.add_argument("--queue-size", type=int, default=100)
+    parser.add_argument(
+        "--areas", type=int, default=0, help="구독자를 나눌 지역 수 (0 이면 전체 구독)"
+    )
+    args = parser.parse_args()
+    asyncio.run(run(args.subscribers, args.events, args.queue_size, args.areas))
+
+
+if __name__ == "__main__":
+    main()
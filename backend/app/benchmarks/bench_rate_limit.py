@@ -0,0 +1,70 @@
+"""제한기가 요청 하나에 더하는 시간을 backend 별로 잰다.
+
+python -m app.benchmarks.bench_rate_limit --requests 20000 --keys 5000
+
+local 은 이벤트 루프 안의 dict 연산만, postgres 는 요청마다 rate_limit_take() 한 번의
+왕복을 더한다. 로그인처럼 IP 와 이메일을 함께 보면 두 배가 된다.
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+import uuid
+
+from sqlalchemy import delete
+
+from app.core.db import engine
+from app.core.rate_limit import RateLimitedError, RateLimiter
+from app.models.rate_limit import RateLimitBucket
+
+
+async def measure(limiter: RateLimiter, requests: int, keys: int) -> list[float]:
+    samples = []
+    limited = 0
+    for _ in range(requests):
+        key = f"10.0.{random.randrange(keys)}"
+        start = time.perf_counter()
+        try:
+            await limiter.hit(key)
+        except RateLimitedError:
+            limited += 1
+        samples.append((time.perf_counter() - start) * 1000)
+    print(f"  limited {limited}/{requests}")
+    return samples
+
+
+def report(name: str, samples: list[float]) -> None:
+    samples.sort()
+    p99 = samples[int(len(samples) * 0.99)]
+    print(
+        f"{name}: mean {statistics.mean(samples):.4f} ms, "
+        f"p50 {statistics.median(samples):.4f} ms, p99 {p99:.4f} ms"
+    )
+
+
+async def main(requests: int, keys: int) -> None:
+    name = f"bench-{uuid.uuid4().hex[:8]}"
+    local = RateLimiter(name, capacity=5, refill_per_minute=5)
+    report("local", await measure(local, requests, keys))
+    print(f"  local keys kept {len(local.local)}")
+
+    shared = RateLimiter(name, capacity=5, refill_per_minute=5, backend="postgres")
+    # 커넥션 풀을 채워 둔다
+    await measure(shared, 10, keys)
+    report("postgres", await measure(shared, requests, keys))
+
+    async with engine.begin() as connection:
+        await connection.execute(
+            delete(RateLimitBucket).where(RateLimitBucket.key.startswith(f"{name}:"))
+        )
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=20000)
+    parser.add_argument("--keys", type=int, default=5000)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.keys))
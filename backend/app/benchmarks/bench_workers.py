@@ -0,0 +1,101 @@
+"""워커 1개와 N개의 처리량을 비교한다.
+
+python -m app.benchmarks.bench_workers --workers 4 --duration 20
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import os
+import subprocess
+import sys
+import time
+
+import httpx
+
+from app.core.config import settings
+
+
+def wait_until_ready(url: str, timeout: float = 30) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            if httpx.get(url).status_code < 500:
+                return
+        except httpx.TransportError:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError(f"server did not start: {url}")
+
+
+async def _hammer(url: str, concurrency: int, duration: float) -> int:
+    done = 0
+    deadline = time.monotonic() + duration
+
+    async def client_loop(client: httpx.AsyncClient) -> None:
+        nonlocal done
+        while time.monotonic() < deadline:
+            response = await client.get(url)
+            response.raise_for_status()
+            done += 1
+
+    limits = httpx.Limits(max_connections=concurrency)
+    async with httpx.AsyncClient(limits=limits) as client:
+        await asyncio.gather(*(client_loop(client) for _ in range(concurrency)))
+    return done
+
+
+def _hammer_process(args: tuple[str, int, float]) -> int:
+    return asyncio.run(_hammer(*args))
+
+
+def measure(
+    workers: int, port: int, path: str, clients: int, concurrency: int, duration: float
+) -> float:
+    env = {**os.environ, "WEB_CONCURRENCY": str(workers), "PORT": str(port)}
+    server = subprocess.Popen(
+        [sys.executable, "-m", "app.server"],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    url = f"http://127.0.0.1:{port}{path}"
+    try:
+        wait_until_ready(url)
+        # 부하 발생기가 병목이 되지 않도록 여러 프로세스로 나눈다
+        with multiprocessing.Pool(clients) as pool:
+            counts = pool.map(_hammer_process, [(url, concurrency, duration)] * clients)
+    finally:
+        server.terminate()
+        server.wait()
+    return sum(counts) / duration
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--path", default=f"{settings.API_V1_STR}/openapi.json")
+    parser.add_argument("--clients", type=int, default=2)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=10)
+    args = parser.parse_args()
+
+    results = {}
+    for workers in sorted({1, args.workers}):
+        results[workers] = measure(
+            workers,
+            args.port,
+            args.path,
+            args.clients,
+            args.concurrency,
+            args.duration,
+        )
+        print(f"workers={workers:<3} {results[workers]:10.1f} req/s")
+
+    if args.workers > 1:
+        print(f"speedup x{results[args.workers] / results[1]:.2f}")
+
+
+if __name__ == "__main__":
+    main()
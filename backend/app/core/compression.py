@@ -0,0 +1,230 @@
+import gzip
+import hashlib
+import zlib
+from abc import ABC, abstractmethod
+
+import brotli
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.utils.files import etag_matches
+
+BROTLI = "br"
+GZIP = "gzip"
+IDENTITY = "identity"
+# q 값이 같으면 앞쪽을 고른다
+ENCODINGS = (BROTLI, GZIP)
+
+# 이미지처럼 이미 압축된 형식은 다시 압축해도 줄지 않는다
+COMPRESSIBLE_TYPES = (
+    "text/",
+    "application/json",
+    "application/x-ndjson",
+    "application/javascript",
+    "application/xml",
+    "image/svg+xml",
+)
+
+
+def choose_encoding(
+    accept_encoding: str, available: tuple[str, ...] = ENCODINGS
+) -> str:
+    """Accept-Encoding 에서 가장 선호하는 인코딩을 고른다. 없으면 identity."""
+    weights = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        weight = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key == "q":
+                try:
+                    weight = float(value)
+                except ValueError:
+                    weight = 0.0
+        weights[name] = weight
+
+    best, best_weight = IDENTITY, 0.0
+    for encoding in available:
+        weight = weights.get(encoding, weights.get("*", 0.0))
+        if weight > best_weight:
+            best, best_weight = encoding, weight
+    return best
+
+
+def is_compressible(content_type: str) -> bool:
+    content_type = content_type.split(";", 1)[0].strip().lower()
+    return content_type.startswith(COMPRESSIBLE_TYPES) or content_type.endswith("+json")
+
+
+class StreamCompressor(ABC):
+    @abstractmethod
+    def compress(self, data: bytes) -> bytes: ...
+
+    @abstractmethod
+    def finish(self) -> bytes: ...
+
+
+class BrotliCompressor(StreamCompressor):
+    def __init__(self, quality: int):
+        self._compressor = brotli.Compressor(quality=quality)
+
+    def compress(self, data: bytes) -> bytes:
+        # 스트리밍 응답은 덩어리마다 바로 내보내야 한다
+        return self._compressor.process(data) + self._compressor.flush()
+
+    def finish(self) -> bytes:
+        return self._compressor.finish()
+
+
+class GzipCompressor(StreamCompressor):
+    def __init__(self, level: int):
+        # wbits=31 이면 zlib 대신 gzip 헤더를 붙인다
+        self._compressor = zlib.compressobj(level, wbits=31)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush(
+            zlib.Z_SYNC_FLUSH
+        )
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+
+class CompressionMiddleware:
+    """응답 본문을 br 또는 gzip 으로 압축한다.
+
+    minimum_size 보다 작은 응답은 압축 비용이 더 크므로 그대로 보낸다.
+    이미 Content-Encoding 이 있거나 압축하지 않는 형식이면 건드리지 않는다.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = choose_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding == IDENTITY:
+            await self.app(scope, receive, send)
+            return
+        responder = CompressionResponder(self, encoding, send)
+        await self.app(scope, receive, responder.send)
+
+
+class CompressionResponder:
+    def __init__(self, middleware: CompressionMiddleware, encoding: str, send: Send):
+        self.middleware = middleware
+        self.encoding = encoding
+        self._send = send
+        self.start_message: Message | None = None
+        self.compressor: StreamCompressor | None = None
+        self.passthrough = False
+
+    async def send(self, message: Message) -> None:
+        if self.passthrough:
+            await self._send(message)
+            return
+
+        if message["type"] == "http.response.start":
+            headers = Headers(raw=message["headers"])
+            if (
+                message["status"] in (204, 206, 304)
+                or "content-encoding" in headers
+                or not is_compressible(headers.get("content-type", ""))
+            ):
+                self.passthrough = True
+                await self._send(message)
+                return
+            # 본문 첫 덩어리를 보고 압축할지 정한다
+            self.start_message = message
+            return
+
+        if message["type"] != "http.response.body":
+            await self._send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self.compressor is None:
+            # http.response.start 에서 넘기지 않았다면 여기서 붙잡아 둔 상태다
+            start_message = self.start_message
+            assert start_message is not None
+            headers = MutableHeaders(raw=start_message["headers"])
+            headers.add_vary_header("Accept-Encoding")
+            if not more_body and len(body) < self.middleware.minimum_size:
+                self.passthrough = True
+                await self._send(start_message)
+                await self._send(message)
+                return
+
+            if self.encoding == BROTLI:
+                self.compressor = BrotliCompressor(self.middleware.brotli_quality)
+            else:
+                self.compressor = GzipCompressor(self.middleware.gzip_level)
+            headers["Content-Encoding"] = self.encoding
+            if more_body:
+                del headers["Content-Length"]
+            else:
+                body = self.compressor.compress(body) + self.compressor.finish()
+                headers["Content-Length"] = str(len(body))
+                await self._send(start_message)
+                await self._send({"type": "http.response.body", "body": body})
+                return
+            await self._send(start_message)
+
+        body = self.compressor.compress(body)
+        if not more_body:
+            body += self.compressor.finish()
+        await self._send(
+            {"type": "http.response.body", "body": body, "more_body": more_body}
+        )
+
+
+class PrecompressedDocument:
+    """바뀌지 않는 문서를 인코딩마다 한 번씩 최고 압축률로 만들어 둔다.
+
+    요청마다 다시 압축하지 않고 ETag 가 맞으면 본문 없이 304 를 돌려준다.
+    """
+
+    def __init__(self, body: bytes, media_type: str):
+        self.media_type = media_type
+        self.etag = hashlib.sha256(body).hexdigest()[:32]
+        self.bodies = {
+            IDENTITY: body,
+            GZIP: gzip.compress(body, compresslevel=9, mtime=0),
+            BROTLI: brotli.compress(body, quality=11),
+        }
+
+    def response(self, request: Request) -> Response:
+        encoding = choose_encoding(request.headers.get("accept-encoding", ""))
+        # 인코딩마다 본문이 다르므로 ETag 도 다르게 준다
+        etag = f'"{self.etag}"' if encoding == IDENTITY else f'"{self.etag}-{encoding}"'
+        headers = {
+            "ETag": etag,
+            "Vary": "Accept-Encoding",
+            "Cache-Control": "no-cache",
+        }
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match is not None and etag_matches(if_none_match, etag):
+            return Response(status_code=304, headers=headers)
+        if encoding != IDENTITY:
+            headers["Content-Encoding"] = encoding
+        return Response(
+            self.bodies[encoding], media_type=self.media_type, headers=headers
+        )
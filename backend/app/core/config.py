@@ -5,6 +5,7 @@ from typing import Annotated, Any, Literal, ClassVar
 
 from pydantic import (
     AnyUrl,
+    BaseModel,
     BeforeValidator,
     HttpUrl,
     PostgresDsn,
@@ -29,6 +30,18 @@ def parse_cors(v: Any) -> list[str] | str:
     raise ValueError(v)
 
 
+class RouteLimitSettings(BaseModel):
+    concurrency: int
+    queue_size: int
+    timeout: float
+
+
+class RateLimitSettings(BaseModel):
+    # 한 번에 몰아 쓸 수 있는 요청 수와 분당 다시 채워지는 수
+    capacity: int
+    refill_per_minute: float
+
+
 class Settings(BaseSettings):
     model_config = SettingsConfigDict(
         env_file=".env", env_ignore_empty=True, extra="ignore"
@@ -60,6 +73,108 @@ class Settings(BaseSettings):
     POSTGRES_USER: str
     POSTGRES_PASSWORD: str = ""
     POSTGRES_DB: str = ""
+    # 한 파드의 모든 워커가 나눠 쓰는 커넥션 수 (DB max_connections / 파드 수 이하로)
+    POSTGRES_POOL_BUDGET: int = 20
+    POSTGRES_POOL_TIMEOUT: int = 30
+    # 앱이 쓰는 비동기 드라이버. 마이그레이션과 동기 코드는 항상 psycopg 를 쓴다
+    POSTGRES_ASYNC_DRIVER: Literal["psycopg", "asyncpg"] = "psycopg"
+    # 커넥션마다 서버에 prepare 해 두는 문장 수
+    POSTGRES_STATEMENT_CACHE_SIZE: int = 100
+    # pgbouncer 같은 트랜잭션 풀러를 거치면 이름 있는 prepared statement 를 쓰지 않는다
+    POSTGRES_TRANSACTION_POOLER: bool = False
+
+    # server settings
+    HOST: str = "0.0.0.0"
+    PORT: int = 80
+    # 지정하지 않으면 CPU 쿼터에 맞춰 워커 수를 정한다
+    WEB_CONCURRENCY: int | None = None
+    MAX_WORKERS: int | None = None
+    GRACEFUL_TIMEOUT: int = 30
+    KEEP_ALIVE: int = 5
+
+    # load shedding settings (워커 프로세스마다)
+    # 그룹별 동시 실행 수, 대기열 길이, 대기 시간(초). 넘치면 503 을 돌려준다
+    ROUTE_LIMITS: dict[str, RouteLimitSettings] = {
+        # 비밀번호 해시와 SMTP 가 이벤트 루프를 잡으므로 적게 돌린다
+        "auth-write": RouteLimitSettings(concurrency=2, queue_size=20, timeout=5),
+        "auth-read": RouteLimitSettings(concurrency=50, queue_size=100, timeout=2),
+        "feed": RouteLimitSettings(concurrency=50, queue_size=200, timeout=2),
+        "archive": RouteLimitSettings(concurrency=10, queue_size=20, timeout=2),
+        # 연결이 살아 있는 동안 자리를 잡으므로 기다리게 하지 않는다
+        "websocket": RouteLimitSettings(concurrency=1000, queue_size=0, timeout=0),
+        # 내보내기는 끝날 때까지 DB 커넥션 하나를 잡는다
+        "export": RouteLimitSettings(concurrency=2, queue_size=0, timeout=0),
+    }
+
+    # rate limit settings
+    # 로그인/가입/메일 인증을 IP 와 이메일마다 토큰 버킷으로 제한한다. 넘치면 429.
+    # 학교 와이파이는 IP 하나를 여럿이 쓰므로 IP 쪽을 넉넉하게 둔다
+    RATE_LIMITS: dict[str, RateLimitSettings] = {
+        "login-ip": RateLimitSettings(capacity=30, refill_per_minute=30),
+        "login-email": RateLimitSettings(capacity=5, refill_per_minute=1),
+        "register-ip": RateLimitSettings(capacity=10, refill_per_minute=2),
+        "register-email": RateLimitSettings(capacity=3, refill_per_minute=0.1),
+        "verify-email-ip": RateLimitSettings(capacity=20, refill_per_minute=10),
+        "verify-email-email": RateLimitSettings(capacity=3, refill_per_minute=0.2),
+    }
+    # 이 대역에서 온 요청은 X-Forwarded-For 를 오른쪽부터 읽어 처음 나오는 바깥
+    # 주소를 클라이언트 IP 로 본다. 인그레스 컨트롤러 파드 대역을 넣는다
+    TRUSTED_PROXY_NETWORKS: Annotated[list[str] | str, BeforeValidator(parse_cors)] = []
+    # local 은 워커 프로세스마다 따로 센다. postgres 면 모든 파드가 버킷을 함께 쓴다.
+    # postgres 도 DB 장애 중에는 프로세스별 local 로 세므로 실제 한도는
+    # capacity x 워커 수 x 파드 수까지 늘어난다
+    RATE_LIMIT_BACKEND: Literal["local", "postgres"] = "local"
+    # local 버킷을 나눠 담는 dict 수와 규칙마다 들고 있을 키 수의 상한
+    RATE_LIMIT_SHARDS: int = 16
+    RATE_LIMIT_MAX_KEYS: int = 100000
+
+    # real-time settings
+    # 지역 구분에 쓰는 격자 한 칸의 크기(위경도). 0.01 도는 약 1km
+    AREA_CELL_DEGREES: float = 0.01
+    # 느린 웹소켓 클라이언트는 이만큼 밀리면 연결을 끊는다
+    WS_SEND_QUEUE_SIZE: int = 100
+
+    # export settings
+    # 서버 쪽 커서에서 한 번에 가져와 직렬화하는 행 수
+    EXPORT_BATCH_SIZE: int = 1000
+
+    # compression settings
+    # 이보다 작은 응답은 압축하지 않는다. 응답마다 압축하므로 수준은 낮게 둔다
+    COMPRESSION_MINIMUM_SIZE: int = 1024
+    COMPRESSION_GZIP_LEVEL: int = 6
+    COMPRESSION_BROTLI_QUALITY: int = 4
+
+    # feed settings (워커 프로세스마다 메모리에 유지)
+    # 격자 칸 하나에 최신순으로 들고 있는 글 수와 칸 수의 상한
+    FEED_CELL_CAPACITY: int = 200
+    FEED_MAX_CELLS: int = 10000
+    # 이 시간이 지난 글은 피드에서 빠진다
+    FEED_POST_TTL_HOURS: int = 24
+    # 1km 멀어지는 것을 몇 초 더 오래된 글로 칠지
+    FEED_SECONDS_PER_KM: float = 600
+    # 요청마다 user_location 을 읽지 않도록 사용자 위치를 잠깐 들고 있는다
+    FEED_USER_CACHE_SIZE: int = 10000
+    FEED_USER_LOCATION_TTL: int = 60
+
+    # archive settings
+    # 이 기간이 지난 글은 meet_post_archive 로 옮긴다. FEED_POST_TTL_HOURS 보다 길어야 한다
+    MEET_POST_ARCHIVE_DAYS: int = 14
+    # 한 트랜잭션에서 옮기는 글 수. 잠금과 WAL 을 짧게 끊는다
+    MEET_POST_ARCHIVE_BATCH_SIZE: int = 500
+
+    # location history settings
+    # user_location_history 는 일 단위 파티션으로 보관하고 기간이 지나면 통째로 지운다
+    LOCATION_HISTORY_RETENTION_DAYS: int = 30
+    LOCATION_HISTORY_PREMAKE_DAYS: int = 7
+
+    # media settings
+    # 업로드 파일을 내용 해시 이름으로 저장하는 디렉터리
+    MEDIA_ROOT: Path = Path("media")
+    PROFILE_IMAGE_MAX_BYTES: int = 10 * 1024 * 1024
+    PROFILE_IMAGE_SIZE: int = 512
+    PROFILE_THUMBNAIL_SIZE: int = 128
+    # 이미지 리사이즈를 맡는 프로세스 수 (워커 프로세스마다)
+    IMAGE_WORKERS: int = 1
 
     # eamil settings
     SMTP_PORT: int
@@ -84,6 +199,18 @@ class Settings(BaseSettings):
             path=self.POSTGRES_DB,
         )
 
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def SQLALCHEMY_ASYNC_DATABASE_URI(self) -> PostgresDsn:
+        return MultiHostUrl.build(
+            scheme=f"postgresql+{self.POSTGRES_ASYNC_DRIVER}",
+            username=self.POSTGRES_USER,
+            password=self.POSTGRES_PASSWORD,
+            host=self.POSTGRES_SERVER,
+            port=self.POSTGRES_PORT,
+            path=self.POSTGRES_DB,
+        )
+
     FIRST_SUPERUSER: str
     FIRST_SUPERUSER_PASSWORD: str
 
@@ -110,29 +237,3 @@ class Settings(BaseSettings):
 
 
 settings = Settings()  # type: ignore
-from pydantic import (
-    PostgresDsn
-)
-from pydantic_core import MultiHostUrl
-from pydantic_settings import BaseSettings, SettingsConfigDict
-
-class Settings(BaseSettings):
-    model_config = SettingsConfigDict(
-        env_file=".env",
-        env_ignore_empty=True,
-        extra="ignore",
-    )
-
-    @computed_field  # type: ignore[misc]
-    @property
-    def SQLALCHEMY_DATABASE_URI(self) -> PostgresDsn:
-        return MultiHostUrl.build(
-            scheme="postgresql+psycopg",
-            username=self.POSTGRES_USER,
-            password=self.POSTGRES_PASSWORD,
-            host=self.POSTGRES_SERVER,
-            port=self.POSTGRES_PORT,
-            path=self.POSTGRES_DB,
-        )
-
-settings = Settings()
\ No newline at end of file
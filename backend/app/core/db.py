@@ -1,9 +1,82 @@
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
+import uuid
+from typing import Any
+
+from sqlalchemy import event, make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import DeclarativeBase
 
 from app.core.config import settings
+from app.core.workers import RESERVED_CONNECTIONS, get_pool_size
+
+
+def get_connect_args(
+    driver: str, statement_cache_size: int, transaction_pooler: bool
+) -> dict[str, Any]:
+    """드라이버별 prepared statement 설정.
+
+    트랜잭션 풀러 뒤에서는 트랜잭션마다 다른 서버 커넥션을 받으므로 커넥션에
+    prepare 해 둔 문장을 다시 쓸 수 없고, 같은 서버 커넥션을 나눠 쓰는 다른
+    클라이언트와 문장 이름이 겹칠 수도 있다.
+    """
+    if driver == "asyncpg":
+        if transaction_pooler:
+            return {
+                "statement_cache_size": 0,
+                "prepared_statement_cache_size": 0,
+                "prepared_statement_name_func": lambda: f"__asyncpg_{uuid.uuid4()}__",
+            }
+        return {"prepared_statement_cache_size": statement_cache_size}
+    # psycopg 는 같은 문장을 여러 번 실행하면 알아서 prepare 한다. None 이면 끈다
+    if transaction_pooler:
+        return {"prepare_threshold": None}
+    return {}
+
+
+def create_engine(
+    driver: str | None = None,
+    *,
+    statement_cache_size: int | None = None,
+    transaction_pooler: bool | None = None,
+    **kw: Any,
+) -> AsyncEngine:
+    if driver is None:
+        driver = settings.POSTGRES_ASYNC_DRIVER
+    if statement_cache_size is None:
+        statement_cache_size = settings.POSTGRES_STATEMENT_CACHE_SIZE
+    if transaction_pooler is None:
+        transaction_pooler = settings.POSTGRES_TRANSACTION_POOLER
+
+    url = make_url(str(settings.SQLALCHEMY_ASYNC_DATABASE_URI)).set(
+        drivername=f"postgresql+{driver}"
+    )
+    new_engine = create_async_engine(
+        url,
+        connect_args=get_connect_args(driver, statement_cache_size, transaction_pooler),
+        **kw,
+    )
+    if driver == "psycopg" and not transaction_pooler:
+
+        @event.listens_for(new_engine.sync_engine, "connect")
+        def set_prepared_max(dbapi_connection, connection_record):
+            dbapi_connection.driver_connection.prepared_max = statement_cache_size
+
+    return new_engine
+
 
-engine = create_async_engine(str(settings.SQLALCHEMY_DATABASE_URI))
+# 서버 엔트리포인트가 WEB_CONCURRENCY 를 채워 준다. 단일 프로세스면 예산 전체를 쓴다
+engine = create_engine(
+    pool_size=get_pool_size(
+        settings.WEB_CONCURRENCY or 1, reserved=RESERVED_CONNECTIONS
+    ),
+    max_overflow=0,
+    pool_timeout=settings.POSTGRES_POOL_TIMEOUT,
+    pool_pre_ping=True,
+)
 async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
 
@@ -0,0 +1,328 @@
+import asyncio
+import bisect
+import heapq
+import json
+import logging
+import time
+import uuid
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from operator import itemgetter
+
+from sqlalchemy import select
+
+from app.core.config import settings
+from app.core.db import async_session
+from app.models.meet_post import MeetPost
+from app.utils.geo import distance_km, distance_to_cell_km, get_cell, get_nearby_cells
+
+logger = logging.getLogger(__name__)
+
+# app.jobs.rebuild_feed 가 모든 워커에 재구성을 요청하는 채널
+FEED_COMMAND_CHANNEL = "feed_commands"
+
+Cell = tuple[int, int]
+
+
+@dataclass(slots=True)
+class FeedEntry:
+    id: str
+    type: str
+    lat: float
+    lng: float
+    created_at: float
+
+
+@dataclass(slots=True)
+class FeedItem:
+    id: uuid.UUID
+    rank: float
+    distance_km: float
+
+    @property
+    def cursor(self) -> str:
+        return f"{self.rank!r}:{self.id}"
+
+
+def parse_cursor(cursor: str) -> tuple[float, str]:
+    rank, _, id_ = cursor.rpartition(":")
+    return float(rank), str(uuid.UUID(id_))
+
+
+def parse_timestamp(value: str) -> float:
+    """NOTIFY 로 받은 timestamptz 문자열을 epoch 초로 바꾼다.
+
+    json_build_object 는 소수 초 끝의 0 을 떼어 자릿수가 0~6 자리로 달라진다.
+    Python 3.10 의 fromisoformat 은 3, 6 자리만 읽으므로 strptime 을 쓴다.
+    """
+    format_ = "%Y-%m-%dT%H:%M:%S.%f%z" if "." in value else "%Y-%m-%dT%H:%M:%S%z"
+    return datetime.strptime(value, format_).timestamp()
+
+
+class FeedIndex:
+    """격자 칸마다 최신순 글 목록을 들고 있다가 가까운 칸들을 합쳐 피드를 만든다.
+
+    순위는 `거리(km) * seconds_per_km - 작성 시각` 이 작은 순서다. 시간이 흘러도
+    모든 글의 나이가 똑같이 늘어나므로 같은 위치에서는 순서가 바뀌지 않고,
+    그래서 순위 값을 그대로 페이지 커서로 쓴다.
+    메모리는 칸마다 cell_capacity 개, 칸은 max_cells 개까지만 든다.
+    """
+
+    def __init__(
+        self,
+        cell_capacity: int,
+        max_cells: int,
+        ttl_seconds: float,
+        seconds_per_km: float,
+        user_cache_size: int,
+        user_location_ttl: float,
+    ):
+        self.cell_capacity = cell_capacity
+        self.max_cells = max_cells
+        self.ttl_seconds = ttl_seconds
+        self.seconds_per_km = seconds_per_km
+        self.user_cache_size = user_cache_size
+        self.user_location_ttl = user_location_ttl
+        # 칸 목록은 (-작성 시각, id) 오름차순, 즉 최신순이다. 최근에 바뀐 칸이 뒤에 온다
+        self._cells: OrderedDict[Cell, list[tuple[float, str, FeedEntry]]] = (
+            OrderedDict()
+        )
+        self._entries: dict[str, Cell] = {}
+        self._users: OrderedDict[uuid.UUID, tuple[float, float, float]] = OrderedDict()
+        # 재구성하는 동안 받은 이벤트. 스냅숏을 올린 뒤 다시 적용한다
+        self._pending: list[dict] | None = None
+
+    @property
+    def entry_count(self) -> int:
+        return len(self._entries)
+
+    @property
+    def cell_count(self) -> int:
+        return len(self._cells)
+
+    def add(self, entry: FeedEntry) -> None:
+        self.remove(entry.id)
+        if entry.created_at < time.time() - self.ttl_seconds:
+            return
+        cell = get_cell(entry.lat, entry.lng)
+        posts = self._cells.get(cell)
+        if posts is None:
+            posts = self._cells[cell] = []
+        self._cells.move_to_end(cell)
+        bisect.insort(posts, (-entry.created_at, entry.id, entry))
+        self._entries[entry.id] = cell
+
+        for _, id_, _ in posts[self.cell_capacity :]:
+            del self._entries[id_]
+        del posts[self.cell_capacity :]
+
+        # 가장 오래 바뀌지 않은 칸부터 버린다
+        while len(self._cells) > self.max_cells:
+            _, evicted = self._cells.popitem(last=False)
+            for _, id_, _ in evicted:
+                del self._entries[id_]
+
+    def remove(self, id_: str) -> None:
+        cell = self._entries.pop(id_, None)
+        if cell is None:
+            return
+        posts = self._cells[cell]
+        posts[:] = [post for post in posts if post[1] != id_]
+        if not posts:
+            del self._cells[cell]
+
+    def _prune(self, cell: Cell, now: float) -> list[tuple[float, str, FeedEntry]]:
+        posts = self._cells.get(cell)
+        if posts is None:
+            return []
+        # 최신순이라 만료된 글은 모두 뒤쪽에 있다
+        expired = bisect.bisect_right(posts, self.ttl_seconds - now, key=itemgetter(0))
+        if expired < len(posts):
+            for _, id_, _ in posts[expired:]:
+                del self._entries[id_]
+            del posts[expired:]
+        if not posts:
+            del self._cells[cell]
+        return posts
+
+    def apply_event(self, event: dict) -> None:
+        if self._pending is not None:
+            self._pending.append(event)
+        self._apply(event)
+
+    def _apply(self, event: dict) -> None:
+        id_ = str(event["id"])
+        if event["event"] == "deleted" or event.get("lat") is None:
+            self.remove(id_)
+            return
+        if event["event"] in ("joined", "left") and id_ not in self._entries:
+            # 인원 변화는 순위에 영향이 없다. 이미 빠진 글을 되살리지 않는다
+            return
+        self.add(
+            FeedEntry(
+                id=id_,
+                type=event["type"],
+                lat=event["lat"],
+                lng=event["lng"],
+                created_at=parse_timestamp(event["created_at"]),
+            )
+        )
+
+    def apply_meet_post_event(self, payload: str) -> None:
+        self.apply_event(json.loads(payload))
+
+    def start_rebuild(self) -> None:
+        self._pending = []
+
+    def cancel_rebuild(self) -> None:
+        self._pending = None
+
+    def finish_rebuild(self, entries: Iterable[FeedEntry]) -> None:
+        """스냅숏으로 상태를 바꾸고 그동안 받은 이벤트를 다시 적용한다."""
+        pending = self._pending or []
+        self._pending = None
+        self._cells.clear()
+        self._entries.clear()
+        for entry in entries:
+            self.add(entry)
+        for event in pending:
+            self._apply(event)
+
+    def _stream(
+        self, lat: float, lng: float, cell: Cell, posts: list
+    ) -> Iterator[tuple[float, FeedEntry]]:
+        # 칸 안에서 최신순으로 내려가므로 이 하한은 단조 증가한다
+        penalty = distance_to_cell_km(lat, lng, cell) * self.seconds_per_km
+        for neg_created_at, _, entry in posts:
+            yield penalty + neg_created_at, entry
+
+    def page(
+        self,
+        lat: float,
+        lng: float,
+        *,
+        type_: str | None = None,
+        limit: int = 20,
+        after: tuple[float, str] | None = None,
+        radius: int = 1,
+    ) -> list[FeedItem]:
+        """주변 칸 목록을 하한 순으로 합치면서 순위 상위 limit 개를 고른다.
+
+        다음 하한이 이미 고른 limit 번째 순위보다 크면 남은 글은 볼 필요가 없다.
+        """
+        now = time.time()
+        streams = [
+            self._stream(lat, lng, cell, posts)
+            for cell in get_nearby_cells(lat, lng, radius)
+            if (posts := self._prune(cell, now))
+        ]
+        best: list[tuple[float, str, float]] = []
+        for bound, entry in heapq.merge(*streams, key=lambda item: item[0]):
+            if len(best) == limit and bound > best[-1][0]:
+                break
+            if type_ is not None and entry.type != type_:
+                continue
+            distance = distance_km(lat, lng, entry.lat, entry.lng)
+            key = (distance * self.seconds_per_km - entry.created_at, entry.id)
+            if after is not None and key <= after:
+                continue
+            if len(best) == limit and key >= best[-1][:2]:
+                continue
+            bisect.insort(best, (*key, distance))
+            del best[limit:]
+        return [
+            FeedItem(id=uuid.UUID(id_), rank=rank, distance_km=distance)
+            for rank, id_, distance in best
+        ]
+
+    def update_user_location(self, user_id: uuid.UUID, lat: float, lng: float) -> None:
+        self._users[user_id] = (lat, lng, time.monotonic() + self.user_location_ttl)
+        self._users.move_to_end(user_id)
+        while len(self._users) > self.user_cache_size:
+            self._users.popitem(last=False)
+
+    def get_user_location(self, user_id: uuid.UUID) -> tuple[float, float] | None:
+        cached = self._users.get(user_id)
+        if cached is None:
+            return None
+        lat, lng, expires_at = cached
+        if expires_at < time.monotonic():
+            del self._users[user_id]
+            return None
+        return lat, lng
+
+
+async def load_feed_entries(ttl_seconds: float, limit: int) -> list[FeedEntry]:
+    since = datetime.now(timezone.utc) - timedelta(seconds=ttl_seconds)
+    async with async_session() as session:
+        result = await session.execute(
+            select(
+                MeetPost.id,
+                MeetPost.type,
+                MeetPost.lat,
+                MeetPost.lng,
+                MeetPost.created_at,
+            )
+            .where(MeetPost.created_at >= since, MeetPost.lat.is_not(None))
+            .order_by(MeetPost.created_at.desc())
+            .limit(limit)
+        )
+        return [
+            FeedEntry(
+                id=str(id_),
+                type=type_,
+                lat=lat,
+                lng=lng,
+                created_at=created_at.timestamp(),
+            )
+            for id_, type_, lat, lng, created_at in result
+        ]
+
+
+async def rebuild_feed_index(index: FeedIndex) -> None:
+    """DB 에서 살아 있는 글을 다시 읽어 인덱스를 채운다."""
+    index.start_rebuild()
+    try:
+        entries = await load_feed_entries(
+            index.ttl_seconds, index.cell_capacity * index.max_cells
+        )
+    except BaseException:
+        index.cancel_rebuild()
+        raise
+    index.finish_rebuild(entries)
+    logger.info(
+        f"Rebuilt feed index: {index.entry_count} posts in {index.cell_count} cells"
+    )
+
+
+feed_index = FeedIndex(
+    cell_capacity=settings.FEED_CELL_CAPACITY,
+    max_cells=settings.FEED_MAX_CELLS,
+    ttl_seconds=settings.FEED_POST_TTL_HOURS * 3600,
+    seconds_per_km=settings.FEED_SECONDS_PER_KM,
+    user_cache_size=settings.FEED_USER_CACHE_SIZE,
+    user_location_ttl=settings.FEED_USER_LOCATION_TTL,
+)
+
+
+_rebuild_task: asyncio.Task | None = None
+
+
+def _log_rebuild_error(task: asyncio.Task) -> None:
+    if not task.cancelled() and task.exception() is not None:
+        logger.error(f"Failed to rebuild feed index: {task.exception()}")
+
+
+def schedule_feed_rebuild() -> None:
+    """재구성을 백그라운드로 시작한다. 이미 도는 중이면 그대로 둔다."""
+    global _rebuild_task
+    if _rebuild_task is None or _rebuild_task.done():
+        _rebuild_task = asyncio.create_task(rebuild_feed_index(feed_index))
+        _rebuild_task.add_done_callback(_log_rebuild_error)
+
+
+def handle_feed_command(payload: str) -> None:
+    if payload == "rebuild":
+        schedule_feed_rebuild()
@@ -0,0 +1,208 @@
+import asyncio
+import math
+from collections.abc import Callable
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.core.config import RouteLimitSettings, settings
+
+AUTH_WRITE = "auth-write"
+AUTH_READ = "auth-read"
+FEED = "feed"
+ARCHIVE = "archive"
+WEBSOCKET = "websocket"
+EXPORT = "export"
+
+
+class OverloadedError(Exception):
+    pass
+
+
+class RouteLimit:
+    """동시에 실행할 요청 수와 기다릴 수 있는 요청 수를 제한한다.
+
+    자리가 없으면 대기열에서 timeout 초까지 기다리고, 대기열마저 차 있거나
+    기다리다 시간이 지나면 OverloadedError 를 낸다.
+    """
+
+    def __init__(self, name: str, concurrency: int, queue_size: int, timeout: float):
+        self.name = name
+        self.concurrency = concurrency
+        self.queue_size = queue_size
+        self.timeout = timeout
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self.active = 0
+        self.waiting = 0
+        self.rejected_count = 0
+        self.timed_out_count = 0
+
+    @property
+    def retry_after(self) -> int:
+        return max(math.ceil(self.timeout), 1)
+
+    async def _acquire_within_timeout(self) -> bool:
+        """timeout 초 안에 자리를 얻으면 True.
+
+        3.12 전의 wait_for 는 시간이 다 된 순간 자리를 얻으면 그 자리를 돌려주지
+        않고 TimeoutError 를 내므로, 취소와 획득이 겹쳐도 자리를 잃지 않게 한다.
+        """
+        acquiring: asyncio.Future[bool] = asyncio.ensure_future(
+            self._semaphore.acquire()
+        )
+        try:
+            await asyncio.wait({acquiring}, timeout=self.timeout)
+            if not acquiring.done():
+                acquiring.cancel()
+                # 취소가 닿기 전에 자리를 얻었다면 그대로 쓴다
+                await asyncio.wait({acquiring})
+        except asyncio.CancelledError:
+            # 요청이 취소돼도 뒤늦게 얻은 자리는 돌려준다
+            acquiring.cancel()
+            acquiring.add_done_callback(self._release_if_acquired)
+            raise
+        return self._is_acquired(acquiring)
+
+    def _is_acquired(self, acquiring: asyncio.Future[bool]) -> bool:
+        return not acquiring.cancelled() and acquiring.exception() is None
+
+    def _release_if_acquired(self, acquiring: asyncio.Future[bool]) -> None:
+        if self._is_acquired(acquiring):
+            self._semaphore.release()
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[None]:
+        if self._semaphore.locked():
+            if self.waiting >= self.queue_size:
+                self.rejected_count += 1
+                raise OverloadedError()
+            self.waiting += 1
+            try:
+                acquired = await self._acquire_within_timeout()
+            finally:
+                self.waiting -= 1
+            if not acquired:
+                self.timed_out_count += 1
+                raise OverloadedError()
+        else:
+            await self._semaphore.acquire()
+
+        self.active += 1
+        try:
+            yield
+        finally:
+            self.active -= 1
+            self._semaphore.release()
+
+
+def classify_route(scope: Scope) -> str | None:
+    """요청을 제한 그룹으로 나눈다. None 이면 제한하지 않는다."""
+    if scope["type"] == "websocket":
+        return WEBSOCKET
+    if scope["type"] != "http":
+        return None
+    path = scope["path"].removeprefix(settings.API_V1_STR)
+    if path.startswith("/auth/"):
+        # 비밀번호 해시와 메일 발송이 이벤트 루프를 오래 잡는다
+        if scope["method"] == "GET" and path != "/auth/verify-email":
+            return AUTH_READ
+        return AUTH_WRITE
+    if path.startswith("/exports/"):
+        return EXPORT
+    if path.startswith("/meet-posts/archive") and scope["method"] == "GET":
+        # 보관 글 조회가 느려져도 피드 자리를 차지하지 않게 따로 센다
+        return ARCHIVE
+    if path.startswith("/meet-posts") and scope["method"] == "GET":
+        return FEED
+    return None
+
+
+def create_route_limits(
+    limits: dict[str, RouteLimitSettings],
+) -> dict[str, RouteLimit]:
+    return {
+        name: RouteLimit(name, limit.concurrency, limit.queue_size, limit.timeout)
+        for name, limit in limits.items()
+    }
+
+
+class LoadSheddingMiddleware:
+    """그룹별로 동시 실행 수를 제한하고 넘치는 요청은 바로 503 으로 돌려보낸다.
+
+    제한은 워커 프로세스마다 따로 걸린다.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        limits: dict[str, RouteLimit],
+        classify: Callable[[Scope], str | None] = classify_route,
+    ):
+        self.app = app
+        self.limits = limits
+        self.classify = classify
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        name = self.classify(scope)
+        limit = self.limits.get(name) if name is not None else None
+        if limit is None:
+            await self.app(scope, receive, send)
+            return
+
+        try:
+            async with limit.acquire():
+                await self.app(scope, receive, send)
+        except OverloadedError:
+            await self.reject(scope, receive, send, limit.retry_after)
+
+    async def reject(
+        self, scope: Scope, receive: Receive, send: Send, retry_after: int
+    ) -> None:
+        response = JSONResponse(
+            {"detail": "Server is busy."},
+            status_code=503,
+            headers={"Retry-After": str(retry_after)},
+        )
+        if scope["type"] == "websocket":
+            # 핸드셰이크를 받은 뒤 수락하지 않고 거절한다
+            await receive()
+            if "websocket.http.response" not in scope.get("extensions", {}):
+                await send({"type": "websocket.close", "code": 1013})
+                return
+        await response(scope, receive, send)
+
+
+def render_metrics(limits: dict[str, RouteLimit]) -> str:
+    """Prometheus 텍스트 형식. 값은 이 워커 프로세스 것만이다."""
+    lines = [
+        "# HELP route_limit_active Requests running per route class.",
+        "# TYPE route_limit_active gauge",
+    ]
+    lines += [
+        f'route_limit_active{{route_class="{name}"}} {limit.active}'
+        for name, limit in limits.items()
+    ]
+    lines += [
+        "# HELP route_limit_waiting Requests waiting in the queue per route class.",
+        "# TYPE route_limit_waiting gauge",
+    ]
+    lines += [
+        f'route_limit_waiting{{route_class="{name}"}} {limit.waiting}'
+        for name, limit in limits.items()
+    ]
+    lines += [
+        "# HELP route_limit_shed_total Requests rejected with 503 per route class.",
+        "# TYPE route_limit_shed_total counter",
+    ]
+    for name, limit in limits.items():
+        lines.append(
+            f'route_limit_shed_total{{route_class="{name}",reason="queue_full"}} '
+            f"{limit.rejected_count}"
+        )
+        lines.append(
+            f'route_limit_shed_total{{route_class="{name}",reason="timeout"}} '
+            f"{limit.timed_out_count}"
+        )
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,146 @@
+import asyncio
+import json
+import logging
+from collections import defaultdict
+from collections.abc import Callable, Iterable
+
+import psycopg
+
+from app.core.config import settings
+from app.utils.geo import get_area
+
+logger = logging.getLogger(__name__)
+
+# meet_post 트리거가 pg_notify 하는 채널
+MEET_POST_CHANNEL = "meet_post_events"
+# 지역을 지정하지 않은 구독자가 모이는 토픽
+ALL_AREAS = "*"
+
+
+class Subscription:
+    def __init__(self, areas: frozenset[str], types: frozenset[str], queue_size: int):
+        self.areas = areas
+        self.types = types
+        # None 은 느린 소비자로 끊겼다는 신호다
+        self.queue: asyncio.Queue[str | None] = asyncio.Queue(queue_size)
+
+    def accepts(self, type_: str | None) -> bool:
+        return not self.types or type_ in self.types
+
+
+class Broker:
+    """프로세스 안에서 지역 토픽 단위로 이벤트를 뿌리는 브로커.
+
+    메시지는 한 번만 직렬화해 모든 구독자 큐에 같은 문자열을 넣는다. 큐가
+    가득 찬 구독자는 기다리지 않고 바로 끊어서 발행이 느려지지 않게 한다.
+    """
+
+    def __init__(self, queue_size: int):
+        self.queue_size = queue_size
+        self._topics: dict[str, set[Subscription]] = defaultdict(set)
+        self.dropped_count = 0
+
+    @property
+    def subscriber_count(self) -> int:
+        return len({sub for subs in self._topics.values() for sub in subs})
+
+    def subscribe(
+        self, areas: Iterable[str] = (), types: Iterable[str] = ()
+    ) -> Subscription:
+        subscription = Subscription(
+            frozenset(areas) or frozenset([ALL_AREAS]),
+            frozenset(types),
+            self.queue_size,
+        )
+        for area in subscription.areas:
+            self._topics[area].add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        for area in subscription.areas:
+            subs = self._topics.get(area)
+            if subs is None:
+                continue
+            subs.discard(subscription)
+            if not subs:
+                del self._topics[area]
+
+    def publish(
+        self, message: str, type_: str | None = None, area: str | None = None
+    ) -> int:
+        topics = [ALL_AREAS] if area is None else [ALL_AREAS, area]
+        delivered = 0
+        slow: list[Subscription] = []
+        for topic in topics:
+            for subscription in self._topics.get(topic, ()):
+                if not subscription.accepts(type_):
+                    continue
+                try:
+                    subscription.queue.put_nowait(message)
+                    delivered += 1
+                except asyncio.QueueFull:
+                    slow.append(subscription)
+
+        for subscription in slow:
+            self._drop(subscription)
+        return delivered
+
+    def publish_meet_post_event(self, payload: str) -> int:
+        event = json.loads(payload)
+        area = None
+        if event.get("lat") is not None and event.get("lng") is not None:
+            area = get_area(event["lat"], event["lng"])
+        return self.publish(payload, event.get("type"), area)
+
+    def _drop(self, subscription: Subscription) -> None:
+        self.unsubscribe(subscription)
+        self.dropped_count += 1
+        # 밀린 메시지는 버리고 종료 신호를 넣어 송신 루프를 깨운다
+        while not subscription.queue.empty():
+            subscription.queue.get_nowait()
+        subscription.queue.put_nowait(None)
+
+
+broker = Broker(settings.WS_SEND_QUEUE_SIZE)
+
+
+async def listen_events(
+    handlers: dict[str, list[Callable[[str], object]]],
+    on_connect: Callable[[], None] | None = None,
+    retry_seconds: float = 1.0,
+) -> None:
+    """LISTEN 으로 모든 파드의 변경 알림을 받아 채널별 핸들러에 넘긴다.
+
+    워커마다 풀 밖의 커넥션 하나를 쓴다. 재연결하는 동안의 알림은 유실되므로
+    놓친 상태를 다시 맞춰야 하는 쪽은 on_connect 에서 처리한다.
+    트랜잭션 풀러는 LISTEN 을 유지하지 못하므로 POSTGRES_SERVER 가 풀러라면
+    세션 모드 포트를 써야 한다.
+    """
+    while True:
+        try:
+            async with await psycopg.AsyncConnection.connect(
+                host=settings.POSTGRES_SERVER,
+                port=settings.POSTGRES_PORT,
+                user=settings.POSTGRES_USER,
+                password=settings.POSTGRES_PASSWORD,
+                dbname=settings.POSTGRES_DB,
+                autocommit=True,
+            ) as conn:
+                for channel in handlers:
+                    await conn.execute(f"LISTEN {channel}")
+                if on_connect is not None:
+                    on_connect()
+                async for notify in conn.notifies():
+                    for handler in handlers[notify.channel]:
+                        try:
+                            handler(notify.payload)
+                        except Exception:
+                            logger.exception(f"Failed to handle {notify.channel}")
+        except psycopg.OperationalError as e:
+            logger.warning(f"Event listener disconnected: {str(e)}")
+            await asyncio.sleep(retry_seconds)
+        except Exception:
+            # 예상 못 한 오류로 리스너가 죽으면 이 워커는 알림을 더 받지 못한다.
+            # CancelledError 는 Exception 이 아니므로 종료는 그대로 전파된다
+            logger.exception("Event listener failed")
+            await asyncio.sleep(retry_seconds)
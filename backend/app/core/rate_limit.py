@@ -0,0 +1,288 @@
+"""로그인/가입/메일 인증 요청을 IP 와 이메일마다 토큰 버킷으로 제한한다.
+
+버킷은 capacity 개까지 토큰을 담고 분당 refill_per_minute 개씩 다시 채워진다.
+요청마다 하나를 쓰고, 모자라면 다음 토큰까지 남은 시간을 Retry-After 로 알려 준다.
+"""
+
+import ipaddress
+import logging
+import math
+import time
+from collections.abc import Sequence
+
+from fastapi import HTTPException, Request, status
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.core.config import RateLimitSettings, settings
+from app.core.db import engine as default_engine
+
+logger = logging.getLogger(__name__)
+
+# rate_limit_bucket.key 길이
+MAX_KEY_LENGTH = 320
+
+Network = ipaddress.IPv4Network | ipaddress.IPv6Network
+
+
+class RateLimitedError(Exception):
+    def __init__(self, retry_after: float):
+        super().__init__(retry_after)
+        self.retry_after = retry_after
+
+
+class LocalBuckets:
+    """버킷을 워커 프로세스 메모리에 둔다.
+
+    키 해시로 나눈 shard(dict) 마다 마지막으로 쓴 순서를 유지한다. 오래 쓰지 않아
+    다시 가득 찬 버킷은 없는 것과 같으므로 앞에서부터 지우고, 키가 max_keys 를
+    넘으면 가장 오래 쓰지 않은 것부터 버린다.
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        refill_per_second: float,
+        shards: int = 16,
+        max_keys: int = 100000,
+    ):
+        self.capacity = capacity
+        self.refill_per_second = refill_per_second
+        # 빈 버킷이 가득 찰 때까지 걸리는 시간
+        self.ttl = capacity / refill_per_second
+        self._shards: list[dict[str, tuple[float, float]]] = [{} for _ in range(shards)]
+        self._max_shard_keys = max(max_keys // shards, 1)
+
+    def __len__(self) -> int:
+        return sum(len(shard) for shard in self._shards)
+
+    def take(self, key: str, now: float | None = None) -> float:
+        """토큰 하나를 쓰고 기다려야 할 초를 돌려준다. 0 이면 허용이다."""
+        if now is None:
+            now = time.monotonic()
+        shard = self._shards[hash(key) % len(self._shards)]
+        # 꺼냈다가 다시 넣어 shard 의 맨 뒤로 보낸다
+        state = shard.pop(key, None)
+        if state is None:
+            tokens = float(self.capacity)
+        else:
+            tokens, updated_at = state
+            tokens = min(
+                self.capacity, tokens + (now - updated_at) * self.refill_per_second
+            )
+
+        wait = 0.0
+        if tokens >= 1:
+            tokens -= 1
+        else:
+            wait = (1 - tokens) / self.refill_per_second
+        shard[key] = (tokens, now)
+        self._expire(shard, now)
+        return wait
+
+    def _expire(self, shard: dict[str, tuple[float, float]], now: float) -> None:
+        while len(shard) > self._max_shard_keys:
+            del shard[next(iter(shard))]
+        while True:
+            oldest = next(iter(shard))
+            if now - shard[oldest][1] < self.ttl:
+                return
+            del shard[oldest]
+
+
+class PostgresBuckets:
+    """모든 파드가 rate_limit_bucket 테이블의 버킷을 함께 쓴다.
+
+    DB 에 닿지 않으면 요청을 막지 않고 fallback(프로세스 메모리)으로 센다.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        fallback: LocalBuckets,
+        engine: AsyncEngine = default_engine,
+    ):
+        self.name = name
+        self.fallback = fallback
+        # 함수 호출 하나뿐이므로 BEGIN/COMMIT 왕복을 아낀다
+        self.engine = engine.execution_options(isolation_level="AUTOCOMMIT")
+        # 장애 동안 요청마다 로그를 남기지 않도록 상태가 바뀔 때만 남긴다
+        self.degraded = False
+
+    async def take(self, key: str) -> float:
+        try:
+            async with self.engine.connect() as connection:
+                wait = await connection.scalar(
+                    text("SELECT rate_limit_take(:key, :capacity, :refill)"),
+                    {
+                        "key": f"{self.name}:{key}"[:MAX_KEY_LENGTH],
+                        "capacity": self.fallback.capacity,
+                        "refill": self.fallback.refill_per_second,
+                    },
+                )
+        except (OSError, SQLAlchemyError):
+            if not self.degraded:
+                self.degraded = True
+                logger.warning(
+                    "Rate limit %s fell back to local buckets", self.name, exc_info=True
+                )
+            return self.fallback.take(key)
+
+        if self.degraded:
+            self.degraded = False
+            logger.info("Rate limit %s is back on postgres buckets", self.name)
+        return wait
+
+
+class RateLimiter:
+    def __init__(
+        self,
+        name: str,
+        capacity: int,
+        refill_per_minute: float,
+        backend: str = "local",
+        shards: int = 16,
+        max_keys: int = 100000,
+        engine: AsyncEngine = default_engine,
+    ):
+        self.name = name
+        self.local = LocalBuckets(capacity, refill_per_minute / 60, shards, max_keys)
+        self.shared = (
+            PostgresBuckets(name, self.local, engine) if backend == "postgres" else None
+        )
+        self.limited_count = 0
+
+    async def hit(self, key: str) -> None:
+        if self.shared is not None:
+            wait = await self.shared.take(key)
+        else:
+            wait = self.local.take(key)
+        if wait > 0:
+            self.limited_count += 1
+            raise RateLimitedError(wait)
+
+
+def create_rate_limiters(
+    limits: dict[str, RateLimitSettings],
+    backend: str = "local",
+    shards: int = 16,
+    max_keys: int = 100000,
+) -> dict[str, RateLimiter]:
+    return {
+        name: RateLimiter(
+            name,
+            limit.capacity,
+            limit.refill_per_minute,
+            backend=backend,
+            shards=shards,
+            max_keys=max_keys,
+        )
+        for name, limit in limits.items()
+    }
+
+
+rate_limiters = create_rate_limiters(
+    settings.RATE_LIMITS,
+    settings.RATE_LIMIT_BACKEND,
+    settings.RATE_LIMIT_SHARDS,
+    settings.RATE_LIMIT_MAX_KEYS,
+)
+
+
+def parse_networks(networks: Sequence[str]) -> list[Network]:
+    return [ipaddress.ip_network(network, strict=False) for network in networks]
+
+
+trusted_proxies = parse_networks(settings.TRUSTED_PROXY_NETWORKS)
+
+
+def is_trusted(host: str, networks: Sequence[Network]) -> bool:
+    try:
+        address = ipaddress.ip_address(host)
+    except ValueError:
+        return False
+    return any(address in network for network in networks)
+
+
+def get_client_ip(request: Request, networks: Sequence[Network] = ()) -> str:
+    """인그레스 뒤에서도 실제 클라이언트 IP 를 돌려준다.
+
+    직접 붙은 주소가 믿는 프록시일 때만 X-Forwarded-For 를 본다. 프록시는 헤더
+    끝에 주소를 덧붙이므로 오른쪽부터 믿는 프록시를 건너뛰고, 클라이언트가 앞에
+    적어 보낸 값은 쓰지 않는다.
+    """
+    host = request.client.host if request.client is not None else "unknown"
+    if not is_trusted(host, networks):
+        return host
+    forwarded = request.headers.get("x-forwarded-for", "")
+    for hop in reversed([hop.strip() for hop in forwarded.split(",") if hop.strip()]):
+        if not is_trusted(hop, networks):
+            return hop
+        host = hop
+    return host
+
+
+async def get_request_email(request: Request) -> str | None:
+    """로그인 폼의 username 이나 JSON 본문의 email.
+
+    FastAPI 가 엔드포인트 인자를 만들며 이미 읽어 둔 본문을 다시 쓴다.
+    """
+    content_type = request.headers.get("content-type", "")
+    if content_type.startswith(
+        ("application/x-www-form-urlencoded", "multipart/form-data")
+    ):
+        value = (await request.form()).get("username")
+    elif content_type.startswith("application/json"):
+        try:
+            body = await request.json()
+        except ValueError:
+            return None
+        value = body.get("email") if isinstance(body, dict) else None
+    else:
+        return None
+    return value.strip().lower() if isinstance(value, str) else None
+
+
+class RateLimit:
+    """라우터에 거는 의존성. 요청 IP 와, 본문에 있으면 이메일마다 토큰을 하나씩 쓴다.
+
+    비밀번호 해시나 메일 발송보다 먼저 실행되어 넘친 요청은 429 로 돌려보낸다.
+    """
+
+    def __init__(
+        self,
+        ip: RateLimiter,
+        email: RateLimiter | None = None,
+        proxies: Sequence[Network] = trusted_proxies,
+    ):
+        self.ip = ip
+        self.email = email
+        self.proxies = proxies
+
+    async def __call__(self, request: Request) -> None:
+        try:
+            await self.ip.hit(get_client_ip(request, self.proxies))
+            if self.email is not None:
+                email = await get_request_email(request)
+                if email:
+                    await self.email.hit(email)
+        except RateLimitedError as e:
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail="Too many requests.",
+                headers={"Retry-After": str(max(math.ceil(e.retry_after), 1))},
+            )
+
+
+def render_metrics(limiters: dict[str, RateLimiter]) -> str:
+    """Prometheus 텍스트 형식. 값은 이 워커 프로세스 것만이다."""
+    lines = [
+        "# HELP rate_limited_total Requests rejected with 429 per rate limit rule.",
+        "# TYPE rate_limited_total counter",
+    ]
+    lines += [
+        f'rate_limited_total{{rule="{name}"}} {limiter.limited_count}'
+        for name, limiter in limiters.items()
+    ]
+    return "\n".join(lines) + "\n"
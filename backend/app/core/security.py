@@ -1,11 +1,13 @@
 import uuid
 
+import jwt
 from fastapi_users import FastAPIUsers
 from fastapi_users.authentication import (
     JWTStrategy,
     AuthenticationBackend,
     BearerTransport,
 )
+from fastapi_users.jwt import decode_jwt
 
 from app.core.config import settings
 from app.service.user import get_user_manager
@@ -25,3 +27,16 @@ auth_backend = AuthenticationBackend(
 )
 
 fastapi_users = FastAPIUsers[User, uuid.UUID](get_user_manager, [auth_backend])
+
+current_active_user = fastapi_users.current_user(active=True)
+current_superuser = fastapi_users.current_user(active=True, superuser=True)
+
+
+def read_token_user_id(token: str) -> uuid.UUID | None:
+    # 웹소켓은 헤더를 붙일 수 없어 쿼리로 받은 토큰을 DB 조회 없이 검증만 한다
+    strategy = get_jwt_strategy()
+    try:
+        data = decode_jwt(token, strategy.decode_key, strategy.token_audience)
+        return uuid.UUID(data["sub"])
+    except (jwt.PyJWTError, KeyError, TypeError, ValueError):
+        return None
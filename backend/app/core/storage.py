@@ -0,0 +1,52 @@
+import hashlib
+import os
+import re
+import tempfile
+from collections.abc import AsyncIterator
+from pathlib import Path
+
+from starlette.concurrency import run_in_threadpool
+
+from app.core.config import settings
+
+KEY_PATTERN = re.compile(r"^[0-9a-f]{64}$")
+
+
+class FileTooLargeError(Exception):
+    pass
+
+
+def is_valid_key(key: str) -> bool:
+    return KEY_PATTERN.match(key) is not None
+
+
+def get_path(key: str, variant: str, suffix: str = ".jpg") -> Path:
+    """내용 키로 저장 경로를 만든다. 한 디렉터리에 파일이 몰리지 않게 앞 두 글자로 나눈다."""
+    if not is_valid_key(key):
+        raise ValueError(f"Invalid content key: {key}")
+    return settings.MEDIA_ROOT / variant / key[:2] / f"{key}{suffix}"
+
+
+async def save_stream(chunks: AsyncIterator[bytes], max_bytes: int) -> tuple[str, Path]:
+    """청크를 받는 대로 임시 파일에 쓰면서 sha256 을 계산한다.
+
+    메모리에는 청크 하나만 올라간다. 임시 파일 경로는 호출한 쪽이 지워야 한다.
+    """
+    tmp_dir = settings.MEDIA_ROOT / "tmp"
+    tmp_dir.mkdir(parents=True, exist_ok=True)
+    fd, name = tempfile.mkstemp(dir=tmp_dir)
+    path = Path(name)
+    digest = hashlib.sha256()
+    size = 0
+    try:
+        with os.fdopen(fd, "wb") as f:
+            async for chunk in chunks:
+                size += len(chunk)
+                if size > max_bytes:
+                    raise FileTooLargeError()
+                digest.update(chunk)
+                await run_in_threadpool(f.write, chunk)
+    except BaseException:
+        path.unlink(missing_ok=True)
+        raise
+    return digest.hexdigest(), path
@@ -0,0 +1,71 @@
+import math
+import os
+from pathlib import Path
+
+from app.core.config import settings
+
+CGROUP_V2_CPU_MAX = Path("/sys/fs/cgroup/cpu.max")
+CGROUP_V1_CPU_QUOTA = Path("/sys/fs/cgroup/cpu/cpu.cfs_quota_us")
+CGROUP_V1_CPU_PERIOD = Path("/sys/fs/cgroup/cpu/cpu.cfs_period_us")
+
+# 워커마다 풀 밖에서 여는 커넥션 (meet_post 이벤트 LISTEN)
+RESERVED_CONNECTIONS = 1
+
+
+def read_cgroup_cpu_quota() -> float | None:
+    """컨테이너에 할당된 CPU 쿼터(코어 수)를 읽는다. 제한이 없으면 None."""
+    try:
+        quota, period = CGROUP_V2_CPU_MAX.read_text().split()
+        if quota == "max":
+            return None
+        return int(quota) / int(period)
+    except (OSError, ValueError):
+        pass
+
+    try:
+        quota_us = int(CGROUP_V1_CPU_QUOTA.read_text())
+        period_us = int(CGROUP_V1_CPU_PERIOD.read_text())
+    except (OSError, ValueError):
+        return None
+    if quota_us <= 0 or period_us <= 0:
+        return None
+    return quota_us / period_us
+
+
+def get_cpu_limit() -> int:
+    if hasattr(os, "sched_getaffinity"):
+        cpus = len(os.sched_getaffinity(0))
+    else:
+        cpus = os.cpu_count() or 1
+
+    quota = read_cgroup_cpu_quota()
+    if quota is not None:
+        cpus = min(cpus, math.ceil(quota))
+    return max(cpus, 1)
+
+
+def get_worker_count() -> int:
+    # 비동기 워커는 코어당 하나면 충분하다
+    if settings.WEB_CONCURRENCY:
+        return settings.WEB_CONCURRENCY
+
+    workers = get_cpu_limit()
+    if settings.MAX_WORKERS:
+        workers = min(workers, settings.MAX_WORKERS)
+    return max(workers, 1)
+
+
+def get_pool_size(workers: int, budget: int | None = None, reserved: int = 0) -> int:
+    """커넥션 예산을 워커 수로 나눠 워커 하나의 풀 크기를 구한다.
+
+    reserved 는 워커마다 풀 밖에서 따로 여는 커넥션 수(LISTEN 등)다.
+    """
+    if budget is None:
+        budget = settings.POSTGRES_POOL_BUDGET
+    pool_size = budget // workers - reserved
+    if pool_size < 1:
+        raise ValueError(
+            f"POSTGRES_POOL_BUDGET ({budget}) is too small for "
+            f"{workers} workers with {reserved} reserved connections each."
+        )
+    return pool_size
@@ -0,0 +1,72 @@
+import uuid
+from datetime import datetime, timezone
+from typing import Optional, Sequence
+
+from sqlalchemy import insert, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.user import UserLocation, UserLocationHistory
+
+
+async def record_location(
+    session: AsyncSession,
+    user_id: uuid.UUID,
+    lat: float,
+    lng: float,
+    recorded_at: Optional[datetime] = None,
+) -> None:
+    """위치 기록을 이력 파티션에 쌓고 최신 위치 테이블을 갱신한다."""
+    if recorded_at is None:
+        recorded_at = datetime.now(timezone.utc)
+
+    await session.execute(
+        insert(UserLocationHistory).values(
+            user_id=user_id, lat=lat, lng=lng, recorded_at=recorded_at
+        )
+    )
+
+    upsert = pg_insert(UserLocation).values(
+        user_id=user_id, lat=lat, lng=lng, updated_at=recorded_at
+    )
+    await session.execute(
+        upsert.on_conflict_do_update(
+            index_elements=[UserLocation.user_id],
+            set_={
+                "lat": upsert.excluded.lat,
+                "lng": upsert.excluded.lng,
+                "updated_at": upsert.excluded.updated_at,
+            },
+            # 늦게 도착한 과거 기록으로 최신 위치를 덮어쓰지 않는다
+            where=UserLocation.updated_at <= upsert.excluded.updated_at,
+        )
+    )
+
+
+async def get_latest_location(
+    session: AsyncSession, user_id: uuid.UUID
+) -> Optional[UserLocation]:
+    return await session.scalar(
+        select(UserLocation).where(UserLocation.user_id == user_id)
+    )
+
+
+async def get_location_history(
+    session: AsyncSession,
+    user_id: uuid.UUID,
+    since: datetime,
+    until: datetime,
+    limit: int = 1000,
+) -> Sequence[UserLocationHistory]:
+    # recorded_at 범위를 항상 걸어야 해당 기간의 파티션만 읽는다
+    result = await session.scalars(
+        select(UserLocationHistory)
+        .where(
+            UserLocationHistory.user_id == user_id,
+            UserLocationHistory.recorded_at >= since,
+            UserLocationHistory.recorded_at < until,
+        )
+        .order_by(UserLocationHistory.recorded_at.desc())
+        .limit(limit)
+    )
+    return result.all()
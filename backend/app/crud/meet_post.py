@@ -0,0 +1,191 @@
+import uuid
+from datetime import date, datetime
+from typing import Any, Optional, Sequence
+
+from sqlalchemy import BigInteger, Row, cast, delete, func, select, tuple_, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.meet_post import (
+    MeetPost,
+    MeetPostArchive,
+    MeetPostParticipant,
+    MeetPostStats,
+)
+
+
+class MeetPostNotFoundError(Exception):
+    pass
+
+
+class MeetPostFullError(Exception):
+    pass
+
+
+class AlreadyJoinedError(Exception):
+    pass
+
+
+class NotJoinedError(Exception):
+    pass
+
+
+# meet_post_participant.meet_post_id 외래 키 (PostgreSQL 기본 이름)
+MEET_POST_FK = "meet_post_participant_meet_post_id_fkey"
+
+
+def get_constraint_name(error: IntegrityError) -> Optional[str]:
+    """위반한 제약 이름. psycopg 는 diag 에, asyncpg 는 원래 예외에 담는다."""
+    diag = getattr(error.orig, "diag", None)
+    if diag is not None:
+        return diag.constraint_name
+    cause = error.orig.__cause__ if error.orig is not None else None
+    return getattr(cause, "constraint_name", None)
+
+
+async def join_meet_post(
+    session: AsyncSession, meet_post_id: uuid.UUID, user_id: uuid.UUID
+) -> MeetPost:
+    """참여 행을 넣고 좌석 카운터를 조건부로 1 올린다.
+
+    SELECT 로 인원을 확인하지 않고 `current_people < max_people` 조건의 UPDATE
+    한 번으로 좌석을 잡기 때문에, 같은 글에 동시에 참여해도 초과 예약이 없고
+    행 잠금은 커밋까지만 유지된다. 실패하면 호출한 쪽 트랜잭션을 롤백해야 한다.
+    """
+    try:
+        joined = await session.execute(
+            insert(MeetPostParticipant)
+            .values(meet_post_id=meet_post_id, user_id=user_id)
+            .on_conflict_do_nothing()
+            .returning(MeetPostParticipant.user_id)
+        )
+    except IntegrityError as e:
+        # user_id 외래 키처럼 다른 제약이면 호출한 쪽 잘못이므로 그대로 올린다
+        if get_constraint_name(e) != MEET_POST_FK:
+            raise
+        raise MeetPostNotFoundError() from e
+    if joined.first() is None:
+        raise AlreadyJoinedError()
+
+    seat = await session.execute(
+        update(MeetPost)
+        .where(
+            MeetPost.id == meet_post_id,
+            MeetPost.current_people < MeetPost.max_people,
+        )
+        .values(current_people=MeetPost.current_people + 1)
+        .returning(MeetPost)
+        .execution_options(synchronize_session=False)
+    )
+    meet_post = seat.scalar_one_or_none()
+    if meet_post is None:
+        raise MeetPostFullError()
+    return meet_post
+
+
+async def leave_meet_post(
+    session: AsyncSession, meet_post_id: uuid.UUID, user_id: uuid.UUID
+) -> MeetPost:
+    left = await session.execute(
+        delete(MeetPostParticipant)
+        .where(
+            MeetPostParticipant.meet_post_id == meet_post_id,
+            MeetPostParticipant.user_id == user_id,
+        )
+        .returning(MeetPostParticipant.user_id)
+    )
+    if left.first() is None:
+        raise NotJoinedError()
+
+    seat = await session.execute(
+        update(MeetPost)
+        .where(MeetPost.id == meet_post_id)
+        .values(current_people=MeetPost.current_people - 1)
+        .returning(MeetPost)
+        .execution_options(synchronize_session=False)
+    )
+    return seat.scalar_one()
+
+
+async def get_meet_post_page(
+    session: AsyncSession,
+    *,
+    type_: Optional[str] = None,
+    before: Optional[tuple[datetime, uuid.UUID]] = None,
+    limit: int = 20,
+) -> Sequence[MeetPost]:
+    """최신 글부터 limit 개. before 에 이전 페이지 마지막 글의 (created_at, id) 를 넘긴다.
+
+    OFFSET 대신 (created_at, id) 키셋으로 넘겨서 뒤 페이지도 인덱스에서 바로 읽는다.
+    """
+    query = select(MeetPost)
+    if type_ is not None:
+        query = query.where(MeetPost.type == type_)
+    if before is not None:
+        query = query.where(tuple_(MeetPost.created_at, MeetPost.id) < before)
+    result = await session.scalars(
+        query.order_by(MeetPost.created_at.desc(), MeetPost.id.desc()).limit(limit)
+    )
+    return result.all()
+
+
+async def get_meet_posts_by_ids(
+    session: AsyncSession, ids: Sequence[uuid.UUID]
+) -> list[MeetPost]:
+    """ids 순서대로 돌려준다. 그사이 지워진 글은 빠진다."""
+    if not ids:
+        return []
+    result = await session.scalars(select(MeetPost).where(MeetPost.id.in_(ids)))
+    posts: dict[Any, MeetPost] = {post.id: post for post in result}
+    return [posts[id_] for id_ in ids if id_ in posts]
+
+
+async def get_meet_post_stats(
+    session: AsyncSession,
+    since: date,
+    until: date,
+    type_: Optional[str] = None,
+) -> Sequence[Row]:
+    """(day, type, fill_bucket, count). 버킷마다 shard 몇 행만 더하므로 글 수와 상관없다."""
+    query = select(
+        MeetPostStats.day,
+        MeetPostStats.type,
+        MeetPostStats.fill_bucket,
+        cast(func.sum(MeetPostStats.count), BigInteger).label("count"),
+    ).where(MeetPostStats.day >= since, MeetPostStats.day <= until)
+    if type_ is not None:
+        query = query.where(MeetPostStats.type == type_)
+    result = await session.execute(
+        query.group_by(MeetPostStats.day, MeetPostStats.type, MeetPostStats.fill_bucket)
+        .having(func.sum(MeetPostStats.count) != 0)
+        .order_by(MeetPostStats.day, MeetPostStats.type, MeetPostStats.fill_bucket)
+    )
+    return result.all()
+
+
+async def get_archived_meet_post(
+    session: AsyncSession, meet_post_id: uuid.UUID
+) -> Optional[MeetPostArchive]:
+    return await session.get(MeetPostArchive, meet_post_id)
+
+
+async def get_archived_meet_post_page(
+    session: AsyncSession,
+    author_id: uuid.UUID,
+    *,
+    before: Optional[tuple[datetime, uuid.UUID]] = None,
+    limit: int = 20,
+) -> Sequence[MeetPostArchive]:
+    """author_id 가 쓴 보관 글을 최신순으로. 키셋은 get_meet_post_page 와 같다."""
+    query = select(MeetPostArchive).where(MeetPostArchive.author_id == author_id)
+    if before is not None:
+        query = query.where(
+            tuple_(MeetPostArchive.created_at, MeetPostArchive.id) < before
+        )
+    result = await session.scalars(
+        query.order_by(
+            MeetPostArchive.created_at.desc(), MeetPostArchive.id.desc()
+        ).limit(limit)
+    )
+    return result.all()
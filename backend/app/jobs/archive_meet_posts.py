@@ -0,0 +1,104 @@
+"""오래된 meet_post 를 참여 기록과 함께 meet_post_archive 로 옮긴다.
+
+python -m app.jobs.archive_meet_posts [--days 14]
+
+meet_post 에는 아직 모집 중일 수 있는 글만 남겨 피드가 읽는 테이블과 인덱스를
+작게 유지한다. 작은 배치마다 트랜잭션을 끊어 잠금과 WAL 을 짧게 가져가고,
+SKIP LOCKED 로 고르므로 참여 중인 글을 기다리지 않고 여러 번 돌아도 겹치지 않는다.
+"""
+
+import argparse
+import asyncio
+import logging
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import delete, insert, select, text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from app.core.config import settings
+from app.core.db import engine
+from app.models.meet_post import (
+    MeetPost,
+    MeetPostArchive,
+    MeetPostParticipant,
+    MeetPostParticipantArchive,
+)
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+POST_COLUMNS = [column.key for column in MeetPost.__table__.columns]
+PARTICIPANT_COLUMNS = [column.key for column in MeetPostParticipant.__table__.columns]
+
+
+async def archive_batch(
+    connection: AsyncConnection, before: datetime, batch_size: int
+) -> int:
+    """before 보다 먼저 쓴 글을 batch_size 개까지 옮기고 옮긴 수를 돌려준다."""
+    async with connection.begin():
+        # 트리거가 옮기는 글을 삭제 이벤트로 알리거나 통계에서 빼지 않게 한다
+        await connection.execute(
+            text("SELECT set_config('hoseo_meet.archiving', 'on', true)")
+        )
+        ids = (
+            await connection.scalars(
+                select(MeetPost.id)
+                .where(MeetPost.created_at < before)
+                .order_by(MeetPost.created_at)
+                .limit(batch_size)
+                .with_for_update(skip_locked=True)
+            )
+        ).all()
+        if not ids:
+            return 0
+
+        await connection.execute(
+            insert(MeetPostArchive).from_select(
+                POST_COLUMNS,
+                select(*MeetPost.__table__.columns).where(MeetPost.id.in_(ids)),
+            )
+        )
+        await connection.execute(
+            insert(MeetPostParticipantArchive).from_select(
+                PARTICIPANT_COLUMNS,
+                select(*MeetPostParticipant.__table__.columns).where(
+                    MeetPostParticipant.meet_post_id.in_(ids)
+                ),
+            )
+        )
+        # 참여 행은 ON DELETE CASCADE 로 함께 지워진다
+        await connection.execute(delete(MeetPost).where(MeetPost.id.in_(ids)))
+    return len(ids)
+
+
+async def archive_meet_posts(
+    connection: AsyncConnection,
+    before: datetime,
+    batch_size: int | None = None,
+    pause: float = 0.0,
+) -> int:
+    if batch_size is None:
+        batch_size = settings.MEET_POST_ARCHIVE_BATCH_SIZE
+    total = 0
+    while moved := await archive_batch(connection, before, batch_size):
+        total += moved
+        # 복제 지연과 다른 쓰기가 따라올 틈을 준다
+        await asyncio.sleep(pause)
+    return total
+
+
+async def main(days: int, pause: float) -> None:
+    before = datetime.now(timezone.utc) - timedelta(days=days)
+    logger.info(f"Archiving meet posts created before {before.isoformat()}")
+    async with engine.connect() as connection:
+        total = await archive_meet_posts(connection, before, pause=pause)
+    await engine.dispose()
+    logger.info(f"Archived {total} meet posts")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--days", type=int, default=settings.MEET_POST_ARCHIVE_DAYS)
+    parser.add_argument("--pause", type=float, default=0.1)
+    args = parser.parse_args()
+    asyncio.run(main(args.days, args.pause))
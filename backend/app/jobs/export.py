@@ -0,0 +1,51 @@
+"""user / meet_post 전체를 파일이나 표준 출력으로 내보낸다.
+
+python -m app.jobs.export users --format csv --gzip -o users.csv.gz
+python -m app.jobs.export meet-posts > meet_posts.ndjson
+
+분석 작업에서 돌린다. API 의 /exports 와 같은 스트리밍 경로를 쓴다.
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+import time
+from contextlib import nullcontext
+from typing import BinaryIO
+
+from app.core.db import engine
+from app.service.export import CSV, EXPORTS, NDJSON, iter_export
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+async def main(args: argparse.Namespace, out: BinaryIO) -> None:
+    start = time.perf_counter()
+    size = 0
+    async for chunk in iter_export(
+        args.name, args.format, compress=args.gzip, batch_size=args.batch_size
+    ):
+        out.write(chunk)
+        size += len(chunk)
+    out.flush()
+    await engine.dispose()
+    logger.info(
+        f"Exported {args.name}: {size} bytes in {time.perf_counter() - start:.1f}s"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("name", choices=list(EXPORTS))
+    parser.add_argument("--format", choices=[NDJSON, CSV], default=NDJSON)
+    parser.add_argument("--gzip", action="store_true")
+    parser.add_argument("--batch-size", type=int)
+    parser.add_argument("-o", "--output")
+    args = parser.parse_args()
+    # 표준 출력은 닫지 않는다
+    with (
+        open(args.output, "wb") if args.output else nullcontext(sys.stdout.buffer)
+    ) as out:
+        asyncio.run(main(args, out))
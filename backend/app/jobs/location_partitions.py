@@ -0,0 +1,229 @@
+"""user_location_history 의 일 단위 파티션을 미리 만들고 보관 기간이 지난 파티션을 지운다.
+
+python -m app.jobs.location_partitions
+
+하루 한 번 CronJob 으로 돈다. 지난 파티션은 DELETE 대신 DETACH 후 DROP 하므로
+큰 테이블에서도 행 단위 삭제나 VACUUM 부담이 없다. 작업이 밀려 기본 파티션에
+들어간 행은 그날 파티션을 만들 때 옮긴다.
+"""
+
+import asyncio
+import logging
+import re
+from datetime import date, datetime, timedelta, timezone
+
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from app.core.config import settings
+from app.core.db import engine
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+TABLE = "user_location_history"
+# 여러 파드에서 동시에 돌지 않도록 잡는 advisory lock 키
+LOCK_KEY = 3_020_001
+# lock_timeout 에 걸렸을 때의 SQLSTATE (lock_not_available)
+LOCK_NOT_AVAILABLE = "55P03"
+
+
+def get_sqlstate(error: DBAPIError) -> str | None:
+    """psycopg 는 원래 예외에, asyncpg 는 그 원인 예외에 SQLSTATE 를 담는다."""
+    sqlstate = getattr(error.orig, "sqlstate", None)
+    if sqlstate is None and error.orig is not None:
+        sqlstate = getattr(error.orig.__cause__, "sqlstate", None)
+    return sqlstate
+
+
+def partition_name(day: date, table: str = TABLE) -> str:
+    return f"{table}_p{day:%Y%m%d}"
+
+
+def default_partition_name(table: str = TABLE) -> str:
+    return f"{table}_default"
+
+
+async def list_partitions(
+    connection: AsyncConnection, table: str = TABLE
+) -> dict[str, bool]:
+    """파티션 이름과 DETACH 가 끝나지 않은 상태인지 여부."""
+    result = await connection.execute(
+        text(
+            "SELECT c.relname, i.inhdetachpending FROM pg_inherits i "
+            "JOIN pg_class c ON c.oid = i.inhrelid "
+            "WHERE i.inhparent = CAST(:table AS regclass)"
+        ),
+        {"table": table},
+    )
+    return {name: detach_pending for name, detach_pending in result}
+
+
+async def ensure_partitions(
+    connection: AsyncConnection, today: date, days_ahead: int, table: str = TABLE
+) -> list[str]:
+    created = []
+    existing = await list_partitions(connection, table)
+    for offset in range(days_ahead + 1):
+        day = today + timedelta(days=offset)
+        name = partition_name(day, table)
+        if name in existing:
+            continue
+        start = datetime.combine(day, datetime.min.time(), timezone.utc)
+        end = start + timedelta(days=1)
+        bounds = f"FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+        default = default_partition_name(table)
+        if default in existing and await connection.scalar(
+            text(
+                f"SELECT EXISTS (SELECT 1 FROM {default} "
+                "WHERE recorded_at >= :start AND recorded_at < :end)"
+            ),
+            {"start": start, "end": end},
+        ):
+            await move_out_of_default(connection, name, bounds, start, end, table)
+        else:
+            await connection.execute(
+                text(
+                    f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF {table} "
+                    f"FOR VALUES {bounds}"
+                )
+            )
+        logger.info(f"Created partition {name}")
+        created.append(name)
+    return created
+
+
+async def move_out_of_default(
+    connection: AsyncConnection,
+    name: str,
+    bounds: str,
+    start: datetime,
+    end: datetime,
+    table: str = TABLE,
+) -> None:
+    """작업이 늦어 기본 파티션에 쌓인 그날 행을 새 파티션으로 옮겨 붙인다.
+
+    기본 파티션에 그 범위의 행이 있으면 바로 파티션을 만들 수 없다. 옮기는 동안
+    기본 파티션으로 가는 INSERT 만 잠깐 기다린다.
+    """
+    default = default_partition_name(table)
+    # connection 은 autocommit 이므로 한 트랜잭션으로 묶을 커넥션을 따로 연다
+    async with connection.engine.begin() as transaction:
+        await transaction.execute(
+            text(f"LOCK TABLE {default} IN ACCESS EXCLUSIVE MODE")
+        )
+        await transaction.execute(
+            text(
+                f"CREATE TABLE {name} "
+                f"(LIKE {table} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"
+            )
+        )
+        moved = await transaction.execute(
+            text(
+                f"WITH moved AS (DELETE FROM {default} "
+                "WHERE recorded_at >= :start AND recorded_at < :end RETURNING *) "
+                f"INSERT INTO {name} SELECT * FROM moved"
+            ),
+            {"start": start, "end": end},
+        )
+        await transaction.execute(
+            text(f"ALTER TABLE {table} ATTACH PARTITION {name} FOR VALUES {bounds}")
+        )
+    logger.warning(f"Moved {moved.rowcount} rows from {default} into {name}")
+
+
+async def drop_expired_partitions(
+    connection: AsyncConnection,
+    today: date,
+    retention_days: int,
+    table: str = TABLE,
+    lock_timeout_ms: int = 1000,
+) -> list[str]:
+    """보관 기간이 지난 파티션을 떼어 내 지운다.
+
+    기본 파티션이 있으면 DETACH CONCURRENTLY 를 쓸 수 없어 부모 테이블에
+    ACCESS EXCLUSIVE 잠금을 잡는다. 위치 기록을 오래 막지 않도록 lock_timeout 안에
+    잠금을 못 잡으면 그 파티션은 건너뛰고 다음 실행에서 다시 시도한다.
+    """
+    dropped = []
+    cutoff = today - timedelta(days=retention_days)
+    pattern = re.compile(rf"^{table}_p(\d{{8}})$")
+    partitions = await list_partitions(connection, table)
+    await connection.execute(text(f"SET lock_timeout = {int(lock_timeout_ms)}"))
+    try:
+        for name, detach_pending in sorted(partitions.items()):
+            match = pattern.match(name)
+            if match is None:
+                continue
+            day = datetime.strptime(match.group(1), "%Y%m%d").date()
+            if day >= cutoff:
+                continue
+            # 기본 파티션을 만들기 전 CONCURRENTLY 로 떼다 끊긴 파티션은 FINALIZE 로 마무리한다
+            mode = "FINALIZE" if detach_pending else ""
+            try:
+                await connection.execute(
+                    text(f"ALTER TABLE {table} DETACH PARTITION {name} {mode}")
+                )
+            except DBAPIError as e:
+                if get_sqlstate(e) != LOCK_NOT_AVAILABLE:
+                    raise
+                logger.warning(f"Could not detach {name}, retrying next run: {e.orig}")
+                continue
+            await connection.execute(text(f"DROP TABLE {name}"))
+            logger.info(f"Dropped partition {name}")
+            dropped.append(name)
+    finally:
+        await connection.execute(text("RESET lock_timeout"))
+
+    default = default_partition_name(table)
+    if default in partitions:
+        # 기본 파티션에 들어간 지난 행도 보관 기간이 지나면 지운다
+        await connection.execute(
+            text(f"DELETE FROM {default} WHERE recorded_at < :cutoff"),
+            {"cutoff": datetime.combine(cutoff, datetime.min.time(), timezone.utc)},
+        )
+    return dropped
+
+
+async def maintain_partitions(
+    connection: AsyncConnection,
+    today: date | None = None,
+    days_ahead: int | None = None,
+    retention_days: int | None = None,
+) -> tuple[list[str], list[str]]:
+    """connection 은 autocommit 이어야 한다. 파티션마다 바로 커밋해 잠금을 오래 잡지 않는다."""
+    if today is None:
+        today = datetime.now(timezone.utc).date()
+    if days_ahead is None:
+        days_ahead = settings.LOCATION_HISTORY_PREMAKE_DAYS
+    if retention_days is None:
+        retention_days = settings.LOCATION_HISTORY_RETENTION_DAYS
+
+    locked = await connection.scalar(
+        text("SELECT pg_try_advisory_lock(:key)"), {"key": LOCK_KEY}
+    )
+    if not locked:
+        logger.info("Another job is maintaining partitions, skipping")
+        return [], []
+    try:
+        created = await ensure_partitions(connection, today, days_ahead)
+        dropped = await drop_expired_partitions(connection, today, retention_days)
+    finally:
+        await connection.execute(
+            text("SELECT pg_advisory_unlock(:key)"), {"key": LOCK_KEY}
+        )
+    return created, dropped
+
+
+async def main() -> None:
+    logger.info("Maintaining location history partitions")
+    async with engine.connect() as connection:
+        connection = await connection.execution_options(isolation_level="AUTOCOMMIT")
+        created, dropped = await maintain_partitions(connection)
+    await engine.dispose()
+    logger.info(f"Created {len(created)} partitions, dropped {len(dropped)} partitions")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,32 @@
+"""모든 서버 워커에 피드 인덱스를 DB 에서 다시 채우라고 알린다.
+
+python -m app.jobs.rebuild_feed
+
+피드 인덱스는 워커 프로세스마다 메모리에 있으므로 이 명령은 직접 채우지 않고
+NOTIFY 로 요청만 보낸다. 워커는 LISTEN 연결이 (다시) 맺어질 때도 스스로 채운다.
+"""
+
+import asyncio
+import logging
+
+from sqlalchemy import text
+
+from app.core.db import engine
+from app.core.feed import FEED_COMMAND_CHANNEL
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+async def main() -> None:
+    async with engine.begin() as connection:
+        await connection.execute(
+            text("SELECT pg_notify(:channel, 'rebuild')"),
+            {"channel": FEED_COMMAND_CHANNEL},
+        )
+    await engine.dispose()
+    logger.info("Requested feed index rebuild")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,94 @@
+"""meet_post_stats 를 meet_post 에서 다시 센 값과 비교해 어긋난 버킷을 맞춘다.
+
+python -m app.jobs.reconcile_meet_post_stats [--days 7]
+
+트리거는 글과 같은 트랜잭션에서 카운터를 고치므로 평소에는 어긋나지 않는다.
+트리거를 거치지 않은 변경(TRUNCATE, 복구, 트리거를 끈 채 한 작업)을 하루 한 번
+CronJob 으로 바로잡는다.
+"""
+
+import argparse
+import asyncio
+import logging
+from datetime import date, datetime, timedelta, timezone
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from app.core.db import engine
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# 여러 파드에서 동시에 돌면 같은 차이를 두 번 더하게 된다
+LOCK_KEY = 3_020_002
+
+# 보관한 글도 통계에 남아 있으므로 meet_post_archive 까지 센다.
+# 한 문장 안에서 읽으므로 실제 개수와 카운터가 같은 스냅숏에서 비교된다.
+# 차이는 shard 0 에 더하기만 하므로 그사이 커밋된 트리거의 증감과 겹쳐도 맞다
+RECONCILE_SQL = """
+INSERT INTO meet_post_stats AS stats (day, type, fill_bucket, shard, count)
+SELECT day, type, fill_bucket, 0, coalesce(actual.count, 0) - coalesce(rollup.count, 0)
+FROM (
+    SELECT (created_at AT TIME ZONE 'UTC')::date AS day, type,
+        current_people * 4 / max_people AS fill_bucket, count(*) AS count
+    FROM (
+        SELECT type, current_people, max_people, created_at FROM meet_post
+        UNION ALL
+        SELECT type, current_people, max_people, created_at FROM meet_post_archive
+    ) AS post
+    WHERE created_at >= (CAST(:since AS date) AT TIME ZONE 'UTC')
+    GROUP BY 1, 2, 3
+) AS actual
+FULL JOIN (
+    SELECT day, type, fill_bucket, sum(count) AS count
+    FROM meet_post_stats
+    WHERE day >= :since
+    GROUP BY 1, 2, 3
+) AS rollup USING (day, type, fill_bucket)
+WHERE coalesce(actual.count, 0) <> coalesce(rollup.count, 0)
+ORDER BY day, type, fill_bucket
+ON CONFLICT (day, type, fill_bucket, shard)
+DO UPDATE SET count = stats.count + EXCLUDED.count
+RETURNING day, type, fill_bucket
+"""
+
+
+async def reconcile_stats(
+    connection: AsyncConnection, since: date = date.min
+) -> list[tuple[date, str, int]] | None:
+    """since 이후 날짜의 버킷을 맞추고 고친 버킷을 돌려준다. 다른 작업이 돌고 있으면 None."""
+    async with connection.begin():
+        locked = await connection.scalar(
+            text("SELECT pg_try_advisory_xact_lock(:key)"), {"key": LOCK_KEY}
+        )
+        if not locked:
+            logger.info("Another job is reconciling meet post stats, skipping")
+            return None
+        result = await connection.execute(text(RECONCILE_SQL), {"since": since})
+        fixed = [tuple(row) for row in result]
+        await connection.execute(
+            text("DELETE FROM meet_post_stats WHERE count = 0 AND day >= :since"),
+            {"since": since},
+        )
+    return fixed
+
+
+async def main(days: int | None) -> None:
+    since = date.min
+    if days is not None:
+        since = datetime.now(timezone.utc).date() - timedelta(days=days)
+    logger.info(f"Reconciling meet post stats since {since}")
+    async with engine.connect() as connection:
+        fixed = await reconcile_stats(connection, since)
+    await engine.dispose()
+    if fixed:
+        logger.warning(f"Fixed {len(fixed)} drifted buckets: {fixed[:10]}")
+    elif fixed is not None:
+        logger.info("No drift")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--days", type=int, help="최근 며칠만 맞춘다 (기본: 전체)")
+    asyncio.run(main(parser.parse_args().days))
@@ -1,19 +1,93 @@
-from fastapi import FastAPI
+import asyncio
+from contextlib import asynccontextmanager, suppress
+
+from fastapi import FastAPI, Request
+from fastapi.openapi.docs import (
+    get_redoc_html,
+    get_swagger_ui_html,
+    get_swagger_ui_oauth2_redirect_html,
+)
+from fastapi.responses import JSONResponse, PlainTextResponse
 from fastapi.routing import APIRoute
 from starlette.middleware.cors import CORSMiddleware
 
 from app.api.main import api_router
+from app.core.compression import CompressionMiddleware, PrecompressedDocument
 from app.core.config import settings
+from app.core.db import engine
+from app.core.load_shedding import (
+    LoadSheddingMiddleware,
+    create_route_limits,
+    render_metrics,
+)
+from app.core.feed import (
+    FEED_COMMAND_CHANNEL,
+    feed_index,
+    handle_feed_command,
+    schedule_feed_rebuild,
+)
+from app.core.pubsub import MEET_POST_CHANNEL, broker, listen_events
+from app.core.rate_limit import rate_limiters
+from app.core.rate_limit import render_metrics as render_rate_limit_metrics
+from app.utils.image import shutdown_executor
 
 
 def custom_generate_unique_id(route: APIRoute) -> str:
     return f"{route.tags[0]}-{route.name}"
 
 
+OPENAPI_URL = f"{settings.API_V1_STR}/openapi.json"
+
+
+def build_openapi_document(app: FastAPI) -> PrecompressedDocument:
+    return PrecompressedDocument(JSONResponse(app.openapi()).body, "application/json")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 첫 요청이 스키마 생성을 기다리지 않도록 시작할 때 만들어 둔다
+    app.state.openapi = build_openapi_document(app)
+    # 연결(재연결)할 때마다 피드 인덱스를 DB 에서 다시 채운다
+    listener = asyncio.create_task(
+        listen_events(
+            {
+                MEET_POST_CHANNEL: [
+                    broker.publish_meet_post_event,
+                    feed_index.apply_meet_post_event,
+                ],
+                FEED_COMMAND_CHANNEL: [handle_feed_command],
+            },
+            on_connect=schedule_feed_rebuild,
+        )
+    )
+    yield
+    # 진행 중인 요청이 모두 끝난 뒤에 호출된다
+    listener.cancel()
+    # LISTEN 커넥션을 닫고 끝날 때까지 기다린 뒤 엔진을 정리한다
+    with suppress(asyncio.CancelledError):
+        await listener
+    shutdown_executor()
+    await engine.dispose()
+
+
 app = FastAPI(
     title=settings.PROJECT_NAME,
-    openapi_url=f"{settings.API_V1_STR}/openapi.json",
+    # 문서는 아래에서 미리 압축해 둔 것으로 직접 서빙한다
+    openapi_url=None,
+    docs_url=None,
+    redoc_url=None,
     generate_unique_id_function=custom_generate_unique_id,
+    lifespan=lifespan,
+)
+
+# CORS 보다 안쪽에 둔다. preflight 는 제한하지 않고 503 응답에도 CORS 헤더가 붙는다
+route_limits = create_route_limits(settings.ROUTE_LIMITS)
+app.add_middleware(LoadSheddingMiddleware, limits=route_limits)
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=settings.COMPRESSION_MINIMUM_SIZE,
+    gzip_level=settings.COMPRESSION_GZIP_LEVEL,
+    brotli_quality=settings.COMPRESSION_BROTLI_QUALITY,
 )
 
 # Set all CORS enabled origins
@@ -29,3 +103,39 @@ if settings.BACKEND_CORS_ORIGINS:
     )
 
 app.include_router(api_router, prefix=settings.API_V1_STR)
+
+
+@app.get(
+    "/metrics",
+    tags=["metrics"],
+    include_in_schema=False,
+    response_class=PlainTextResponse,
+)
+async def metrics():
+    return render_metrics(route_limits) + render_rate_limit_metrics(rate_limiters)
+
+
+@app.get(OPENAPI_URL, tags=["docs"], include_in_schema=False)
+async def openapi(request: Request):
+    if not hasattr(app.state, "openapi"):
+        app.state.openapi = build_openapi_document(app)
+    return app.state.openapi.response(request)
+
+
+@app.get("/docs", tags=["docs"], include_in_schema=False)
+async def swagger_ui_html():
+    return get_swagger_ui_html(
+        openapi_url=OPENAPI_URL,
+        title=f"{app.title} - Swagger UI",
+        oauth2_redirect_url="/docs/oauth2-redirect",
+    )
+
+
+@app.get("/docs/oauth2-redirect", tags=["docs"], include_in_schema=False)
+async def swagger_ui_redirect():
+    return get_swagger_ui_oauth2_redirect_html()
+
+
+@app.get("/redoc", tags=["docs"], include_in_schema=False)
+async def redoc_html():
+    return get_redoc_html(openapi_url=OPENAPI_URL, title=f"{app.title} - ReDoc")
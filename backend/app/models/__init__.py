@@ -1,5 +1,6 @@
 from app.models.user import User
-from app.models.meet_post import MeetPost
+from app.models.meet_post import MeetPost, MeetPostParticipant
+from app.models.rate_limit import RateLimitBucket
 
 # 사용되지 않는 import 문제 해결
-__all__ = ["User", "MeetPost"]
+__all__ = ["User", "MeetPost", "MeetPostParticipant", "RateLimitBucket"]
@@ -1,13 +1,18 @@
 import uuid
 
 from sqlalchemy import (
+    BigInteger,
     Column,
+    Date,
     ForeignKey,
     String,
     Integer,
+    Float,
     DateTime,
     func,
     CheckConstraint,
+    Index,
+    SmallInteger,
 )
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
@@ -31,6 +36,11 @@ class MeetPost(Base):
     content = Column(String(200), nullable=False)
     page_view = Column(Integer, default=0)
     max_people = Column(Integer, default=0, nullable=False)
+    # 참여 인원 카운터. 참여/취소 시 조건부 UPDATE 로만 바꾼다
+    current_people = Column(Integer, default=0, server_default="0", nullable=False)
+    # 모임 장소. 지역별 구독/피드에 쓴다
+    lat = Column(Float, nullable=True)
+    lng = Column(Float, nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
     author = relationship("User", back_populates="meet_posts")
@@ -39,4 +49,81 @@ class MeetPost(Base):
         CheckConstraint(
             "max_people > 0 AND max_people <= 100", name="check_max_people"
         ),
+        CheckConstraint(
+            "current_people >= 0 AND current_people <= max_people",
+            name="check_current_people",
+        ),
+        # 피드 페이지를 최신순 키셋으로 읽는다
+        Index("ix_meet_post_created_at_id", "created_at", "id"),
+    )
+
+
+class MeetPostParticipant(Base):
+    __tablename__ = "meet_post_participant"
+
+    meet_post_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("meet_post.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    user_id = Column(
+        UUID(as_uuid=True), ForeignKey("user.id"), primary_key=True, index=True
+    )
+    joined_at = Column(DateTime(timezone=True), server_default=func.now())
+
+
+class MeetPostStats(Base):
+    """meet_post 트리거가 증감하는 집계 카운터. 한 버킷의 값은 shard 들의 합이다.
+
+    같은 버킷을 동시에 고치는 트랜잭션이 한 행에서 기다리지 않도록 버킷마다
+    여러 행(shard)에 나눠 더한다. 어긋난 값은 app.jobs.reconcile_meet_post_stats 가 맞춘다.
+    """
+
+    __tablename__ = "meet_post_stats"
+
+    # created_at 의 UTC 날짜
+    day = Column(Date, primary_key=True)
+    type = Column(String(20), primary_key=True)
+    # current_people * 4 // max_people. 0~3 은 25% 단위 모집 중, 4 는 마감
+    fill_bucket = Column(SmallInteger, primary_key=True)
+    shard = Column(SmallInteger, primary_key=True)
+    count = Column(BigInteger, nullable=False, server_default="0")
+
+
+class MeetPostArchive(Base):
+    """app.jobs.archive_meet_posts 가 meet_post 에서 옮긴 지난 글. 컬럼은 meet_post 와 같다."""
+
+    __tablename__ = "meet_post_archive"
+
+    id = Column(UUID(as_uuid=True), primary_key=True)
+    author_id = Column(UUID(as_uuid=True), ForeignKey("user.id"), nullable=False)
+    title = Column(String(20), nullable=False)
+    type = Column(String(20), nullable=False)
+    content = Column(String(200), nullable=False)
+    page_view = Column(Integer)
+    max_people = Column(Integer, nullable=False)
+    current_people = Column(Integer, nullable=False)
+    lat = Column(Float, nullable=True)
+    lng = Column(Float, nullable=True)
+    created_at = Column(DateTime(timezone=True))
+    archived_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    __table_args__ = (
+        Index("ix_meet_post_archive_author_id_created_at", "author_id", "created_at"),
+        # 통계 재집계가 날짜 범위로 읽는다
+        Index("ix_meet_post_archive_created_at", "created_at"),
+    )
+
+
+class MeetPostParticipantArchive(Base):
+    __tablename__ = "meet_post_participant_archive"
+
+    meet_post_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("meet_post_archive.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    user_id = Column(
+        UUID(as_uuid=True), ForeignKey("user.id"), primary_key=True, index=True
     )
+    joined_at = Column(DateTime(timezone=True))
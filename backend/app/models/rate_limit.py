@@ -0,0 +1,25 @@
+from sqlalchemy import Column, DateTime, Float, Index, String
+
+from app.core.db import Base
+
+
+class RateLimitBucket(Base):
+    """RATE_LIMIT_BACKEND=postgres 일 때 파드들이 함께 쓰는 토큰 버킷.
+
+    잃어도 다시 가득 찬 버킷에서 시작할 뿐이므로 UNLOGGED 로 만들어 WAL 을 쓰지 않는다.
+    토큰은 rate_limit_take() 함수 안에서만 고친다.
+    """
+
+    __tablename__ = "rate_limit_bucket"
+
+    # "<규칙 이름>:<IP 또는 이메일>"
+    key = Column(String(320), primary_key=True)
+    tokens = Column(Float, nullable=False)
+    updated_at = Column(DateTime(timezone=True), nullable=False)
+    # 이 시각이 지나면 버킷이 다시 가득 차 행이 없는 것과 같다
+    expires_at = Column(DateTime(timezone=True), nullable=False)
+
+    __table_args__ = (
+        Index("ix_rate_limit_bucket_expires_at", "expires_at"),
+        {"prefixes": ["UNLOGGED"]},
+    )
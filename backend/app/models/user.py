@@ -1,11 +1,23 @@
 import enum
 import uuid
+from typing import Optional
 from fastapi_users.db import SQLAlchemyBaseUserTableUUID
-from sqlalchemy import Column, String, DateTime, Enum, Float, ForeignKey
+from sqlalchemy import (
+    Column,
+    String,
+    DateTime,
+    Enum,
+    Float,
+    ForeignKey,
+    Index,
+    PrimaryKeyConstraint,
+    func,
+    text,
+)
 from sqlalchemy.dialects.postgresql import UUID
 from datetime import datetime
 
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.db import Base
 
@@ -22,20 +34,48 @@ class User(SQLAlchemyBaseUserTableUUID, Base):
 
     name = Column(String, nullable=False)
     gender: Column[GenderEnum] = Column(Enum(GenderEnum), nullable=False)
-    profile = Column(String, nullable=True)
+    profile: Mapped[Optional[str]] = mapped_column(String, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow)
 
     # 관계 설정
-    meet_post = relationship("MeetPost", back_populates="author")
+    meet_posts = relationship("MeetPost", back_populates="author")
 
+    # fastapi-users 는 lower(email) 로 사용자를 찾는다
+    __table_args__ = (Index("ix_user_email_lower", text("lower(email)")),)
 
-# UserLocation 모델 정의
+
+# UserLocation 모델 정의 (사용자별 최신 위치 한 행)
 class UserLocation(Base):
     __tablename__ = "user_location"  # 테이블 이름 지정
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
     user_id = Column(
-        UUID(as_uuid=True), ForeignKey("user.id"), nullable=False, index=True
+        UUID(as_uuid=True),
+        ForeignKey("user.id"),
+        nullable=False,
+        index=True,
+        unique=True,
     )
     lat = Column(Float, nullable=False)
     lng = Column(Float, nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now())
+
+
+# UserLocationHistory 모델 정의 (recorded_at 기준 일 단위 파티션)
+class UserLocationHistory(Base):
+    __tablename__ = "user_location_history"
+
+    id = Column(UUID(as_uuid=True), default=uuid.uuid4, nullable=False)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("user.id"), nullable=False)
+    lat = Column(Float, nullable=False)
+    lng = Column(Float, nullable=False)
+    recorded_at = Column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+
+    __table_args__ = (
+        # 파티션 키가 기본 키에 포함되어야 한다
+        PrimaryKeyConstraint("id", "recorded_at"),
+        Index("ix_user_location_history_user_id_recorded_at", "user_id", "recorded_at"),
+        {"postgresql_partition_by": "RANGE (recorded_at)"},
+    )
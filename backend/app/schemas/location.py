@@ -0,0 +1,25 @@
+from datetime import datetime
+from typing import Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class LocationUpdate(BaseModel):
+    lat: float = Field(ge=-90, le=90)
+    lng: float = Field(ge=-180, le=180)
+
+
+class LocationRead(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    lat: float
+    lng: float
+    updated_at: Optional[datetime] = None
+
+
+class LocationHistoryRead(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    lat: float
+    lng: float
+    recorded_at: datetime
@@ -0,0 +1,52 @@
+import uuid
+from datetime import date, datetime
+from typing import Optional
+
+from pydantic import BaseModel, ConfigDict
+
+
+class MeetPostRead(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: uuid.UUID
+    author_id: uuid.UUID
+    title: str
+    type: str
+    content: str
+    page_view: Optional[int] = None
+    max_people: int
+    current_people: int
+    lat: Optional[float] = None
+    lng: Optional[float] = None
+    created_at: Optional[datetime] = None
+
+
+class MeetPostArchiveRead(MeetPostRead):
+    archived_at: Optional[datetime] = None
+
+
+class ParticipationRead(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: uuid.UUID
+    max_people: int
+    current_people: int
+
+
+class FeedItemRead(MeetPostRead):
+    distance_km: float
+
+
+class FeedPage(BaseModel):
+    items: list[FeedItemRead]
+    next_cursor: Optional[str] = None
+
+
+class MeetPostStatsRead(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    day: date
+    type: str
+    # 0~3 은 모집 중(25% 단위 참여율), 4 는 마감
+    fill_bucket: int
+    count: int
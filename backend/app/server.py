@@ -0,0 +1,72 @@
+import logging
+from typing import Any
+
+from gunicorn.app.base import BaseApplication
+from uvicorn.workers import UvicornWorker
+
+from app.core.config import settings
+from app.core.workers import RESERVED_CONNECTIONS, get_pool_size, get_worker_count
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# lifespan shutdown(풀 정리)에 남겨 둘 시간
+SHUTDOWN_MARGIN_SECONDS = 5
+
+
+class Worker(UvicornWorker):
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        # 진행 중인 요청을 기다리다 마스터에게 SIGKILL 당하기 전에 종료 처리를 끝낸다
+        self.config.timeout_graceful_shutdown = max(
+            self.cfg.graceful_timeout - SHUTDOWN_MARGIN_SECONDS, 1
+        )
+
+
+def post_fork(server: Any, worker: Any) -> None:
+    # preload 로 마스터에서 만들어진 커넥션을 워커가 공유하지 않도록 풀을 버린다
+    from app.core.db import engine
+
+    engine.sync_engine.dispose(close=False)
+
+
+class Server(BaseApplication):
+    def __init__(self, options: dict[str, Any]):
+        self.options = options
+        super().__init__()
+
+    def load_config(self) -> None:
+        for key, value in self.options.items():
+            self.cfg.set(key, value)
+
+    def load(self) -> Any:
+        from app.main import app
+
+        return app
+
+
+def get_options(workers: int) -> dict[str, Any]:
+    return {
+        "bind": f"{settings.HOST}:{settings.PORT}",
+        "workers": workers,
+        "worker_class": "app.server.Worker",
+        "preload_app": True,
+        "graceful_timeout": settings.GRACEFUL_TIMEOUT,
+        "keepalive": settings.KEEP_ALIVE,
+        "post_fork": post_fork,
+        "accesslog": "-",
+        "errorlog": "-",
+    }
+
+
+def main() -> None:
+    workers = get_worker_count()
+    # app 을 preload 하기 전에 채워 둬야 db 모듈이 풀 크기를 나눠 잡는다
+    settings.WEB_CONCURRENCY = workers
+    pool_size = get_pool_size(workers, reserved=RESERVED_CONNECTIONS)
+    logger.info(f"Starting {workers} workers with pool_size={pool_size} each")
+    Server(get_options(workers)).run()
+
+
+if __name__ == "__main__":
+    main()
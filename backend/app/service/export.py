@@ -0,0 +1,112 @@
+"""user / meet_post 전체를 NDJSON 이나 CSV 로 내보낸다.
+
+서버 쪽 커서에서 batch_size 행씩 받아 바로 직렬화하므로 테이블 크기와 상관없이
+메모리에는 한 배치만 올라간다. ORM 객체 대신 컬럼 튜플을 읽어 identity map 에도
+쌓이지 않는다.
+"""
+
+import csv
+import enum
+import io
+import json
+import uuid
+import zlib
+from collections.abc import AsyncIterator, Sequence
+from datetime import date, datetime
+from typing import Any
+
+from sqlalchemy import Row, select
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.core.config import settings
+from app.core.db import engine as default_engine
+from app.models.meet_post import MeetPost, MeetPostArchive
+from app.models.user import User
+
+NDJSON = "ndjson"
+CSV = "csv"
+MEDIA_TYPES = {NDJSON: "application/x-ndjson", CSV: "text/csv"}
+
+EXPORTS: dict[str, tuple[Any, ...]] = {
+    # 비밀번호 해시는 내보내지 않는다
+    "users": (
+        User.id,
+        User.email,
+        User.name,
+        User.gender,
+        User.profile,
+        User.is_active,
+        User.is_superuser,
+        User.is_verified,
+        User.created_at,
+    ),
+    "meet-posts": tuple(MeetPost.__table__.columns),
+    "meet-posts-archive": tuple(MeetPostArchive.__table__.columns),
+}
+
+
+def _plain(value: Any) -> Any:
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    return value
+
+
+def to_ndjson(rows: Sequence[Row]) -> bytes:
+    return "".join(
+        json.dumps(row._asdict(), default=_plain, ensure_ascii=False) + "\n"
+        for row in rows
+    ).encode()
+
+
+def to_csv(rows: Sequence[Sequence[Any]]) -> bytes:
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows([_plain(value) for value in row] for row in rows)
+    return buffer.getvalue().encode()
+
+
+def get_filename(name: str, format_: str, compress: bool) -> str:
+    return f"{name}.{format_}.gz" if compress else f"{name}.{format_}"
+
+
+async def iter_batches(
+    name: str, batch_size: int, engine: AsyncEngine = default_engine
+) -> AsyncIterator[Sequence[Row]]:
+    async with engine.connect() as connection:
+        # stream 은 서버 쪽 커서를 열고 yield_per 행씩 가져온다
+        result = await connection.stream(
+            select(*EXPORTS[name]).execution_options(yield_per=batch_size)
+        )
+        async for rows in result.partitions():
+            yield rows
+
+
+async def iter_export(
+    name: str,
+    format_: str = NDJSON,
+    *,
+    compress: bool = False,
+    batch_size: int | None = None,
+    engine: AsyncEngine = default_engine,
+) -> AsyncIterator[bytes]:
+    """배치마다 직렬화한 바이트 덩어리를 내놓는다. compress 면 gzip 스트림이다."""
+    if batch_size is None:
+        batch_size = settings.EXPORT_BATCH_SIZE
+    serialize = to_csv if format_ == CSV else to_ndjson
+    # wbits=31 이면 zlib 대신 gzip 헤더를 붙인다
+    compressor = zlib.compressobj(wbits=31) if compress else None
+
+    def encode(data: bytes) -> bytes:
+        return compressor.compress(data) if compressor is not None else data
+
+    if format_ == CSV:
+        yield encode(to_csv([[column.key for column in EXPORTS[name]]]))
+    async for rows in iter_batches(name, batch_size, engine):
+        chunk = encode(serialize(rows))
+        if chunk:
+            yield chunk
+    if compressor is not None:
+        yield compressor.flush()
@@ -0,0 +1,50 @@
+from collections.abc import AsyncIterator
+from pathlib import Path
+
+from app.core.config import settings
+from app.core.storage import get_path, save_stream
+from app.utils.image import resize_image_in_pool
+
+PROFILE = "profile"
+THUMBNAIL = "profile-thumbnail"
+VARIANTS = (PROFILE, THUMBNAIL)
+
+
+class ProfileImageService:
+    def __init__(self, max_bytes: int, size: int, thumbnail_size: int):
+        self.max_bytes = max_bytes
+        self.size = size
+        self.thumbnail_size = thumbnail_size
+
+    def get_path(self, key: str, variant: str = PROFILE) -> Path:
+        return get_path(key, variant)
+
+    def exists(self, key: str) -> bool:
+        return all(self.get_path(key, variant).exists() for variant in VARIANTS)
+
+    async def save(self, chunks: AsyncIterator[bytes]) -> str:
+        """업로드를 저장하고 내용 키(원본의 sha256)를 돌려준다.
+
+        같은 이미지가 이미 있으면 다시 리사이즈하지 않고 같은 키를 돌려준다.
+        """
+        key, tmp_path = await save_stream(chunks, self.max_bytes)
+        try:
+            if not self.exists(key):
+                await resize_image_in_pool(
+                    tmp_path,
+                    [
+                        (self.get_path(key, PROFILE), self.size),
+                        (self.get_path(key, THUMBNAIL), self.thumbnail_size),
+                    ],
+                )
+        finally:
+            tmp_path.unlink(missing_ok=True)
+        return key
+
+
+def get_profile_image_service() -> ProfileImageService:
+    return ProfileImageService(
+        max_bytes=settings.PROFILE_IMAGE_MAX_BYTES,
+        size=settings.PROFILE_IMAGE_SIZE,
+        thumbnail_size=settings.PROFILE_THUMBNAIL_SIZE,
+    )
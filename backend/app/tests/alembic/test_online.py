@@ -0,0 +1,144 @@
+from unittest import TestCase
+
+from alembic.migration import MigrationContext
+from alembic.operations import Operations
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+
+from app.alembic.online import create_index_concurrently, run_backfill
+from app.core.config import settings
+
+TABLE = "online_migration_test"
+
+
+class OnlineMigrationTestCase(TestCase):
+    def setUp(self):
+        self.engine = create_engine(
+            str(settings.SQLALCHEMY_DATABASE_URI), isolation_level="AUTOCOMMIT"
+        )
+        self.addCleanup(self.engine.dispose)
+        try:
+            self.connection = self.engine.connect()
+        except OperationalError:
+            self.skipTest("database is not available")
+        self.addCleanup(self.connection.close)
+        self.drop_table()
+
+        self.connection.execute(
+            text(f"CREATE TABLE {TABLE} (id int PRIMARY KEY, value int, doubled int)")
+        )
+        self.connection.execute(
+            text(
+                f"INSERT INTO {TABLE} (id, value) "
+                "SELECT i, i FROM generate_series(1, 2500) AS i"
+            )
+        )
+        self.addCleanup(self.drop_table)
+
+    def drop_table(self):
+        with self.engine.connect() as connection:
+            connection.execute(text(f"DROP TABLE IF EXISTS {TABLE}"))
+
+    def backfill(self, **kw):
+        return run_backfill(
+            self.connection,
+            TABLE,
+            set_sql="doubled = value * 2",
+            where_sql="doubled IS NULL",
+            batch_size=1000,
+            sleep_seconds=0,
+            **kw,
+        )
+
+    def remaining(self) -> int:
+        return self.connection.scalar(
+            text(
+                f"SELECT count(*) FROM {TABLE} WHERE doubled IS DISTINCT FROM value * 2"
+            )
+        )
+
+
+class TestRunBackfill(OnlineMigrationTestCase):
+    def test_backfills_in_batches(self):
+        progress = self.backfill()
+
+        self.assertEqual(progress.total, 2500)
+        self.assertEqual(progress.done, 2500)
+        self.assertEqual(progress.batches, 3)
+        self.assertEqual(self.remaining(), 0)
+
+    def test_resumes_after_interruption(self):
+        self.connection.execute(
+            text(f"UPDATE {TABLE} SET doubled = value * 2 WHERE id <= 1200")
+        )
+
+        progress = self.backfill()
+
+        self.assertEqual(progress.total, 1300)
+        self.assertEqual(progress.done, 1300)
+        self.assertEqual(self.remaining(), 0)
+
+    def test_gives_up_on_locked_rows(self):
+        with self.engine.connect() as other:
+            # 다른 트랜잭션이 행을 잡고 있으면 lock_timeout 뒤 재시도하다 포기한다
+            transaction = other.execution_options(
+                isolation_level="READ COMMITTED"
+            ).begin()
+            other.execute(text(f"SELECT * FROM {TABLE} WHERE id = 1 FOR UPDATE"))
+            with self.assertRaises(OperationalError):
+                self.backfill(lock_timeout_ms=50, max_retries=1)
+            transaction.rollback()
+
+        self.assertEqual(self.remaining(), 2500)
+        self.assertEqual(self.backfill().done, 2500)
+        # 세션 설정을 되돌려 놓는다
+        self.assertEqual(
+            self.connection.scalar(text("SHOW lock_timeout")),
+            self.connection.scalar(
+                text("SELECT reset_val FROM pg_settings WHERE name = 'lock_timeout'")
+            ),
+        )
+
+
+class TestCreateIndexConcurrently(OnlineMigrationTestCase):
+    def index_is_valid(self):
+        return self.connection.scalar(
+            text(
+                "SELECT i.indisvalid FROM pg_index i "
+                "JOIN pg_class c ON c.oid = i.indexrelid "
+                f"WHERE c.relname = 'ix_{TABLE}_value'"
+            )
+        )
+
+    def create_index(self):
+        # env.py 처럼 마이그레이션 트랜잭션 안에서 실행한다
+        self.connection.commit()
+        migration_context = MigrationContext.configure(self.connection)
+        with (
+            migration_context.begin_transaction(),
+            Operations.context(migration_context),
+        ):
+            create_index_concurrently(f"ix_{TABLE}_value", TABLE, ["value"])
+
+    def test_creates_index_idempotently(self):
+        self.create_index()
+        self.assertTrue(self.index_is_valid())
+
+        self.create_index()
+        self.assertTrue(self.index_is_valid())
+
+    def test_rebuilds_invalid_index(self):
+        self.connection.execute(
+            text(f"CREATE INDEX ix_{TABLE}_value ON {TABLE} (value)")
+        )
+        # CONCURRENTLY 빌드가 중간에 실패해 INVALID 로 남은 상태를 흉내 낸다
+        self.connection.execute(
+            text(
+                "UPDATE pg_index SET indisvalid = false "
+                f"WHERE indexrelid = 'ix_{TABLE}_value'::regclass"
+            )
+        )
+        self.assertFalse(self.index_is_valid())
+
+        self.create_index()
+        self.assertTrue(self.index_is_valid())
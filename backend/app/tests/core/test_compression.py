@@ -0,0 +1,144 @@
+import gzip
+import json
+import unittest
+from unittest import TestCase
+
+import brotli
+import httpx
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response, StreamingResponse
+from starlette.routing import Route
+
+from app.core.compression import (
+    BROTLI,
+    GZIP,
+    IDENTITY,
+    CompressionMiddleware,
+    PrecompressedDocument,
+    choose_encoding,
+)
+
+ITEMS = [{"id": i, "title": "같이 밥 먹을 사람"} for i in range(200)]
+
+
+async def large(request):
+    return JSONResponse(ITEMS)
+
+
+async def small(request):
+    return JSONResponse({"ok": True})
+
+
+async def image(request):
+    return Response(b"\x89PNG" + b"\x00" * 4096, media_type="image/png")
+
+
+async def stream(request):
+    async def chunks():
+        for item in ITEMS:
+            yield json.dumps(item).encode() + b"\n"
+
+    return StreamingResponse(chunks(), media_type="application/x-ndjson")
+
+
+async def encoded(request):
+    body = gzip.compress(b"x" * 4096)
+    return Response(body, media_type="text/plain", headers={"Content-Encoding": "gzip"})
+
+
+DOCUMENT = PrecompressedDocument(json.dumps(ITEMS).encode(), "application/json")
+
+
+async def document(request: Request):
+    return DOCUMENT.response(request)
+
+
+app = CompressionMiddleware(
+    Starlette(
+        routes=[
+            Route("/large", large),
+            Route("/small", small),
+            Route("/image", image),
+            Route("/stream", stream),
+            Route("/encoded", encoded),
+            Route("/document", document),
+        ]
+    ),
+    minimum_size=1024,
+)
+
+
+class TestChooseEncoding(TestCase):
+    def test_choose_encoding(self):
+        self.assertEqual(choose_encoding("gzip, deflate, br"), BROTLI)
+        self.assertEqual(choose_encoding("gzip"), GZIP)
+        self.assertEqual(choose_encoding("br;q=0.5, gzip;q=0.8"), GZIP)
+        self.assertEqual(choose_encoding("*"), BROTLI)
+        self.assertEqual(choose_encoding("*;q=0.1, br;q=0"), GZIP)
+        self.assertEqual(choose_encoding("deflate"), IDENTITY)
+        self.assertEqual(choose_encoding(""), IDENTITY)
+
+
+class TestCompressionMiddleware(unittest.IsolatedAsyncioTestCase):
+    async def get(self, path: str, accept_encoding: str, **headers):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://test"
+        ) as client:
+            return await client.get(
+                path, headers={"Accept-Encoding": accept_encoding, **headers}
+            )
+
+    async def test_compresses_large_responses(self):
+        for encoding in (BROTLI, GZIP):
+            response = await self.get("/large", encoding)
+            self.assertEqual(response.headers["content-encoding"], encoding)
+            self.assertEqual(response.headers["vary"], "Accept-Encoding")
+            self.assertLess(
+                int(response.headers["content-length"]), len(json.dumps(ITEMS))
+            )
+            self.assertEqual(response.json(), ITEMS)
+
+    async def test_skips_small_and_incompressible_responses(self):
+        response = await self.get("/small", "br")
+        self.assertNotIn("content-encoding", response.headers)
+        self.assertEqual(response.json(), {"ok": True})
+
+        response = await self.get("/image", "br")
+        self.assertNotIn("content-encoding", response.headers)
+        self.assertEqual(len(response.content), 4100)
+
+        response = await self.get("/large", "identity")
+        self.assertNotIn("content-encoding", response.headers)
+
+        # 이미 압축된 응답을 두 번 압축하지 않는다
+        response = await self.get("/encoded", "br")
+        self.assertEqual(response.headers["content-encoding"], "gzip")
+        self.assertEqual(response.content, b"x" * 4096)
+
+    async def test_compresses_streaming_responses(self):
+        response = await self.get("/stream", "br")
+        self.assertEqual(response.headers["content-encoding"], BROTLI)
+        self.assertNotIn("content-length", response.headers)
+        lines = response.content.decode().splitlines()
+        self.assertEqual([json.loads(line) for line in lines], ITEMS)
+
+    async def test_precompressed_document(self):
+        response = await self.get("/document", "gzip, br")
+        self.assertEqual(response.headers["content-encoding"], BROTLI)
+        self.assertEqual(response.json(), ITEMS)
+        self.assertEqual(
+            brotli.decompress(DOCUMENT.bodies[BROTLI]), DOCUMENT.bodies[IDENTITY]
+        )
+
+        etag = response.headers["etag"]
+        response = await self.get("/document", "gzip, br", **{"If-None-Match": etag})
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b"")
+
+        # 인코딩이 다르면 ETag 도 달라 본문을 다시 받는다
+        response = await self.get("/document", "gzip", **{"If-None-Match": etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers["content-encoding"], GZIP)
+        self.assertNotEqual(response.headers["etag"], etag)
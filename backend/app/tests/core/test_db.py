@@ -0,0 +1,66 @@
+import unittest
+from unittest import TestCase
+
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+from app.core.db import create_engine, get_connect_args
+
+
+class TestGetConnectArgs(TestCase):
+    def test_asyncpg_caches_statements(self):
+        self.assertEqual(
+            get_connect_args("asyncpg", 200, transaction_pooler=False),
+            {"prepared_statement_cache_size": 200},
+        )
+
+    def test_asyncpg_behind_transaction_pooler(self):
+        connect_args = get_connect_args("asyncpg", 200, transaction_pooler=True)
+
+        self.assertEqual(connect_args["statement_cache_size"], 0)
+        self.assertEqual(connect_args["prepared_statement_cache_size"], 0)
+        # 풀러가 서버 커넥션을 나눠 주므로 문장 이름이 겹치면 안 된다
+        name_func = connect_args["prepared_statement_name_func"]
+        self.assertNotEqual(name_func(), name_func())
+
+    def test_psycopg(self):
+        self.assertEqual(get_connect_args("psycopg", 200, transaction_pooler=False), {})
+        self.assertEqual(
+            get_connect_args("psycopg", 200, transaction_pooler=True),
+            {"prepare_threshold": None},
+        )
+
+
+class TestCreateEngine(unittest.IsolatedAsyncioTestCase):
+    async def check_engine(self, driver: str, transaction_pooler: bool) -> None:
+        engine = create_engine(driver, transaction_pooler=transaction_pooler)
+        self.addAsyncCleanup(engine.dispose)
+        try:
+            async with engine.connect() as connection:
+                for _ in range(10):
+                    value = await connection.scalar(
+                        text("SELECT CAST(:value AS int)"), {"value": 1}
+                    )
+                    self.assertEqual(value, 1)
+                prepared = await connection.scalar(
+                    text("SELECT count(*) FROM pg_prepared_statements")
+                )
+        except (OSError, OperationalError):
+            self.skipTest("database is not available")
+        if transaction_pooler:
+            # 지금 실행 중인 문장 말고는 서버에 남겨 두지 않는다
+            self.assertLessEqual(prepared, 1)
+        else:
+            self.assertGreater(prepared, 0)
+
+    async def test_asyncpg(self):
+        await self.check_engine("asyncpg", transaction_pooler=False)
+
+    async def test_asyncpg_behind_transaction_pooler(self):
+        await self.check_engine("asyncpg", transaction_pooler=True)
+
+    async def test_psycopg(self):
+        await self.check_engine("psycopg", transaction_pooler=False)
+
+    async def test_psycopg_behind_transaction_pooler(self):
+        await self.check_engine("psycopg", transaction_pooler=True)
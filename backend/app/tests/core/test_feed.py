@@ -0,0 +1,199 @@
+import json
+import random
+import time
+import uuid
+from datetime import datetime, timezone
+from unittest import TestCase
+
+from app.core.feed import FeedEntry, FeedIndex, parse_cursor, parse_timestamp
+from app.utils.geo import distance_km, get_cell, get_nearby_cells
+
+# 호서대 아산캠퍼스 근처
+LAT, LNG = 36.7365, 127.0741
+
+
+def make_index(**kwargs) -> FeedIndex:
+    options = dict(
+        cell_capacity=1000,
+        max_cells=1000,
+        ttl_seconds=86400,
+        seconds_per_km=600,
+        user_cache_size=10,
+        user_location_ttl=60,
+    )
+    options.update(kwargs)
+    return FeedIndex(**options)
+
+
+def make_entry(lat=LAT, lng=LNG, age=0.0, type_="taxi", id_=None) -> FeedEntry:
+    return FeedEntry(
+        id=id_ or str(uuid.uuid4()),
+        type=type_,
+        lat=lat,
+        lng=lng,
+        created_at=time.time() - age,
+    )
+
+
+def make_event(event: str, entry: FeedEntry) -> dict:
+    return {
+        "event": event,
+        "id": entry.id,
+        "type": entry.type,
+        "lat": entry.lat,
+        "lng": entry.lng,
+        "created_at": datetime.fromtimestamp(
+            entry.created_at, timezone.utc
+        ).isoformat(),
+    }
+
+
+class TestFeedIndex(TestCase):
+    def setUp(self):
+        rng = random.Random(7)
+        self.index = make_index()
+        self.entries = [
+            make_entry(
+                lat=LAT + rng.uniform(-0.02, 0.02),
+                lng=LNG + rng.uniform(-0.02, 0.02),
+                age=rng.uniform(0, 7200),
+                type_=rng.choice(["taxi", "meal"]),
+            )
+            for _ in range(300)
+        ]
+        for entry in self.entries:
+            self.index.add(entry)
+
+    def brute_force(self, lat, lng, type_=None):
+        # 주변 칸 밖의 글은 애초에 후보가 아니다
+        cells = set(get_nearby_cells(lat, lng, 1))
+        ranked = []
+        for entry in self.entries:
+            if type_ is not None and entry.type != type_:
+                continue
+            if get_cell(entry.lat, entry.lng) not in cells:
+                continue
+            distance = distance_km(lat, lng, entry.lat, entry.lng)
+            ranked.append((distance * 600 - entry.created_at, entry.id))
+        return [id_ for _, id_ in sorted(ranked)]
+
+    def test_page_matches_brute_force(self):
+        for type_ in (None, "taxi"):
+            items = self.index.page(LAT, LNG, type_=type_, limit=20)
+            expected = self.brute_force(LAT, LNG, type_)[:20]
+            self.assertEqual([str(item.id) for item in items], expected)
+
+    def test_cursor_pagination_covers_everything_once(self):
+        seen = []
+        after = None
+        while True:
+            items = self.index.page(LAT, LNG, limit=7, after=after)
+            seen += [str(item.id) for item in items]
+            if len(items) < 7:
+                break
+            after = parse_cursor(items[-1].cursor)
+        self.assertEqual(seen, self.brute_force(LAT, LNG))
+
+    def test_parse_cursor_rejects_garbage(self):
+        with self.assertRaises(ValueError):
+            parse_cursor("abc")
+
+    def test_parse_postgres_timestamps(self):
+        # json_build_object 가 실제로 내보내는 형식. 소수 초 자릿수가 들쭉날쭉하다
+        expected = datetime(2026, 10, 19, 18, 27, 19, tzinfo=timezone.utc).timestamp()
+        self.assertEqual(parse_timestamp("2026-10-19T18:27:19+00:00"), expected)
+        self.assertAlmostEqual(
+            parse_timestamp("2026-10-19T18:27:19.8+00:00"), expected + 0.8
+        )
+        self.assertAlmostEqual(
+            parse_timestamp("2026-10-19T18:27:19.85634+00:00"), expected + 0.85634
+        )
+        self.assertAlmostEqual(
+            parse_timestamp("2026-10-20T03:27:19.856341+09:00"), expected + 0.856341
+        )
+
+        entry = make_entry()
+        event = make_event("created", entry)
+        event["created_at"] = "2026-10-19T18:27:19.85634+00:00"
+        index = make_index(ttl_seconds=10**10)
+        index.apply_meet_post_event(json.dumps(event))
+        self.assertEqual(index.entry_count, 1)
+
+    def test_expired_posts_are_skipped_and_pruned(self):
+        index = make_index(ttl_seconds=60)
+        fresh = make_entry()
+        stale = make_entry(age=30)
+        index.add(fresh)
+        index.add(stale)
+        index.ttl_seconds = 10
+
+        items = index.page(LAT, LNG)
+        self.assertEqual([str(item.id) for item in items], [fresh.id])
+        self.assertEqual(index.entry_count, 1)
+
+    def test_cell_capacity_keeps_newest(self):
+        index = make_index(cell_capacity=3)
+        entries = [make_entry(age=age) for age in range(5)]
+        for entry in entries:
+            index.add(entry)
+        items = index.page(LAT, LNG)
+        self.assertEqual(
+            [str(item.id) for item in items], [entry.id for entry in entries[:3]]
+        )
+        self.assertEqual(index.entry_count, 3)
+
+    def test_max_cells_evicts_least_recently_updated(self):
+        index = make_index(max_cells=2)
+        first = make_entry(lat=LAT)
+        second = make_entry(lat=LAT + 1)
+        third = make_entry(lat=LAT + 2)
+        for entry in (first, second, third):
+            index.add(entry)
+        self.assertEqual(index.cell_count, 2)
+        self.assertEqual(index.page(LAT, LNG), [])
+        self.assertEqual(len(index.page(LAT + 2, LNG)), 1)
+
+    def test_events_move_and_delete_posts(self):
+        index = make_index()
+        entry = make_entry()
+        index.apply_meet_post_event(json.dumps(make_event("created", entry)))
+        self.assertEqual(len(index.page(LAT, LNG)), 1)
+
+        entry.lat += 1
+        index.apply_event(make_event("updated", entry))
+        self.assertEqual(index.page(LAT, LNG), [])
+        self.assertEqual(len(index.page(LAT + 1, LNG)), 1)
+
+        index.apply_event(make_event("deleted", entry))
+        self.assertEqual(index.entry_count, 0)
+        # 이미 빠진 글의 인원 변화로 글이 되살아나지 않는다
+        index.apply_event(make_event("joined", entry))
+        self.assertEqual(index.entry_count, 0)
+
+    def test_rebuild_replays_pending_events(self):
+        index = make_index()
+        kept = make_entry()
+        deleted = make_entry()
+        created = make_entry()
+
+        index.start_rebuild()
+        # 스냅숏을 읽는 동안 도착한 이벤트
+        index.apply_event(make_event("deleted", deleted))
+        index.apply_event(make_event("created", created))
+        index.finish_rebuild([kept, deleted])
+
+        ids = {str(item.id) for item in index.page(LAT, LNG)}
+        self.assertEqual(ids, {kept.id, created.id})
+
+    def test_user_location_cache(self):
+        index = make_index(user_cache_size=1, user_location_ttl=60)
+        first, second = uuid.uuid4(), uuid.uuid4()
+        index.update_user_location(first, LAT, LNG)
+        self.assertEqual(index.get_user_location(first), (LAT, LNG))
+
+        index.update_user_location(second, LAT, LNG)
+        self.assertIsNone(index.get_user_location(first))
+
+        index.user_location_ttl = -1
+        index.update_user_location(second, LAT, LNG)
+        self.assertIsNone(index.get_user_location(second))
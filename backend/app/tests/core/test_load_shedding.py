@@ -0,0 +1,141 @@
+import asyncio
+import unittest
+from unittest import TestCase
+
+import httpx
+from starlette.applications import Starlette
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+
+from app.core.load_shedding import (
+    ARCHIVE,
+    AUTH_READ,
+    AUTH_WRITE,
+    EXPORT,
+    FEED,
+    WEBSOCKET,
+    LoadSheddingMiddleware,
+    OverloadedError,
+    RouteLimit,
+    classify_route,
+    render_metrics,
+)
+
+
+class TestRouteLimit(unittest.IsolatedAsyncioTestCase):
+    async def test_queues_then_sheds(self):
+        limit = RouteLimit("test", concurrency=1, queue_size=1, timeout=1)
+        release = asyncio.Event()
+
+        async def hold():
+            async with limit.acquire():
+                await release.wait()
+
+        running = asyncio.create_task(hold())
+        await asyncio.sleep(0)
+        queued = asyncio.create_task(hold())
+        await asyncio.sleep(0)
+        self.assertEqual((limit.active, limit.waiting), (1, 1))
+
+        # 실행 중 1, 대기 1 이 차 있으면 바로 거절한다
+        with self.assertRaises(OverloadedError):
+            async with limit.acquire():
+                pass
+        self.assertEqual(limit.rejected_count, 1)
+
+        release.set()
+        await asyncio.gather(running, queued)
+        self.assertEqual((limit.active, limit.waiting), (0, 0))
+
+    async def test_sheds_after_timeout(self):
+        limit = RouteLimit("test", concurrency=1, queue_size=10, timeout=0.01)
+
+        async with limit.acquire():
+            with self.assertRaises(OverloadedError):
+                async with limit.acquire():
+                    pass
+
+        self.assertEqual(limit.timed_out_count, 1)
+        self.assertEqual(limit.waiting, 0)
+        # 자리가 나면 다시 받는다
+        async with limit.acquire():
+            self.assertEqual(limit.active, 1)
+
+    async def test_cancelled_waiter_keeps_permits(self):
+        limit = RouteLimit("test", concurrency=1, queue_size=1, timeout=1)
+
+        async with limit.acquire():
+            waiter = asyncio.create_task(limit.acquire().__aenter__())
+            await asyncio.sleep(0)
+            waiter.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await waiter
+
+        self.assertEqual(limit.waiting, 0)
+        self.assertFalse(limit._semaphore.locked())
+
+    async def test_release_at_timeout_keeps_permits(self):
+        limit = RouteLimit("test", concurrency=1, queue_size=1, timeout=0.01)
+        loop = asyncio.get_running_loop()
+
+        # 자리가 나는 순간과 시간이 다 되는 순간이 겹쳐도 자리를 잃지 않는다
+        for _ in range(20):
+            await limit._semaphore.acquire()
+            loop.call_later(limit.timeout, limit._semaphore.release)
+            if await limit._acquire_within_timeout():
+                limit._semaphore.release()
+            self.assertFalse(limit._semaphore.locked())
+
+
+class TestClassifyRoute(TestCase):
+    def classify(self, method: str, path: str, type_: str = "http"):
+        return classify_route({"type": type_, "method": method, "path": path})
+
+    def test_classify_route(self):
+        self.assertEqual(self.classify("POST", "/api/v1/auth/register"), AUTH_WRITE)
+        self.assertEqual(self.classify("POST", "/api/v1/auth/jwt/login"), AUTH_WRITE)
+        self.assertEqual(self.classify("GET", "/api/v1/auth/verify-email"), AUTH_WRITE)
+        self.assertEqual(self.classify("GET", "/api/v1/auth/me"), AUTH_READ)
+        self.assertEqual(self.classify("GET", "/api/v1/meet-posts"), FEED)
+        self.assertEqual(self.classify("GET", "/api/v1/meet-posts/archive"), ARCHIVE)
+        self.assertEqual(
+            self.classify("GET", "/api/v1/meet-posts/ws", "websocket"), WEBSOCKET
+        )
+        self.assertEqual(self.classify("GET", "/api/v1/exports/users"), EXPORT)
+        self.assertIsNone(self.classify("POST", "/api/v1/meet-posts/1/join"))
+        self.assertIsNone(self.classify("GET", "/metrics"))
+
+
+class TestLoadSheddingMiddleware(unittest.IsolatedAsyncioTestCase):
+    async def test_returns_503_when_overloaded(self):
+        release = asyncio.Event()
+
+        async def slow(request):
+            await release.wait()
+            return PlainTextResponse("ok")
+
+        limit = RouteLimit("slow", concurrency=1, queue_size=0, timeout=3)
+        app = LoadSheddingMiddleware(
+            Starlette(routes=[Route("/slow", slow)]),
+            limits={"slow": limit},
+            classify=lambda scope: "slow" if scope["type"] == "http" else None,
+        )
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://test"
+        ) as client:
+            first = asyncio.create_task(client.get("/slow"))
+            while limit.active == 0:
+                await asyncio.sleep(0)
+
+            response = await client.get("/slow")
+            self.assertEqual(response.status_code, 503)
+            self.assertEqual(response.headers["retry-after"], "3")
+
+            release.set()
+            self.assertEqual((await first).status_code, 200)
+
+        self.assertIn(
+            'route_limit_shed_total{route_class="slow",reason="queue_full"} 1',
+            render_metrics({"slow": limit}),
+        )
@@ -0,0 +1,81 @@
+import asyncio
+import json
+import unittest
+from unittest.mock import patch
+
+from app.core.pubsub import Broker, listen_events
+from app.utils.geo import get_area
+
+
+class TestBroker(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.broker = Broker(queue_size=2)
+
+    async def test_subscriber_without_filter_receives_everything(self):
+        subscription = self.broker.subscribe()
+
+        self.assertEqual(self.broker.publish("a", "meal", "1:1"), 1)
+        self.assertEqual(self.broker.publish("b"), 1)
+
+        self.assertEqual(await subscription.queue.get(), "a")
+        self.assertEqual(await subscription.queue.get(), "b")
+
+    async def test_filters_by_area_and_type(self):
+        nearby_meal = self.broker.subscribe(areas=["1:1", "1:2"], types=["meal"])
+        nearby_any = self.broker.subscribe(areas=["1:1"])
+
+        self.assertEqual(self.broker.publish("far", "meal", "9:9"), 0)
+        self.assertEqual(self.broker.publish("study", "study", "1:1"), 1)
+        self.assertEqual(self.broker.publish("meal", "meal", "1:2"), 1)
+
+        self.assertEqual(nearby_meal.queue.get_nowait(), "meal")
+        self.assertTrue(nearby_meal.queue.empty())
+        self.assertEqual(nearby_any.queue.get_nowait(), "study")
+        self.assertTrue(nearby_any.queue.empty())
+
+    async def test_slow_consumer_is_dropped(self):
+        slow = self.broker.subscribe()
+        fast = self.broker.subscribe()
+
+        for message in ["1", "2", "3"]:
+            self.broker.publish(message)
+            self.assertEqual(fast.queue.get_nowait(), message)
+
+        # 밀린 메시지 대신 종료 신호만 남는다
+        self.assertIsNone(slow.queue.get_nowait())
+        self.assertTrue(slow.queue.empty())
+        self.assertEqual(self.broker.dropped_count, 1)
+        self.assertEqual(self.broker.subscriber_count, 1)
+
+    async def test_unsubscribe(self):
+        subscription = self.broker.subscribe(areas=["1:1"])
+        self.broker.unsubscribe(subscription)
+
+        self.assertEqual(self.broker.publish("a", area="1:1"), 0)
+        self.assertEqual(self.broker.subscriber_count, 0)
+
+    async def test_publish_meet_post_event(self):
+        area = get_area(36.73, 127.07)
+        subscription = self.broker.subscribe(areas=[area], types=["meal"])
+        payload = json.dumps(
+            {"event": "created", "type": "meal", "lat": 36.73, "lng": 127.07}
+        )
+
+        self.assertEqual(self.broker.publish_meet_post_event(payload), 1)
+        self.assertEqual(subscription.queue.get_nowait(), payload)
+
+
+class TestListenEvents(unittest.IsolatedAsyncioTestCase):
+    async def test_reconnects_after_unexpected_error(self):
+        # 두 번째 연결 시도까지 왔다면 재연결한 것이다
+        with (
+            patch(
+                "psycopg.AsyncConnection.connect",
+                side_effect=[RuntimeError("boom"), asyncio.CancelledError()],
+            ) as connect,
+            self.assertLogs("app.core.pubsub", "ERROR"),
+            self.assertRaises(asyncio.CancelledError),
+        ):
+            await listen_events({}, retry_seconds=0)
+
+        self.assertEqual(connect.call_count, 2)
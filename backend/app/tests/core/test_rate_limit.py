@@ -0,0 +1,201 @@
+import unittest
+import uuid
+from unittest import TestCase
+
+import httpx
+from fastapi import Body, Depends, FastAPI, Form
+from sqlalchemy import delete
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.core.db import engine
+from app.core.rate_limit import (
+    LocalBuckets,
+    PostgresBuckets,
+    RateLimit,
+    RateLimitedError,
+    RateLimiter,
+    parse_networks,
+    render_metrics,
+)
+from app.models.rate_limit import RateLimitBucket
+
+
+class TestLocalBuckets(TestCase):
+    def test_burst_then_refill(self):
+        buckets = LocalBuckets(capacity=3, refill_per_second=0.5)
+        self.assertEqual([buckets.take("a", now=0) for _ in range(3)], [0, 0, 0])
+        # 비었으니 토큰 하나가 찰 때까지 2초
+        self.assertEqual(buckets.take("a", now=0), 2)
+        self.assertEqual(buckets.take("b", now=0), 0)
+        self.assertEqual(buckets.take("a", now=2), 0)
+        self.assertEqual(buckets.take("a", now=3), 1)
+
+    def test_expires_full_buckets(self):
+        buckets = LocalBuckets(capacity=2, refill_per_second=1, shards=1)
+        buckets.take("a", now=0)
+        buckets.take("b", now=1)
+        self.assertEqual(len(buckets), 2)
+        # a 는 2초 뒤 다시 가득 차 지워진다
+        buckets.take("c", now=2.5)
+        self.assertEqual(len(buckets), 2)
+        buckets.take("d", now=10)
+        self.assertEqual(len(buckets), 1)
+
+    def test_evicts_least_recently_used(self):
+        buckets = LocalBuckets(
+            capacity=1, refill_per_second=0.001, shards=1, max_keys=2
+        )
+        buckets.take("a", now=0)
+        buckets.take("b", now=0)
+        buckets.take("a", now=1)
+        buckets.take("c", now=1)
+        self.assertEqual(len(buckets), 2)
+        # 최근에 쓴 a 는 남고 b 가 빠졌다
+        self.assertGreater(buckets.take("a", now=1), 0)
+        self.assertEqual(buckets.take("b", now=1), 0)
+
+
+class TestRateLimit(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.ip = RateLimiter("test-ip", capacity=5, refill_per_minute=1)
+        self.email = RateLimiter("test-email", capacity=2, refill_per_minute=1)
+        proxies = parse_networks(["10.0.0.0/8"])
+        app = FastAPI(dependencies=[Depends(RateLimit(self.ip, self.email, proxies))])
+
+        @app.post("/login")
+        async def login(username: str = Form(), password: str = Form()):
+            return {"ok": True}
+
+        @app.post("/register")
+        async def register(email: str = Body(embed=True)):
+            return {"ok": True}
+
+        self.app = app
+
+    def client(self, ip: str, forwarded_for: str | None = None) -> httpx.AsyncClient:
+        transport = httpx.ASGITransport(app=self.app, client=(ip, 1234))
+        headers = {"X-Forwarded-For": forwarded_for} if forwarded_for else {}
+        return httpx.AsyncClient(
+            transport=transport, base_url="http://test", headers=headers
+        )
+
+    async def test_limits_email_across_ips(self):
+        for ip in ("10.0.0.1", "10.0.0.2"):
+            async with self.client(ip) as client:
+                response = await client.post(
+                    "/login", data={"username": "A@vision.hoseo.edu", "password": "x"}
+                )
+                self.assertEqual(response.status_code, 200)
+
+        # 대소문자만 다른 이메일도 같은 버킷을 쓴다
+        async with self.client("10.0.0.3") as client:
+            response = await client.post(
+                "/register", json={"email": "a@vision.hoseo.edu"}
+            )
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(response.headers["retry-after"], "60")
+        self.assertEqual(self.email.limited_count, 1)
+
+    async def test_limits_ip(self):
+        async with self.client("10.0.0.1") as client:
+            statuses = [
+                (
+                    await client.post("/register", json={"email": f"{i}@hoseo.edu"})
+                ).status_code
+                for i in range(6)
+            ]
+        self.assertEqual(statuses, [200] * 5 + [429])
+        self.assertIn(
+            'rate_limited_total{rule="test-ip"} 1', render_metrics({"test-ip": self.ip})
+        )
+
+    async def register(self, ip: str, forwarded_for: str | None = None) -> int:
+        async with self.client(ip, forwarded_for) as client:
+            response = await client.post(
+                "/register", json={"email": f"{uuid.uuid4()}@hoseo.edu"}
+            )
+        return response.status_code
+
+    async def test_limits_client_behind_proxy(self):
+        # 인그레스(10.0.0.9)를 거친 서로 다른 학생은 버킷을 따로 쓴다
+        for i in range(5):
+            self.assertEqual(await self.register("10.0.0.9", f"203.0.113.{i}"), 200)
+        for _ in range(4):
+            self.assertEqual(await self.register("10.0.0.9", "203.0.113.0"), 200)
+        self.assertEqual(await self.register("10.0.0.9", "203.0.113.0"), 429)
+
+        # 앞에 적어 보낸 주소로는 버킷을 바꿀 수 없다
+        self.assertEqual(
+            await self.register("10.0.0.9", "198.51.100.1, 203.0.113.0"), 429
+        )
+        # 믿지 않는 주소가 보낸 헤더는 무시한다
+        for _ in range(5):
+            self.assertEqual(await self.register("198.51.100.7", "203.0.113.50"), 200)
+        self.assertEqual(await self.register("198.51.100.7", "203.0.113.51"), 429)
+
+
+class TestPostgresBucketsFallback(unittest.IsolatedAsyncioTestCase):
+    async def test_logs_fallback_once(self):
+        # 아무도 듣지 않는 포트라 연결이 바로 실패한다
+        unreachable = create_async_engine(engine.url.set(port=1))
+        self.addAsyncCleanup(unreachable.dispose)
+        buckets = PostgresBuckets(
+            "test", LocalBuckets(capacity=2, refill_per_second=0.1), unreachable
+        )
+
+        with self.assertLogs("app.core.rate_limit", "WARNING") as cm:
+            waits = [await buckets.take("10.0.0.1") for _ in range(3)]
+
+        self.assertEqual(waits[:2], [0, 0])
+        self.assertGreater(waits[2], 0)
+        self.assertEqual(len(cm.records), 1)
+        self.assertTrue(buckets.degraded)
+
+
+class TestPostgresBuckets(unittest.IsolatedAsyncioTestCase):
+    """실제 DB 에서 두 파드의 제한기가 버킷 하나를 나눠 쓰는지 확인한다."""
+
+    async def asyncSetUp(self):
+        try:
+            async with engine.connect():
+                pass
+        except (OSError, OperationalError):
+            self.skipTest("database is not available")
+        self.addAsyncCleanup(engine.dispose)
+        self.name = f"test-{uuid.uuid4().hex[:8]}"
+        self.addAsyncCleanup(self.cleanup)
+
+    async def cleanup(self):
+        async with engine.begin() as connection:
+            await connection.execute(
+                delete(RateLimitBucket).where(
+                    RateLimitBucket.key.startswith(f"{self.name}:")
+                )
+            )
+
+    async def test_pods_share_bucket(self):
+        pods = [
+            RateLimiter(self.name, capacity=3, refill_per_minute=1, backend="postgres")
+            for _ in range(2)
+        ]
+        for i in range(3):
+            await pods[i % 2].hit("10.0.0.1")
+        with self.assertRaises(RateLimitedError) as cm:
+            await pods[1].hit("10.0.0.1")
+        self.assertAlmostEqual(cm.exception.retry_after, 60, delta=1)
+        await pods[0].hit("10.0.0.2")
+        # 메모리 쪽 버킷은 쓰지 않았다
+        self.assertEqual(len(pods[0].local) + len(pods[1].local), 0)
+
+    async def test_logs_recovery(self):
+        buckets = PostgresBuckets(
+            self.name, LocalBuckets(capacity=1, refill_per_second=1)
+        )
+        buckets.degraded = True
+
+        with self.assertLogs("app.core.rate_limit", "INFO") as cm:
+            self.assertEqual(await buckets.take("10.0.0.1"), 0)
+
+        self.assertEqual(len(cm.records), 1)
+        self.assertFalse(buckets.degraded)
@@ -0,0 +1,93 @@
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from unittest.mock import patch
+
+from app.core import workers
+from app.core.workers import get_pool_size, get_worker_count, read_cgroup_cpu_quota
+
+
+class TestReadCgroupCpuQuota(TestCase):
+    def setUp(self):
+        self.tmp = TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        root = Path(self.tmp.name)
+        self.cpu_max = root / "cpu.max"
+        self.quota = root / "cpu.cfs_quota_us"
+        self.period = root / "cpu.cfs_period_us"
+        for name, path in [
+            ("CGROUP_V2_CPU_MAX", self.cpu_max),
+            ("CGROUP_V1_CPU_QUOTA", self.quota),
+            ("CGROUP_V1_CPU_PERIOD", self.period),
+        ]:
+            patcher = patch.object(workers, name, path)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_cgroup_v2(self):
+        self.cpu_max.write_text("150000 100000\n")
+        self.assertEqual(read_cgroup_cpu_quota(), 1.5)
+
+    def test_cgroup_v2_unlimited(self):
+        self.cpu_max.write_text("max 100000\n")
+        self.assertIsNone(read_cgroup_cpu_quota())
+
+    def test_cgroup_v1(self):
+        self.quota.write_text("50000\n")
+        self.period.write_text("100000\n")
+        self.assertEqual(read_cgroup_cpu_quota(), 0.5)
+
+    def test_cgroup_v1_unlimited(self):
+        self.quota.write_text("-1\n")
+        self.period.write_text("100000\n")
+        self.assertIsNone(read_cgroup_cpu_quota())
+
+    def test_no_cgroup(self):
+        self.assertIsNone(read_cgroup_cpu_quota())
+
+
+class TestGetWorkerCount(TestCase):
+    @patch.object(workers.settings, "WEB_CONCURRENCY", 3)
+    def test_explicit_concurrency(self):
+        self.assertEqual(get_worker_count(), 3)
+
+    @patch.object(workers.settings, "WEB_CONCURRENCY", None)
+    @patch.object(workers.settings, "MAX_WORKERS", None)
+    @patch("app.core.workers.read_cgroup_cpu_quota", return_value=2.5)
+    @patch("os.sched_getaffinity", return_value=set(range(8)), create=True)
+    def test_rounds_up_cpu_quota(self, *_):
+        self.assertEqual(get_worker_count(), 3)
+
+    @patch.object(workers.settings, "WEB_CONCURRENCY", None)
+    @patch.object(workers.settings, "MAX_WORKERS", None)
+    @patch("app.core.workers.read_cgroup_cpu_quota", return_value=0.5)
+    def test_at_least_one_worker(self, _):
+        self.assertEqual(get_worker_count(), 1)
+
+    @patch.object(workers.settings, "WEB_CONCURRENCY", None)
+    @patch.object(workers.settings, "MAX_WORKERS", 2)
+    @patch("app.core.workers.read_cgroup_cpu_quota", return_value=None)
+    @patch("os.sched_getaffinity", return_value=set(range(8)), create=True)
+    def test_max_workers(self, *_):
+        self.assertEqual(get_worker_count(), 2)
+
+
+class TestGetPoolSize(TestCase):
+    def test_splits_budget(self):
+        self.assertEqual(get_pool_size(4, budget=20), 5)
+        self.assertEqual(get_pool_size(3, budget=20), 6)
+
+    def test_never_exceeds_budget(self):
+        for workers_count in range(1, 21):
+            self.assertLessEqual(
+                get_pool_size(workers_count, budget=20) * workers_count, 20
+            )
+
+    def test_reserved_connections(self):
+        self.assertEqual(get_pool_size(4, budget=20, reserved=1), 4)
+
+    def test_budget_smaller_than_workers(self):
+        with self.assertRaises(ValueError):
+            get_pool_size(8, budget=4)
+        with self.assertRaises(ValueError):
+            get_pool_size(4, budget=4, reserved=1)
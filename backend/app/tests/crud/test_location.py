@@ -0,0 +1,84 @@
+import unittest
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import delete, insert
+from sqlalchemy.exc import OperationalError
+
+from app.core.db import async_session, engine
+from app.crud.location import (
+    get_latest_location,
+    get_location_history,
+    record_location,
+)
+from app.models.user import GenderEnum, User, UserLocation, UserLocationHistory
+
+
+class TestRecordLocation(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        try:
+            async with engine.connect():
+                pass
+        except (OSError, OperationalError):
+            self.skipTest("database is not available")
+
+        self.user_id = uuid.uuid4()
+        async with async_session() as session:
+            async with session.begin():
+                await session.execute(
+                    insert(User).values(
+                        id=self.user_id,
+                        email=f"{self.user_id}@test.hoseo.edu",
+                        hashed_password="x",
+                        is_active=True,
+                        is_superuser=False,
+                        is_verified=True,
+                        name="tester",
+                        gender=GenderEnum.male,
+                    )
+                )
+
+    async def asyncTearDown(self):
+        async with async_session() as session:
+            async with session.begin():
+                for model in (UserLocationHistory, UserLocation):
+                    await session.execute(
+                        delete(model).where(model.user_id == self.user_id)
+                    )
+                await session.execute(delete(User).where(User.id == self.user_id))
+        await engine.dispose()
+
+    async def test_keeps_latest_location(self):
+        now = datetime.now(timezone.utc)
+        async with async_session() as session:
+            async with session.begin():
+                await record_location(session, self.user_id, 36.7, 127.0, now)
+                # 늦게 도착한 과거 기록은 이력에만 남는다
+                await record_location(
+                    session, self.user_id, 36.8, 127.1, now - timedelta(minutes=1)
+                )
+
+            latest = await get_latest_location(session, self.user_id)
+            history = await get_location_history(
+                session,
+                self.user_id,
+                now - timedelta(hours=1),
+                now + timedelta(hours=1),
+            )
+
+        self.assertEqual((latest.lat, latest.lng), (36.7, 127.0))
+        self.assertEqual([h.lat for h in history], [36.7, 36.8])
+
+    async def test_records_without_day_partition(self):
+        # 파티션 작업이 만들지 않은 날짜는 기본 파티션이 받는다
+        far = datetime.now(timezone.utc) + timedelta(days=365)
+        async with async_session() as session:
+            async with session.begin():
+                await record_location(session, self.user_id, 36.7, 127.0, far)
+            history = await get_location_history(
+                session,
+                self.user_id,
+                far - timedelta(hours=1),
+                far + timedelta(hours=1),
+            )
+        self.assertEqual([h.lat for h in history], [36.7])
@@ -0,0 +1,204 @@
+import asyncio
+import unittest
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.exc import IntegrityError, OperationalError
+
+from app.core.db import async_session, engine
+from app.crud.meet_post import (
+    AlreadyJoinedError,
+    MeetPostFullError,
+    MeetPostNotFoundError,
+    NotJoinedError,
+    get_meet_post_page,
+    join_meet_post,
+    leave_meet_post,
+)
+from app.models.meet_post import MeetPost, MeetPostParticipant
+from app.models.user import GenderEnum, User
+
+CONCURRENT_JOINS = 500
+MAX_PEOPLE = 100
+
+
+class TestJoinMeetPost(unittest.IsolatedAsyncioTestCase):
+    """실제 DB 에 동시 참여 요청을 보내 초과 예약이 없는지 확인한다."""
+
+    async def asyncSetUp(self):
+        try:
+            async with engine.connect():
+                pass
+        except (OSError, OperationalError):
+            self.skipTest("database is not available")
+
+        self.user_ids = [uuid.uuid4() for _ in range(CONCURRENT_JOINS)]
+        self.meet_post_id = uuid.uuid4()
+        async with async_session() as session:
+            async with session.begin():
+                await session.execute(
+                    insert(User),
+                    [
+                        {
+                            "id": user_id,
+                            "email": f"{user_id}@test.hoseo.edu",
+                            "hashed_password": "x",
+                            "is_active": True,
+                            "is_superuser": False,
+                            "is_verified": True,
+                            "name": "tester",
+                            "gender": GenderEnum.male,
+                        }
+                        for user_id in self.user_ids
+                    ],
+                )
+                await session.execute(
+                    insert(MeetPost).values(
+                        id=self.meet_post_id,
+                        author_id=self.user_ids[0],
+                        title="test",
+                        type="meal",
+                        content="test",
+                        max_people=MAX_PEOPLE,
+                    )
+                )
+
+    async def asyncTearDown(self):
+        async with async_session() as session:
+            async with session.begin():
+                await session.execute(
+                    delete(MeetPost).where(MeetPost.id == self.meet_post_id)
+                )
+                await session.execute(delete(User).where(User.id.in_(self.user_ids)))
+        await engine.dispose()
+
+    async def _join(self, user_id: uuid.UUID) -> bool:
+        try:
+            async with async_session() as session:
+                async with session.begin():
+                    await join_meet_post(session, self.meet_post_id, user_id)
+        except MeetPostFullError:
+            return False
+        return True
+
+    async def _count_participants(self) -> tuple[int | None, int | None]:
+        async with async_session() as session:
+            current_people = await session.scalar(
+                select(MeetPost.current_people).where(MeetPost.id == self.meet_post_id)
+            )
+            participants = await session.scalar(
+                select(func.count()).where(
+                    MeetPostParticipant.meet_post_id == self.meet_post_id
+                )
+            )
+        return current_people, participants
+
+    async def test_concurrent_joins_do_not_overbook(self):
+        results = await asyncio.gather(*(self._join(u) for u in self.user_ids))
+
+        self.assertEqual(sum(results), MAX_PEOPLE)
+        self.assertEqual(await self._count_participants(), (MAX_PEOPLE, MAX_PEOPLE))
+
+    async def test_join_twice(self):
+        await self._join(self.user_ids[0])
+        with self.assertRaises(AlreadyJoinedError):
+            async with async_session() as session:
+                async with session.begin():
+                    await join_meet_post(session, self.meet_post_id, self.user_ids[0])
+        # 두 번째 참여는 좌석을 더 잡지 않는다
+        self.assertEqual(await self._count_participants(), (1, 1))
+
+    async def test_join_unknown_post_or_user(self):
+        with self.assertRaises(MeetPostNotFoundError):
+            async with async_session() as session:
+                async with session.begin():
+                    await join_meet_post(session, uuid.uuid4(), self.user_ids[0])
+        # 없는 사용자는 글이 없다고 하지 않는다
+        with self.assertRaises(IntegrityError):
+            async with async_session() as session:
+                async with session.begin():
+                    await join_meet_post(session, self.meet_post_id, uuid.uuid4())
+        self.assertEqual(await self._count_participants(), (0, 0))
+
+    async def test_leave_frees_seat(self):
+        await self._join(self.user_ids[0])
+        async with async_session() as session:
+            async with session.begin():
+                meet_post = await leave_meet_post(
+                    session, self.meet_post_id, self.user_ids[0]
+                )
+        self.assertEqual(meet_post.current_people, 0)
+        self.assertEqual(await self._count_participants(), (0, 0))
+
+        with self.assertRaises(NotJoinedError):
+            async with async_session() as session:
+                async with session.begin():
+                    await leave_meet_post(session, self.meet_post_id, self.user_ids[0])
+
+
+class TestGetMeetPostPage(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        try:
+            async with engine.connect():
+                pass
+        except (OSError, OperationalError):
+            self.skipTest("database is not available")
+
+        self.user_id = uuid.uuid4()
+        # 미래 시각으로 만들어 다른 글보다 앞에 오게 한다. 같은 시각인 글도 섞는다
+        base = datetime.now(timezone.utc) + timedelta(days=365)
+        self.posts = [
+            {
+                "id": uuid.uuid4(),
+                "author_id": self.user_id,
+                "title": f"test {i}",
+                "type": "page-test",
+                "content": "test",
+                "max_people": 10,
+                "created_at": base - timedelta(minutes=i // 2),
+            }
+            for i in range(7)
+        ]
+        async with async_session() as session:
+            async with session.begin():
+                await session.execute(
+                    insert(User).values(
+                        id=self.user_id,
+                        email=f"{self.user_id}@test.hoseo.edu",
+                        hashed_password="x",
+                        is_active=True,
+                        is_superuser=False,
+                        is_verified=True,
+                        name="tester",
+                        gender=GenderEnum.male,
+                    )
+                )
+                await session.execute(insert(MeetPost), self.posts)
+
+    async def asyncTearDown(self):
+        async with async_session() as session:
+            async with session.begin():
+                await session.execute(
+                    delete(MeetPost).where(MeetPost.author_id == self.user_id)
+                )
+                await session.execute(delete(User).where(User.id == self.user_id))
+        await engine.dispose()
+
+    async def test_pages_by_keyset(self):
+        expected = sorted(
+            self.posts, key=lambda p: (p["created_at"], p["id"]), reverse=True
+        )
+        seen = []
+        before = None
+        async with async_session() as session:
+            while True:
+                page = await get_meet_post_page(
+                    session, type_="page-test", before=before, limit=3
+                )
+                if not page:
+                    break
+                seen.extend(post.id for post in page)
+                before = (page[-1].created_at, page[-1].id)
+
+        self.assertEqual(seen, [post["id"] for post in expected])
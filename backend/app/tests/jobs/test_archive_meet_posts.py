@@ -0,0 +1,172 @@
+import unittest
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.exc import OperationalError
+
+from app.core.db import async_session, engine
+from app.crud.meet_post import (
+    get_archived_meet_post,
+    get_archived_meet_post_page,
+    get_meet_post_stats,
+)
+from app.jobs.archive_meet_posts import archive_meet_posts
+from app.jobs.reconcile_meet_post_stats import reconcile_stats
+from app.models.meet_post import (
+    MeetPost,
+    MeetPostArchive,
+    MeetPostParticipant,
+    MeetPostParticipantArchive,
+    MeetPostStats,
+)
+from app.models.user import GenderEnum, User
+
+
+class TestArchiveMeetPosts(unittest.IsolatedAsyncioTestCase):
+    """실제 DB 에서 지난 글이 참여 기록과 함께 옮겨지는지 확인한다."""
+
+    async def asyncSetUp(self):
+        try:
+            async with engine.connect():
+                pass
+        except (OSError, OperationalError):
+            self.skipTest("database is not available")
+        self.addAsyncCleanup(engine.dispose)
+
+        self.now = datetime.now(timezone.utc)
+        self.old_day = (self.now - timedelta(days=30)).date()
+        self.type = f"t-{uuid.uuid4().hex[:8]}"
+        self.user_ids = [uuid.uuid4(), uuid.uuid4()]
+        self.old_ids = [uuid.uuid4() for _ in range(5)]
+        self.live_id = uuid.uuid4()
+        async with async_session() as session:
+            async with session.begin():
+                await session.execute(
+                    insert(User),
+                    [
+                        {
+                            "id": user_id,
+                            "email": f"{user_id}@test.hoseo.edu",
+                            "hashed_password": "x",
+                            "is_active": True,
+                            "is_superuser": False,
+                            "is_verified": True,
+                            "name": "tester",
+                            "gender": GenderEnum.male,
+                        }
+                        for user_id in self.user_ids
+                    ],
+                )
+                await session.execute(
+                    insert(MeetPost),
+                    [
+                        {
+                            "id": post_id,
+                            "author_id": self.user_ids[0],
+                            "title": "archive",
+                            "type": self.type,
+                            "content": "archive",
+                            "max_people": 4,
+                            "current_people": 1,
+                            "created_at": self.now - timedelta(days=30, minutes=i),
+                        }
+                        for i, post_id in enumerate(self.old_ids)
+                    ]
+                    + [
+                        {
+                            "id": self.live_id,
+                            "author_id": self.user_ids[0],
+                            "title": "live",
+                            "type": self.type,
+                            "content": "live",
+                            "max_people": 4,
+                            "current_people": 1,
+                        }
+                    ],
+                )
+                await session.execute(
+                    insert(MeetPostParticipant),
+                    [
+                        {"meet_post_id": post_id, "user_id": self.user_ids[1]}
+                        for post_id in self.old_ids + [self.live_id]
+                    ],
+                )
+        self.addAsyncCleanup(self.cleanup)
+
+    async def cleanup(self):
+        post_ids = self.old_ids + [self.live_id]
+        async with async_session() as session:
+            async with session.begin():
+                await session.execute(delete(MeetPost).where(MeetPost.id.in_(post_ids)))
+                await session.execute(
+                    delete(MeetPostArchive).where(MeetPostArchive.id.in_(post_ids))
+                )
+                await session.execute(delete(User).where(User.id.in_(self.user_ids)))
+                await session.execute(
+                    delete(MeetPostStats).where(MeetPostStats.type == self.type)
+                )
+
+    async def count(self, model, column, ids) -> int:
+        async with async_session() as session:
+            result = await session.execute(
+                select(func.count()).select_from(model).where(column.in_(ids))
+            )
+            return result.scalar_one()
+
+    async def test_moves_old_posts_in_batches(self):
+        async with async_session() as session:
+            stats_before = await get_meet_post_stats(
+                session, self.old_day, self.old_day, self.type
+            )
+
+        async with engine.connect() as connection:
+            moved = await archive_meet_posts(
+                connection, self.now - timedelta(days=14), batch_size=2
+            )
+        # 다른 테스트 데이터가 함께 옮겨질 수 있다
+        self.assertGreaterEqual(moved, len(self.old_ids))
+
+        self.assertEqual(await self.count(MeetPost, MeetPost.id, self.old_ids), 0)
+        self.assertEqual(await self.count(MeetPost, MeetPost.id, [self.live_id]), 1)
+        self.assertEqual(
+            await self.count(MeetPostArchive, MeetPostArchive.id, self.old_ids),
+            len(self.old_ids),
+        )
+        self.assertEqual(
+            await self.count(
+                MeetPostParticipantArchive,
+                MeetPostParticipantArchive.meet_post_id,
+                self.old_ids,
+            ),
+            len(self.old_ids),
+        )
+        self.assertEqual(
+            await self.count(
+                MeetPostParticipant, MeetPostParticipant.meet_post_id, [self.live_id]
+            ),
+            1,
+        )
+
+        # 옮긴 글도 통계에 남고, 재집계도 보관 테이블까지 세어 차이가 없다
+        async with async_session() as session:
+            stats_after = await get_meet_post_stats(
+                session, self.old_day, self.old_day, self.type
+            )
+        self.assertEqual(stats_after, stats_before)
+        async with engine.connect() as connection:
+            fixed = await reconcile_stats(connection, self.old_day)
+        self.assertEqual([row for row in fixed if row[1] == self.type], [])
+
+        async with async_session() as session:
+            archived = await get_archived_meet_post(session, self.old_ids[0])
+            self.assertEqual(archived.title, "archive")
+            page = await get_archived_meet_post_page(session, self.user_ids[0], limit=3)
+            self.assertEqual([post.id for post in page], self.old_ids[:3])
+            page = await get_archived_meet_post_page(
+                session,
+                self.user_ids[0],
+                before=(page[-1].created_at, page[-1].id),
+                limit=3,
+            )
+            self.assertEqual([post.id for post in page], self.old_ids[3:])
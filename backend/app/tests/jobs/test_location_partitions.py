@@ -0,0 +1,182 @@
+import unittest
+from datetime import date
+
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+from app.core.db import engine
+from app.jobs.location_partitions import (
+    drop_expired_partitions,
+    ensure_partitions,
+    list_partitions,
+)
+
+TABLE = "location_partitions_test"
+
+
+class TestLocationPartitions(unittest.IsolatedAsyncioTestCase):
+    """실제 DB 에 별도 파티션 테이블을 만들어 파티션 생성/삭제를 확인한다."""
+
+    async def asyncSetUp(self):
+        try:
+            connection = await engine.connect()
+        except (OSError, OperationalError):
+            self.skipTest("database is not available")
+        self.connection = await connection.execution_options(
+            isolation_level="AUTOCOMMIT"
+        )
+        self.addAsyncCleanup(engine.dispose)
+        self.addAsyncCleanup(self.connection.close)
+
+        await self.connection.execute(text(f"DROP TABLE IF EXISTS {TABLE}"))
+        await self.connection.execute(
+            text(
+                f"CREATE TABLE {TABLE} (id int, recorded_at timestamptz NOT NULL) "
+                "PARTITION BY RANGE (recorded_at)"
+            )
+        )
+        self.addAsyncCleanup(
+            self.connection.execute, text(f"DROP TABLE IF EXISTS {TABLE}")
+        )
+
+    async def test_creates_partitions_ahead(self):
+        created = await ensure_partitions(
+            self.connection, date(2030, 1, 30), days_ahead=2, table=TABLE
+        )
+
+        self.assertEqual(
+            created,
+            [f"{TABLE}_p20300130", f"{TABLE}_p20300131", f"{TABLE}_p20300201"],
+        )
+        # 이미 있는 파티션은 다시 만들지 않는다
+        self.assertEqual(
+            await ensure_partitions(
+                self.connection, date(2030, 1, 30), days_ahead=2, table=TABLE
+            ),
+            [],
+        )
+        await self.connection.execute(
+            text(f"INSERT INTO {TABLE} VALUES (1, '2030-01-31 23:59:59+00')")
+        )
+        self.assertEqual(
+            await self.connection.scalar(
+                text(f"SELECT tableoid::regclass::text FROM {TABLE}")
+            ),
+            f"{TABLE}_p20300131",
+        )
+
+    async def test_moves_rows_out_of_default_partition(self):
+        await self.connection.execute(
+            text(f"CREATE TABLE {TABLE}_default PARTITION OF {TABLE} DEFAULT")
+        )
+        # 작업이 밀려 파티션이 없던 날의 기록도 받아 둔다
+        await self.connection.execute(
+            text(
+                f"INSERT INTO {TABLE} VALUES "
+                "(1, '2030-01-30 10:00+00'), (2, '2030-01-31 10:00+00'), "
+                "(3, '2029-12-01 10:00+00')"
+            )
+        )
+
+        created = await ensure_partitions(
+            self.connection, date(2030, 1, 30), days_ahead=1, table=TABLE
+        )
+
+        self.assertEqual(created, [f"{TABLE}_p20300130", f"{TABLE}_p20300131"])
+        rows = await self.connection.execute(
+            text(f"SELECT id, tableoid::regclass::text FROM {TABLE} ORDER BY id")
+        )
+        self.assertEqual(
+            rows.all(),
+            [
+                (1, f"{TABLE}_p20300130"),
+                (2, f"{TABLE}_p20300131"),
+                (3, f"{TABLE}_default"),
+            ],
+        )
+
+        # 기본 파티션에 남은 지난 행도 보관 기간이 지나면 지운다
+        await drop_expired_partitions(
+            self.connection, date(2030, 1, 30), retention_days=30, table=TABLE
+        )
+        self.assertEqual(
+            await self.connection.scalar(text(f"SELECT count(*) FROM {TABLE}")), 2
+        )
+
+    async def test_drops_expired_partitions(self):
+        await ensure_partitions(
+            self.connection, date(2030, 1, 1), days_ahead=9, table=TABLE
+        )
+        await self.connection.execute(
+            text(f"INSERT INTO {TABLE} VALUES (1, '2030-01-02'), (2, '2030-01-08')")
+        )
+
+        dropped = await drop_expired_partitions(
+            self.connection, date(2030, 1, 10), retention_days=5, table=TABLE
+        )
+
+        self.assertEqual(dropped, [f"{TABLE}_p2030010{i}" for i in range(1, 5)])
+        self.assertEqual(len(await list_partitions(self.connection, TABLE)), 6)
+        self.assertEqual(
+            await self.connection.scalar(text(f"SELECT array_agg(id) FROM {TABLE}")),
+            [2],
+        )
+
+    async def test_drops_expired_partitions_next_to_default(self):
+        # 기본 파티션이 있으면 DETACH CONCURRENTLY 를 쓸 수 없다
+        await self.connection.execute(
+            text(f"CREATE TABLE {TABLE}_default PARTITION OF {TABLE} DEFAULT")
+        )
+        await ensure_partitions(
+            self.connection, date(2030, 1, 1), days_ahead=2, table=TABLE
+        )
+
+        dropped = await drop_expired_partitions(
+            self.connection, date(2030, 1, 10), retention_days=8, table=TABLE
+        )
+
+        self.assertEqual(dropped, [f"{TABLE}_p20300101"])
+        self.assertEqual(
+            sorted(await list_partitions(self.connection, TABLE)),
+            [f"{TABLE}_default", f"{TABLE}_p20300102", f"{TABLE}_p20300103"],
+        )
+
+    async def test_skips_partition_when_table_is_busy(self):
+        await ensure_partitions(
+            self.connection, date(2030, 1, 1), days_ahead=0, table=TABLE
+        )
+        async with engine.connect() as other:
+            await other.execute(text(f"LOCK TABLE {TABLE} IN ACCESS SHARE MODE"))
+
+            dropped = await drop_expired_partitions(
+                self.connection,
+                date(2030, 1, 10),
+                retention_days=5,
+                table=TABLE,
+                lock_timeout_ms=50,
+            )
+            await other.rollback()
+
+        # 잠금을 기다리지 않고 다음 실행으로 미룬다
+        self.assertEqual(dropped, [])
+        self.assertEqual(
+            await drop_expired_partitions(
+                self.connection, date(2030, 1, 10), retention_days=5, table=TABLE
+            ),
+            [f"{TABLE}_p20300101"],
+        )
+
+    async def test_history_query_prunes_partitions(self):
+        await ensure_partitions(
+            self.connection, date(2030, 1, 1), days_ahead=9, table=TABLE
+        )
+
+        plan = await self.connection.scalar(
+            text(
+                f"EXPLAIN (FORMAT JSON) SELECT * FROM {TABLE} "
+                "WHERE recorded_at >= '2030-01-03' AND recorded_at < '2030-01-04'"
+            )
+        )
+
+        self.assertIn(f"{TABLE}_p20300103", str(plan))
+        self.assertNotIn(f"{TABLE}_p20300104", str(plan))
@@ -0,0 +1,176 @@
+import asyncio
+import unittest
+import uuid
+from datetime import date, datetime, timezone
+
+from sqlalchemy import delete, func, insert, select, text
+from sqlalchemy.exc import OperationalError
+
+from app.core.db import async_session, engine
+from app.crud.meet_post import (
+    MeetPostFullError,
+    get_meet_post_stats,
+    join_meet_post,
+    leave_meet_post,
+)
+from app.jobs.reconcile_meet_post_stats import reconcile_stats
+from app.models.meet_post import MeetPost, MeetPostStats
+from app.models.user import GenderEnum, User
+
+DAY = date(2030, 1, 15)
+USERS = 20
+
+
+class TestMeetPostStats(unittest.IsolatedAsyncioTestCase):
+    """실제 DB 에서 트리거가 유지한 카운터를 다시 센 값과 비교한다."""
+
+    async def asyncSetUp(self):
+        try:
+            async with engine.connect():
+                pass
+        except (OSError, OperationalError):
+            self.skipTest("database is not available")
+        self.addAsyncCleanup(engine.dispose)
+
+        # 다른 데이터와 섞이지 않도록 이 테스트만의 종류를 쓴다
+        self.type = f"t-{uuid.uuid4().hex[:8]}"
+        self.user_ids = [uuid.uuid4() for _ in range(USERS)]
+        self.post_ids = [uuid.uuid4() for _ in range(4)]
+        async with async_session() as session:
+            async with session.begin():
+                await session.execute(
+                    insert(User),
+                    [
+                        {
+                            "id": user_id,
+                            "email": f"{user_id}@test.hoseo.edu",
+                            "hashed_password": "x",
+                            "is_active": True,
+                            "is_superuser": False,
+                            "is_verified": True,
+                            "name": "tester",
+                            "gender": GenderEnum.male,
+                        }
+                        for user_id in self.user_ids
+                    ],
+                )
+                await session.execute(
+                    insert(MeetPost),
+                    [
+                        {
+                            "id": post_id,
+                            "author_id": self.user_ids[0],
+                            "title": "stats",
+                            "type": self.type,
+                            "content": "stats",
+                            "max_people": 4,
+                            "created_at": datetime(
+                                2030, 1, 15, 12, tzinfo=timezone.utc
+                            ),
+                        }
+                        for post_id in self.post_ids
+                    ],
+                )
+        self.addAsyncCleanup(self.cleanup)
+
+    async def cleanup(self):
+        async with async_session() as session:
+            async with session.begin():
+                await session.execute(
+                    delete(MeetPost).where(MeetPost.id.in_(self.post_ids))
+                )
+                await session.execute(delete(User).where(User.id.in_(self.user_ids)))
+                await session.execute(
+                    delete(MeetPostStats).where(MeetPostStats.type == self.type)
+                )
+
+    async def read_stats(self) -> dict[int, int]:
+        async with async_session() as session:
+            rows = await get_meet_post_stats(session, DAY, DAY, self.type)
+        # Row.count 는 tuple.count 와 겹치므로 풀어서 읽는다
+        return {fill_bucket: count for _, _, fill_bucket, count in rows}
+
+    async def count_posts(self) -> dict[int, int]:
+        bucket = MeetPost.current_people * 4 // MeetPost.max_people
+        async with async_session() as session:
+            rows = await session.execute(
+                select(bucket, func.count())
+                .where(MeetPost.type == self.type)
+                .group_by(bucket)
+            )
+        return {fill_bucket: count for fill_bucket, count in rows}
+
+    async def join(self, post_id: uuid.UUID, user_id: uuid.UUID) -> bool:
+        async with async_session() as session:
+            try:
+                async with session.begin():
+                    await join_meet_post(session, post_id, user_id)
+            except MeetPostFullError:
+                # 마감된 글에 참여하면 롤백된다
+                return False
+        return True
+
+    async def test_trigger_tracks_concurrent_joins(self):
+        self.assertEqual(await self.read_stats(), {0: 4})
+
+        joined = await asyncio.gather(
+            *(
+                self.join(self.post_ids[i % 3], user_id)
+                for i, user_id in enumerate(self.user_ids)
+            )
+        )
+        # 글 셋에 네 자리씩
+        self.assertEqual(sum(joined), 12)
+        async with async_session() as session:
+            async with session.begin():
+                await leave_meet_post(session, self.post_ids[0], self.user_ids[0])
+
+        # 글 셋은 마감됐다가 하나가 3/4 로 돌아오고, 하나는 그대로 0/4
+        expected = await self.count_posts()
+        self.assertEqual(expected, {0: 1, 3: 1, 4: 2})
+        self.assertEqual(await self.read_stats(), expected)
+
+        async with async_session() as session:
+            async with session.begin():
+                await session.execute(
+                    delete(MeetPost).where(MeetPost.id == self.post_ids[3])
+                )
+        self.assertEqual(await self.read_stats(), {3: 1, 4: 2})
+
+    async def test_reconcile_fixes_drift(self):
+        async with engine.begin() as connection:
+            await connection.execute(
+                text(
+                    "UPDATE meet_post_stats SET count = count + 5 "
+                    "WHERE (type, fill_bucket, shard) = ("
+                    "SELECT type, fill_bucket, shard FROM meet_post_stats "
+                    "WHERE type = :type AND fill_bucket = 0 LIMIT 1)"
+                ),
+                {"type": self.type},
+            )
+            await connection.execute(
+                insert(MeetPostStats).values(
+                    day=DAY, type=self.type, fill_bucket=2, shard=7, count=3
+                )
+            )
+        self.assertEqual(await self.read_stats(), {0: 9, 2: 3})
+
+        async with engine.connect() as connection:
+            fixed = await reconcile_stats(connection, DAY)
+        self.assertEqual(
+            sorted(row for row in fixed if row[1] == self.type),
+            [(DAY, self.type, 0), (DAY, self.type, 2)],
+        )
+        self.assertEqual(await self.read_stats(), {0: 4})
+
+        async with engine.connect() as connection:
+            fixed = await reconcile_stats(connection, DAY)
+        self.assertEqual([row for row in fixed if row[1] == self.type], [])
+        # 0 이 된 shard 행은 지워진다
+        async with async_session() as session:
+            zero_rows = await session.scalar(
+                select(func.count())
+                .select_from(MeetPostStats)
+                .where(MeetPostStats.type == self.type, MeetPostStats.count == 0)
+            )
+        self.assertEqual(zero_rows, 0)
@@ -0,0 +1,85 @@
+import csv
+import gzip
+import io
+import json
+import unittest
+import uuid
+
+from sqlalchemy import delete, insert
+from sqlalchemy.exc import OperationalError
+
+from app.core.db import async_session, engine
+from app.models.meet_post import MeetPost
+from app.models.user import GenderEnum, User
+from app.service.export import CSV, NDJSON, iter_export
+
+
+async def collect(*args, **kwargs) -> bytes:
+    return b"".join([chunk async for chunk in iter_export(*args, **kwargs)])
+
+
+class TestIterExport(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        try:
+            async with engine.connect():
+                pass
+        except (OSError, OperationalError):
+            self.skipTest("database is not available")
+
+        self.user_id = uuid.uuid4()
+        self.post_ids = {uuid.uuid4() for _ in range(5)}
+        async with async_session() as session:
+            async with session.begin():
+                await session.execute(
+                    insert(User).values(
+                        id=self.user_id,
+                        email=f"{self.user_id}@test.hoseo.edu",
+                        hashed_password="secret-hash",
+                        is_active=True,
+                        is_superuser=False,
+                        is_verified=True,
+                        name="tester",
+                        gender=GenderEnum.female,
+                    )
+                )
+                await session.execute(
+                    insert(MeetPost),
+                    [
+                        {
+                            "id": post_id,
+                            "author_id": self.user_id,
+                            "title": '내보내기, "테스트"',
+                            "type": "meal",
+                            "content": "줄\n바꿈",
+                            "max_people": 4,
+                        }
+                        for post_id in self.post_ids
+                    ],
+                )
+
+    async def asyncTearDown(self):
+        async with async_session() as session:
+            async with session.begin():
+                await session.execute(
+                    delete(MeetPost).where(MeetPost.author_id == self.user_id)
+                )
+                await session.execute(delete(User).where(User.id == self.user_id))
+        await engine.dispose()
+
+    async def test_ndjson_users_without_password(self):
+        data = await collect("users", NDJSON, batch_size=2)
+        users = [json.loads(line) for line in data.decode().splitlines()]
+        user = next(user for user in users if user["id"] == str(self.user_id))
+        self.assertEqual(user["gender"], "female")
+        self.assertNotIn("hashed_password", user)
+        self.assertNotIn(b"secret-hash", data)
+
+    async def test_gzip_csv_meet_posts(self):
+        data = await collect("meet-posts", CSV, compress=True, batch_size=2)
+        rows = list(csv.DictReader(io.StringIO(gzip.decompress(data).decode())))
+        posts = [row for row in rows if row["author_id"] == str(self.user_id)]
+        self.assertEqual({uuid.UUID(row["id"]) for row in posts}, self.post_ids)
+        # 쉼표, 따옴표, 줄바꿈이 있어도 그대로 돌아온다
+        self.assertEqual(posts[0]["title"], '내보내기, "테스트"')
+        self.assertEqual(posts[0]["content"], "줄\n바꿈")
+        self.assertEqual(posts[0]["lat"], "")
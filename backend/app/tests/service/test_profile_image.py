@@ -0,0 +1,70 @@
+import hashlib
+import io
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
+
+from PIL import Image
+
+from app.api.routes.profile_image import is_valid_length
+from app.core.config import settings
+from app.core.storage import FileTooLargeError
+from app.service.profile_image import PROFILE, THUMBNAIL, ProfileImageService
+from app.utils.image import shutdown_executor
+
+
+async def chunked(data: bytes, size: int = 1024):
+    for i in range(0, len(data), size):
+        yield data[i : i + size]
+
+
+class TestProfileImageService(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        tmp = TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        patcher = patch.object(settings, "MEDIA_ROOT", Path(tmp.name))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(shutdown_executor)
+
+        self.service = ProfileImageService(
+            max_bytes=1024 * 1024, size=64, thumbnail_size=16
+        )
+        buffer = io.BytesIO()
+        Image.new("RGB", (300, 200), (0, 128, 255)).save(buffer, "JPEG")
+        self.image = buffer.getvalue()
+
+    async def test_saves_by_content_key(self):
+        key = await self.service.save(chunked(self.image))
+
+        self.assertEqual(key, hashlib.sha256(self.image).hexdigest())
+        with Image.open(self.service.get_path(key, PROFILE)) as image:
+            self.assertEqual(image.size, (64, 43))
+        with Image.open(self.service.get_path(key, THUMBNAIL)) as image:
+            self.assertEqual(image.size, (16, 11))
+        self.assertEqual(list((settings.MEDIA_ROOT / "tmp").iterdir()), [])
+
+    async def test_deduplicates_identical_upload(self):
+        key = await self.service.save(chunked(self.image))
+        path = self.service.get_path(key, PROFILE)
+        mtime = path.stat().st_mtime_ns
+
+        with patch("app.service.profile_image.resize_image_in_pool") as resize:
+            self.assertEqual(await self.service.save(chunked(self.image, 100)), key)
+        resize.assert_not_called()
+        self.assertEqual(path.stat().st_mtime_ns, mtime)
+
+    async def test_rejects_large_upload(self):
+        service = ProfileImageService(max_bytes=1000, size=64, thumbnail_size=16)
+
+        with self.assertRaises(FileTooLargeError):
+            await service.save(chunked(self.image))
+        self.assertEqual(list((settings.MEDIA_ROOT / "tmp").iterdir()), [])
+
+
+class TestIsValidLength(unittest.TestCase):
+    def test_is_valid_length(self):
+        self.assertTrue(is_valid_length("1024"))
+        for value in ("", "abc", "-1", " 1", "1_000", "１"):
+            self.assertFalse(is_valid_length(value), value)
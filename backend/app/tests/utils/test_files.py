@@ -0,0 +1,53 @@
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from app.utils.files import (
+    CHUNK_SIZE,
+    RangeNotSatisfiableError,
+    etag_matches,
+    iter_file,
+    parse_range,
+)
+
+
+class TestParseRange(TestCase):
+    def test_ranges(self):
+        self.assertEqual(parse_range("bytes=0-99", 1000), (0, 99))
+        self.assertEqual(parse_range("bytes=900-", 1000), (900, 999))
+        self.assertEqual(parse_range("bytes=-100", 1000), (900, 999))
+        # 파일보다 긴 구간은 파일 끝까지로 줄인다
+        self.assertEqual(parse_range("bytes=500-5000", 1000), (500, 999))
+        self.assertEqual(parse_range("bytes=-5000", 1000), (0, 999))
+
+    def test_unsupported_range_returns_none(self):
+        self.assertIsNone(parse_range("bytes=0-1,5-9", 1000))
+        self.assertIsNone(parse_range("items=0-1", 1000))
+        self.assertIsNone(parse_range("bytes=-", 1000))
+
+    def test_unsatisfiable_range(self):
+        for header in ["bytes=1000-", "bytes=5-1", "bytes=-0"]:
+            with self.assertRaises(RangeNotSatisfiableError):
+                parse_range(header, 1000)
+
+
+class TestEtagMatches(TestCase):
+    def test_etag_matches(self):
+        self.assertTrue(etag_matches('"a"', '"a"'))
+        self.assertTrue(etag_matches('"b", W/"a"', '"a"'))
+        self.assertTrue(etag_matches("*", '"a"'))
+        self.assertFalse(etag_matches('"b"', '"a"'))
+
+
+class TestIterFile(unittest.IsolatedAsyncioTestCase):
+    async def test_reads_range(self):
+        with TemporaryDirectory() as tmp:
+            path = Path(tmp) / "file"
+            data = bytes(range(256)) * 1024
+            path.write_bytes(data)
+
+            chunks = [chunk async for chunk in iter_file(path, 10, CHUNK_SIZE + 5)]
+
+        self.assertEqual(b"".join(chunks), data[10 : 10 + CHUNK_SIZE + 5])
+        self.assertEqual(len(chunks), 2)
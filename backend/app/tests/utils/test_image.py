@@ -0,0 +1,56 @@
+import io
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from PIL import Image
+
+from app.utils.image import InvalidImageError, resize_image
+
+
+class TestResizeImage(TestCase):
+    def setUp(self):
+        self.tmp = TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.root = Path(self.tmp.name)
+        self.source = self.root / "source"
+
+    def test_resizes_to_each_target(self):
+        Image.new("RGBA", (2000, 1000), (255, 0, 0, 128)).save(self.source, "PNG")
+        large = self.root / "large" / "image.jpg"
+        small = self.root / "small" / "image.jpg"
+
+        resize_image(str(self.source), [(str(small), 128), (str(large), 512)])
+
+        with Image.open(large) as image:
+            self.assertEqual((image.format, image.size), ("JPEG", (512, 256)))
+        with Image.open(small) as image:
+            self.assertEqual(image.size, (128, 64))
+        # 임시 파일이 남지 않는다
+        self.assertEqual(list(large.parent.iterdir()), [large])
+
+    def test_keeps_small_image_size(self):
+        buffer = io.BytesIO()
+        Image.new("RGB", (100, 50)).save(buffer, "JPEG")
+        self.source.write_bytes(buffer.getvalue())
+        target = self.root / "image.jpg"
+
+        resize_image(str(self.source), [(str(target), 512)])
+
+        with Image.open(target) as image:
+            self.assertEqual(image.size, (100, 50))
+
+    def test_rejects_non_image(self):
+        self.source.write_bytes(b"not an image")
+
+        with self.assertRaises(InvalidImageError):
+            resize_image(str(self.source), [(str(self.root / "image.jpg"), 512)])
+
+    def test_rejects_truncated_image(self):
+        for format_ in ("JPEG", "PNG"):
+            buffer = io.BytesIO()
+            Image.new("RGB", (300, 200), (0, 128, 255)).save(buffer, format_)
+            self.source.write_bytes(buffer.getvalue()[:-200])
+
+            with self.subTest(format_), self.assertRaises(InvalidImageError):
+                resize_image(str(self.source), [(str(self.root / "image.jpg"), 512)])
@@ -0,0 +1,105 @@
+import re
+from collections.abc import AsyncIterator
+from pathlib import Path
+
+import anyio
+from fastapi import Request, Response, status
+from fastapi.responses import StreamingResponse
+
+CHUNK_SIZE = 64 * 1024
+RANGE_PATTERN = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+class RangeNotSatisfiableError(Exception):
+    pass
+
+
+def parse_range(header: str, size: int) -> tuple[int, int] | None:
+    """Range 헤더를 (시작, 끝) 바이트 위치로 바꾼다. 끝도 포함이다.
+
+    여러 구간처럼 지원하지 않는 형식이면 None 을 돌려 전체를 보내게 한다.
+    """
+    match = RANGE_PATTERN.match(header.strip())
+    if match is None:
+        return None
+    start, end = match.groups()
+    if start == "":
+        if end == "":
+            return None
+        # bytes=-N 은 마지막 N 바이트
+        suffix = int(end)
+        if suffix == 0 or size == 0:
+            raise RangeNotSatisfiableError()
+        return max(size - suffix, 0), size - 1
+    first = int(start)
+    last = int(end) if end else size - 1
+    if first >= size or first > last:
+        raise RangeNotSatisfiableError()
+    return first, min(last, size - 1)
+
+
+def etag_matches(header: str, etag: str) -> bool:
+    tags = [tag.strip().removeprefix("W/") for tag in header.split(",")]
+    return "*" in tags or etag in tags
+
+
+async def iter_file(path: Path, start: int, length: int) -> AsyncIterator[bytes]:
+    # 여는 것도 디스크를 기다릴 수 있으므로 스레드에서 한다
+    async with await anyio.open_file(path, "rb") as f:
+        await f.seek(start)
+        remaining = length
+        while remaining > 0:
+            chunk = await f.read(min(CHUNK_SIZE, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+
+
+def file_response(
+    request: Request,
+    path: Path,
+    *,
+    etag: str,
+    media_type: str,
+    cache_control: str = "no-cache",
+) -> Response:
+    """ETag 와 단일 구간 Range 요청을 지원하는 파일 응답. 파일이 없으면 FileNotFoundError."""
+    size = path.stat().st_size
+    etag = f'"{etag}"'
+    headers = {"ETag": etag, "Accept-Ranges": "bytes", "Cache-Control": cache_control}
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None and etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    range_header = request.headers.get("range")
+    if_range = request.headers.get("if-range")
+    # If-Range 가 다른 버전을 가리키면 구간 대신 전체를 보낸다
+    if range_header is not None and (if_range is None or if_range == etag):
+        try:
+            byte_range = parse_range(range_header, size)
+        except RangeNotSatisfiableError:
+            return Response(
+                status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+                headers={**headers, "Content-Range": f"bytes */{size}"},
+            )
+        if byte_range is not None:
+            start, end = byte_range
+            length = end - start + 1
+            return StreamingResponse(
+                iter_file(path, start, length),
+                status_code=status.HTTP_206_PARTIAL_CONTENT,
+                media_type=media_type,
+                headers={
+                    **headers,
+                    "Content-Range": f"bytes {start}-{end}/{size}",
+                    "Content-Length": str(length),
+                },
+            )
+
+    return StreamingResponse(
+        iter_file(path, 0, size),
+        media_type=media_type,
+        headers={**headers, "Content-Length": str(size)},
+    )
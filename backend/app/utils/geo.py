@@ -0,0 +1,51 @@
+import math
+
+from app.core.config import settings
+
+
+def get_cell(lat: float, lng: float) -> tuple[int, int]:
+    size = settings.AREA_CELL_DEGREES
+    return math.floor(lat / size), math.floor(lng / size)
+
+
+def get_area(lat: float, lng: float) -> str:
+    row, col = get_cell(lat, lng)
+    return f"{row}:{col}"
+
+
+def get_nearby_cells(lat: float, lng: float, radius: int = 1) -> list[tuple[int, int]]:
+    row, col = get_cell(lat, lng)
+    return [
+        (row + d_row, col + d_col)
+        for d_row in range(-radius, radius + 1)
+        for d_col in range(-radius, radius + 1)
+    ]
+
+
+def get_nearby_areas(lat: float, lng: float, radius: int = 1) -> list[str]:
+    """좌표가 속한 칸과 주변 칸(기본 3x3)의 지역 키."""
+    return [f"{row}:{col}" for row, col in get_nearby_cells(lat, lng, radius)]
+
+
+# 위도 1도의 거리(km). 경도 1도는 여기에 cos(위도) 를 곱한다
+KM_PER_DEGREE = 111.32
+
+
+def distance_km(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+    """가까운 두 점 사이의 거리. 격자 몇 칸 안에서는 평면 근사로 충분하다.
+
+    경도 축척은 첫 번째 점의 위도로 정한다. 기준점이 같으면 같은 평면 위의
+    거리라서 distance_to_cell_km 가 정확한 하한이 된다.
+    """
+    d_lat = (lat2 - lat1) * KM_PER_DEGREE
+    d_lng = (lng2 - lng1) * KM_PER_DEGREE * math.cos(math.radians(lat1))
+    return math.hypot(d_lat, d_lng)
+
+
+def distance_to_cell_km(lat: float, lng: float, cell: tuple[int, int]) -> float:
+    """좌표에서 격자 칸 안의 가장 가까운 점까지의 거리. 칸 안이면 0."""
+    size = settings.AREA_CELL_DEGREES
+    row, col = cell
+    nearest_lat = min(max(lat, row * size), (row + 1) * size)
+    nearest_lng = min(max(lng, col * size), (col + 1) * size)
+    return distance_km(lat, lng, nearest_lat, nearest_lng)
@@ -0,0 +1,76 @@
+import asyncio
+import multiprocessing
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from PIL import Image, ImageOps
+
+from app.core.config import settings
+
+
+class InvalidImageError(Exception):
+    pass
+
+
+def resize_image(source: str, targets: list[tuple[str, int]]) -> None:
+    """source 를 (저장 경로, 긴 변 크기) 마다 줄여 JPEG 로 저장한다.
+
+    CPU 를 많이 쓰므로 이벤트 루프가 아니라 프로세스 풀에서 실행한다.
+    """
+    try:
+        with Image.open(source) as image:
+            # JPEG 는 디코딩할 때부터 줄여 읽어 메모리와 시간을 아낀다
+            largest = max(size for _, size in targets)
+            image.draft("RGB", (largest, largest))
+            ImageOps.exif_transpose(image, in_place=True)
+            image = image.convert("RGB")
+    except (OSError, SyntaxError, Image.DecompressionBombError) as e:
+        # 형식을 모르거나(UnidentifiedImageError 도 OSError 다) 잘린 파일은
+        # 디코딩하다 OSError 를, PNG 는 SyntaxError 를 낸다
+        raise InvalidImageError(str(e)) from e
+
+    for path, size in sorted(targets, key=lambda t: t[1], reverse=True):
+        image.thumbnail((size, size), Image.Resampling.LANCZOS)
+        target = Path(path)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=target.parent, suffix=".tmp")
+        os.close(fd)
+        try:
+            image.save(tmp, "JPEG", quality=85, optimize=True, progressive=True)
+            os.replace(tmp, target)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+
+_executor: ProcessPoolExecutor | None = None
+
+
+def get_executor() -> ProcessPoolExecutor:
+    global _executor
+    if _executor is None:
+        # 서버 워커의 스레드/이벤트 루프를 물려받지 않도록 fork 대신 spawn 으로 띄운다
+        _executor = ProcessPoolExecutor(
+            max_workers=settings.IMAGE_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _executor
+
+
+def shutdown_executor() -> None:
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(cancel_futures=True)
+        _executor = None
+
+
+async def resize_image_in_pool(source: Path, targets: list[tuple[Path, int]]) -> None:
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(
+        get_executor(),
+        resize_image,
+        str(source),
+        [(str(path), size) for path, size in targets],
+    )